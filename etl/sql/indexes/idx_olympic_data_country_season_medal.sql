@@ -0,0 +1,3 @@
+-- Medal tables filter and group by country, season and medal
+CREATE INDEX IF NOT EXISTS idx_olympic_data_country_season_medal
+ON olympic_data (country, season, medal);
@@ -0,0 +1,3 @@
+-- Athlete careers are looked up by athlete id
+CREATE INDEX IF NOT EXISTS idx_olympic_data_id
+ON olympic_data (id);
@@ -0,0 +1,3 @@
+-- Athlete statistics are looked up by sport and event
+CREATE INDEX IF NOT EXISTS idx_olympic_data_sport_event
+ON olympic_data (sport, event);
@@ -0,0 +1,3 @@
+-- Fact rows are joined to the athlete dimension on its surrogate key
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dim_athlete_key
+ON dim_athlete (athlete_key);
@@ -0,0 +1,3 @@
+-- Fact rows are joined to the country dimension on its surrogate key
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dim_country_key
+ON dim_country (country_key);
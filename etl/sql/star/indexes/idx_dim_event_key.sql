@@ -0,0 +1,3 @@
+-- Fact rows are joined to the event dimension on its surrogate key
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dim_event_key
+ON dim_event (event_key);
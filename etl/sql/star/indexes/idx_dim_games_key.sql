@@ -0,0 +1,3 @@
+-- Fact rows are joined to the games dimension on its surrogate key
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dim_games_key
+ON dim_games (games_key);
@@ -0,0 +1,3 @@
+-- Fact rows are joined to the sport dimension on its surrogate key
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dim_sport_key
+ON dim_sport (sport_key);
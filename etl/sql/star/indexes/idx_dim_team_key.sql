@@ -0,0 +1,3 @@
+-- Fact rows are joined to the team dimension on its surrogate key
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dim_team_key
+ON dim_team (team_key);
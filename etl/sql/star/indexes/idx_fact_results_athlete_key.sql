@@ -0,0 +1,3 @@
+-- Athlete careers are looked up by athlete key
+CREATE INDEX IF NOT EXISTS idx_fact_results_athlete_key
+ON fact_results (athlete_key);
@@ -0,0 +1,3 @@
+-- Medal tables filter and group by country, Games and medal
+CREATE INDEX IF NOT EXISTS idx_fact_results_country_games_medal
+ON fact_results (country_key, games_key, medal_code);
@@ -0,0 +1,3 @@
+-- Athlete statistics are looked up by sport and event
+CREATE INDEX IF NOT EXISTS idx_fact_results_sport_event
+ON fact_results (sport_key, event_key);
@@ -0,0 +1,31 @@
+-- The transformed data rebuilt from the star schema, one row per fact
+CREATE VIEW olympic_data_wide AS
+SELECT
+    a.id,
+    a.name,
+    a.sex,
+    f.age,
+    f.height_cm,
+    f.weight_kg,
+    t.team,
+    c.noc,
+    g.games,
+    g.year,
+    g.season,
+    g.city,
+    s.sport,
+    e.event,
+    CASE f.medal_code
+        WHEN 1 THEN 'Gold'
+        WHEN 2 THEN 'Silver'
+        WHEN 3 THEN 'Bronze'
+        ELSE 'No Medal'
+    END AS medal,
+    c.country
+FROM fact_results f
+LEFT JOIN dim_athlete a ON a.athlete_key = f.athlete_key
+LEFT JOIN dim_team t ON t.team_key = f.team_key
+LEFT JOIN dim_country c ON c.country_key = f.country_key
+LEFT JOIN dim_games g ON g.games_key = f.games_key
+LEFT JOIN dim_sport s ON s.sport_key = f.sport_key
+LEFT JOIN dim_event e ON e.event_key = f.event_key;
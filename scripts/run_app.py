@@ -1,10 +1,22 @@
+import argparse
 import subprocess
 import sys
 from scripts.run_etl import main_etl
 
 
 def main():
-    main_etl()
+    parser = argparse.ArgumentParser(
+        prog="run_app",
+        description="Run the ETL pipeline, then start the Streamlit app.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild the processed data even if the inputs are unchanged.",
+    )
+    args = parser.parse_args()
+
+    main_etl(["--force"] if args.force else [])
     subprocess.call([
         sys.executable, "-m", "streamlit", "run", "src/streamlit/app.py"
     ])
@@ -1,50 +1,189 @@
-import sys
-import pandas as pd
-from src.etl.extract.extract import extract_data
-from src.etl.transform.transform import transform_data
-from src.utils.logging_utils import setup_logger
+import argparse
+import os
+from typing import List, Optional
+from src.etl.defaults import (
+    ARTIFACT_MODES,
+    CHECKPOINT_PATH,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_WORKERS,
+    PARTITION_KEY,
+)
+from src.utils.logging_utils import DEFAULT_RATE_LIMIT, QUEUE_LOG_FILE
 
 
-def main_etl() -> pd.DataFrame:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
-    Extract, transform, load data from CSV file with performance logging.
+    Parse command line options for the ETL pipeline.
 
-    Returns:
-        Dataframe containing records from a CSV file.
+    Args:
+        argv: Command line arguments. Defaults to sys.argv[1:].
 
-    Raises:
-        Exception: If CSV file cannot be extracted, transformed, or loaded.
+    Returns:
+        Parsed options.
     """
-    # Setup ETL pipeline logger
-    logger = setup_logger("etl_pipeline", "etl_pipeline.log")
-
-    try:
-        logger.info("Starting ETL pipeline")
-
-        # Extract phase
-        logger.info("Beginning data extraction phase")
-        extracted_data = extract_data()
-        olympic_data, noc_data = extracted_data
-        logger.info("Data extraction phase completed")
+    parser = argparse.ArgumentParser(
+        prog="run_etl",
+        description="Extract, transform and load the Olympic dataset.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Extract and clean the Olympic data in chunks, appending "
+        "them to Parquet files instead of holding the data in memory.",
+    )
+    parser.add_argument(
+        "--out-of-core",
+        action="store_true",
+        help="Transform the Olympic data in two passes over chunks, "
+        "appending to the output, so it never has to fit in memory.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Rows per chunk in streaming and out-of-core mode. "
+        "Picked from available memory by default.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Independent stages run concurrently on this many threads. "
+        f"Defaults to {DEFAULT_WORKERS}.",
+    )
+    parser.add_argument(
+        "--clean-workers",
+        type=int,
+        default=None,
+        help="Clean the Olympic data in partitions on this many worker "
+        "processes. The output is identical to a serial run.",
+    )
+    parser.add_argument(
+        "--partition-key",
+        default=PARTITION_KEY,
+        help="Raw column the data is partitioned by with --clean-workers, "
+        f"e.g. Sport or Games. Defaults to {PARTITION_KEY}.",
+    )
+    parser.add_argument(
+        "--star-schema",
+        action="store_true",
+        help="Also write the transformed data as a fact table of integer "
+        "keys and dimension tables under data/processed/star. With "
+        "--load, they are loaded too.",
+    )
+    parser.add_argument(
+        "--intermediate-artifacts",
+        choices=ARTIFACT_MODES,
+        default=os.environ.get("ETL_INTERMEDIATE_ARTIFACTS", "off"),
+        help="Write the cleaned intermediate datasets in the background: "
+        "not at all, a sample of rows, or in full. "
+        "Defaults to $ETL_INTERMEDIATE_ARTIFACTS or off.",
+    )
+    parser.add_argument(
+        "--load",
+        action="store_true",
+        help="Bulk-load the transformed data into the target database "
+        "described by the TARGET_DB_* variables.",
+    )
+    parser.add_argument(
+        "--target-db-url",
+        default=None,
+        help="Load into this database instead, "
+        "e.g. sqlite:///data/olympics.db. Implies --load.",
+    )
+    parser.add_argument(
+        "--load-batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows sent to the target database per batch.",
+    )
+    parser.add_argument(
+        "--log-queue",
+        action="store_true",
+        default=os.environ.get("ETL_LOG_QUEUE") == "1",
+        help="Hand log records to one background writer thread, which "
+        f"writes them to src/logs/{QUEUE_LOG_FILE} and the console. "
+        "Also enabled by ETL_LOG_QUEUE=1.",
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="With --log-queue, write the log file as JSON lines.",
+    )
+    parser.add_argument(
+        "--log-rate-limit",
+        type=int,
+        default=DEFAULT_RATE_LIMIT,
+        help="With --log-queue, log at most this many repeats of a "
+        "message per logger per minute. 0 disables the limit.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run the pipeline even if the inputs are unchanged, "
+        "ignoring any checkpoints.",
+    )
+    parser.add_argument(
+        "--checkpoints",
+        action="store_true",
+        help=f"Save each stage's output under {CHECKPOINT_PATH} and resume "
+        "from the last valid checkpoint.",
+    )
+    parser.add_argument(
+        "--stage",
+        default=None,
+        help="Run only this stage against cached upstream results. "
+        "Implies --checkpoints.",
+    )
+    parser.add_argument(
+        "--from-stage",
+        default=None,
+        help="First stage to run against cached upstream results. "
+        "Implies --checkpoints.",
+    )
+    parser.add_argument(
+        "--to-stage",
+        default=None,
+        help="Last stage to run. Implies --checkpoints.",
+    )
+    args = parser.parse_args(argv)
+    if args.stage and (args.from_stage or args.to_stage):
+        parser.error("--stage cannot be combined with --from-stage/--to-stage")
+    if args.stream and args.clean_workers is not None:
+        parser.error("--clean-workers cannot be combined with --stream")
+    if args.out_of_core and (args.stream or args.clean_workers is not None):
+        parser.error(
+            "--out-of-core cannot be combined with --stream or "
+            "--clean-workers"
+        )
+    if args.clean_workers is not None and args.clean_workers < 1:
+        parser.error("--clean-workers must be at least 1")
+    if args.log_json and not args.log_queue:
+        parser.error("--log-json requires --log-queue")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.stage:
+        args.from_stage = args.to_stage = args.stage
+    if args.target_db_url:
+        args.load = True
+    return args
 
-        # Transformation phase
-        logger.info("Beginning data transformation phase")
 
-        transform_data(olympic_data, noc_data)
-        logger.info("Data transformation phase completed")
-
-        # Load phase
-        # logger.info("Beginning data load phase")
-        # loaded_data = load_data()
-        # logger.info("Data load phase completed")
+def main_etl(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the ETL pipeline from the command line.
 
-        logger.info("ETL pipeline completed successfully")
+    Only the argument parser is loaded up front. pandas and the ETL
+    modules are imported once the options are valid, so --help and usage
+    errors return at once.
 
-        # return loaded_data
+    Args:
+        argv: Command line arguments. Defaults to sys.argv[1:].
+    """
+    args = parse_args(argv)
+    from src.etl.runner import run_etl
 
-    except Exception as e:
-        logger.error(f"ETL pipeline failed: {e}")
-        sys.exit(1)
+    run_etl(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,19 @@
+"""
+Defaults shared by the ETL modules and the run_etl command line.
+
+Kept free of heavy imports so run_etl can build its argument parser, show
+--help and validate options without importing pandas or the ETL modules.
+"""
+
+# Stages run at the same time by run_etl. The aggregates and the load
+# all read the transformed data, so up to four stages are ready at once.
+DEFAULT_WORKERS = 4
+# Relative to the project root
+CHECKPOINT_PATH = "data/checkpoints"
+
+# Raw column whose values decide the partition of a row in parallel mode
+PARTITION_KEY = "Sport"
+
+DEFAULT_BATCH_SIZE = 10_000
+
+ARTIFACT_MODES = ("off", "sampled", "full")
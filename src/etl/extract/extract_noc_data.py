@@ -2,6 +2,7 @@ import os
 import logging
 import pandas as pd
 import timeit
+from src.etl.schema import NOC_DTYPES
 from src.utils.logging_utils import setup_logger, log_extract_success
 
 # Define the file path for the customers CSV file
@@ -36,7 +37,7 @@ def extract_noc_data() -> pd.DataFrame:
     start_time = timeit.default_timer()
 
     try:
-        noc_data = pd.read_csv(FILE_PATH)
+        noc_data = pd.read_csv(FILE_PATH, dtype=NOC_DTYPES)
         extract_noc_data_execution_time = timeit.default_timer() - start_time
         log_extract_success(
             logger,
@@ -47,5 +48,5 @@ def extract_noc_data() -> pd.DataFrame:
         )
         return noc_data
     except Exception as e:
-        logger.error(f"Error loading {FILE_PATH}: {e}")
+        logger.error("Error loading %s: %s", FILE_PATH, e)
         raise Exception(f"Failed to load CSV file: {FILE_PATH}")
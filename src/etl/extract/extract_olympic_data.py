@@ -1,7 +1,10 @@
 import os
 import logging
 import pandas as pd
+import psutil
 import timeit
+from typing import Iterator, Optional
+from src.etl.schema import OLYMPIC_DTYPES
 from src.utils.logging_utils import setup_logger, log_extract_success
 
 # Define the file path for the customers CSV file
@@ -26,6 +29,12 @@ EXPECTED_PERFORMANCE = 0.0001
 
 TYPE = "Olympic data from CSV"
 
+# Share of currently available memory a single chunk may occupy
+MEMORY_FRACTION = 0.05
+MIN_CHUNK_SIZE = 1_000
+MAX_CHUNK_SIZE = 1_000_000
+SAMPLE_ROWS = 1_000
+
 
 def extract_olympic_data() -> pd.DataFrame:
     """
@@ -40,7 +49,7 @@ def extract_olympic_data() -> pd.DataFrame:
     start_time = timeit.default_timer()
 
     try:
-        olympic_data = pd.read_csv(FILE_PATH)
+        olympic_data = pd.read_csv(FILE_PATH, dtype=OLYMPIC_DTYPES)
         extract_data_execution_time = timeit.default_timer() - start_time
         log_extract_success(
             logger,
@@ -51,5 +60,91 @@ def extract_olympic_data() -> pd.DataFrame:
         )
         return olympic_data
     except Exception as e:
-        logger.error(f"Error loading {FILE_PATH}: {e}")
+        logger.error("Error loading %s: %s", FILE_PATH, e)
         raise Exception(f"Failed to load CSV file: {FILE_PATH}")
+
+
+def get_chunk_size(memory_fraction: float = MEMORY_FRACTION) -> int:
+    """
+    Pick a chunk size (in rows) that fits the available memory.
+
+    The in-memory size of a row is estimated from a small sample of
+    the file, and the chunk is sized to use at most memory_fraction of
+    the memory currently available, clamped to sensible bounds.
+
+    Args:
+        memory_fraction: Share of available memory one chunk may use.
+
+    Returns:
+        Number of rows per chunk.
+    """
+    sample = pd.read_csv(
+        FILE_PATH, nrows=SAMPLE_ROWS, dtype=OLYMPIC_DTYPES
+    )
+    bytes_per_row = sample.memory_usage(deep=True).sum() / max(len(sample), 1)
+    budget = psutil.virtual_memory().available * memory_fraction
+    chunk_size = int(budget // max(bytes_per_row, 1))
+    return min(max(chunk_size, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+
+
+def extract_olympic_data_chunks(
+        chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream Olympic data from CSV file in bounded-size chunks.
+
+    Only the time spent parsing is measured, so the logged execution
+    time is unaffected by however long the consumer takes per chunk.
+
+    Args:
+        chunk_size: Rows per chunk. Picked from available memory if None.
+
+    Yields:
+        DataFrames of at most chunk_size records each.
+
+    Raises:
+        Exception: If CSV file cannot be loaded.
+    """
+    execution_time = 0.0
+    rows = 0
+    columns = 0
+
+    try:
+        start_time = timeit.default_timer()
+        if chunk_size is None:
+            chunk_size = get_chunk_size()
+        logger.info("Streaming %s in chunks of %d rows", TYPE, chunk_size)
+        reader = pd.read_csv(
+            FILE_PATH, chunksize=chunk_size, dtype=OLYMPIC_DTYPES
+        )
+        execution_time += timeit.default_timer() - start_time
+    except Exception as e:
+        logger.error("Error loading %s: %s", FILE_PATH, e)
+        raise Exception(f"Failed to load CSV file: {FILE_PATH}")
+
+    with reader:
+        while True:
+            start_time = timeit.default_timer()
+            try:
+                chunk = next(reader)
+            except StopIteration:
+                break
+            except Exception as e:
+                logger.error("Error loading %s: %s", FILE_PATH, e)
+                raise Exception(f"Failed to load CSV file: {FILE_PATH}")
+            finally:
+                execution_time += timeit.default_timer() - start_time
+            rows += len(chunk)
+            columns = chunk.shape[1]
+            yield chunk
+
+    if rows == 0:
+        logger.warning("No records found in %s", FILE_PATH)
+        return
+
+    log_extract_success(
+        logger,
+        TYPE,
+        (rows, columns),
+        execution_time,
+        EXPECTED_PERFORMANCE,
+    )
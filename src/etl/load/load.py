@@ -0,0 +1,357 @@
+import glob
+import io
+import os
+import timeit
+import pandas as pd
+from typing import Iterator, List, Optional, Sequence, Union
+from sqlalchemy import (
+    Connection, Engine, MetaData, Table, create_engine, event
+)
+from sqlalchemy.engine import URL
+from src.etl.defaults import DEFAULT_BATCH_SIZE
+from src.utils.file_utils import (
+    INDEXES_PATH,
+    STAR_SQL_PATH,
+    ParquetSource,
+    iter_frames,
+)
+from src.utils.logging_utils import setup_logger
+
+TABLE_NAME = "olympic_data"
+WIDE_VIEW_NAME = "olympic_data_wide"
+TARGET_DB_VARIABLES = [
+    "TARGET_DB_NAME",
+    "TARGET_DB_USER",
+    "TARGET_DB_PASSWORD",
+    "TARGET_DB_HOST",
+    "TARGET_DB_PORT",
+]
+
+logger = setup_logger("load_data", "load_data.log")
+
+
+def get_target_db_url() -> URL:
+    """
+    Build the target database URL from the TARGET_DB_* variables.
+
+    Returns:
+        URL: PostgreSQL connection URL.
+
+    Raises:
+        ValueError: If any of the variables is not set.
+    """
+    missing = [name for name in TARGET_DB_VARIABLES if not os.getenv(name)]
+    if missing:
+        raise ValueError(
+            f"Target database is not configured, missing: {', '.join(missing)}"
+        )
+    return URL.create(
+        "postgresql+psycopg2",
+        username=os.environ["TARGET_DB_USER"],
+        password=os.environ["TARGET_DB_PASSWORD"],
+        host=os.environ["TARGET_DB_HOST"],
+        port=int(os.environ["TARGET_DB_PORT"]),
+        database=os.environ["TARGET_DB_NAME"],
+    )
+
+
+def load_data(
+    data: Union[pd.DataFrame, ParquetSource],
+    database_url: Optional[Union[str, URL]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    table_name: str = TABLE_NAME,
+) -> pd.DataFrame:
+    """
+    Bulk-load the transformed dataset into the target database.
+
+    The table is recreated and filled in batches inside one transaction,
+    so readers see either the previous load or the complete new one.
+    PostgreSQL is streamed with COPY, other databases (SQLite in tests)
+    get batched inserts. Indexes are built from the SQL files under
+    INDEXES_PATH once all rows are in, which is much cheaper than
+    maintaining them row by row. A dataset on disk is loaded a row group
+    at a time.
+
+    Args:
+        data (Union[pd.DataFrame, ParquetSource]): The transformed
+            dataset.
+        database_url (Optional[Union[str, URL]]): Target database.
+            Defaults to the one described by the TARGET_DB_* variables.
+        batch_size (int): Rows sent to the database per batch.
+        table_name (str): Table to load into.
+
+    Returns:
+        pd.DataFrame: One-row load report with the table, rows loaded,
+            seconds taken and rows per second.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    engine = create_engine(database_url or get_target_db_url())
+    if engine.dialect.name == "sqlite":
+        _use_transactional_ddl(engine)
+    try:
+        logger.info(
+            "Loading %d rows into '%s' in batches of %d",
+            len(data), table_name, batch_size,
+        )
+        start_time = timeit.default_timer()
+        with engine.begin() as connection:
+            write_table(connection, data, table_name, batch_size)
+            load_time = timeit.default_timer() - start_time
+            create_indexes(connection)
+        total_time = timeit.default_timer() - start_time
+    except Exception as e:
+        logger.error("Failed to load data into '%s': %s", table_name, e)
+        raise
+    finally:
+        engine.dispose()
+
+    rows_per_second = len(data) / load_time if load_time > 0 else 0.0
+    logger.info(
+        "Loaded %d rows in %.3f seconds (%.0f rows/sec), "
+        "%.3f seconds including indexes",
+        len(data), load_time, rows_per_second, total_time,
+    )
+    return pd.DataFrame(
+        {
+            "table": [table_name],
+            "rows": [len(data)],
+            "seconds": [total_time],
+            "rows_per_second": [rows_per_second],
+        }
+    )
+
+
+def load_star_schema(
+    *tables: pd.DataFrame,
+    table_names: Sequence[str],
+    database_url: Optional[Union[str, URL]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> pd.DataFrame:
+    """
+    Bulk-load the star schema tables into the target database.
+
+    All tables are recreated in one transaction, like load_data. The key
+    indexes under STAR_SQL_PATH/indexes are built once the rows are in,
+    and the view WIDE_VIEW_NAME joins the tables back into the
+    transformed data for queries that want the wide rows.
+
+    Args:
+        *tables (pd.DataFrame): The tables, in table_names order.
+        table_names (Sequence[str]): Name of each table.
+        database_url (Optional[Union[str, URL]]): Target database.
+            Defaults to the one described by the TARGET_DB_* variables.
+        batch_size (int): Rows sent to the database per batch.
+
+    Returns:
+        pd.DataFrame: Load report with one row per table: the table,
+            rows loaded, seconds taken and rows per second.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if len(tables) != len(table_names):
+        raise ValueError(
+            f"Got {len(tables)} tables for {len(table_names)} table names"
+        )
+    engine = create_engine(database_url or get_target_db_url())
+    if engine.dialect.name == "sqlite":
+        _use_transactional_ddl(engine)
+    report = []
+    try:
+        start_time = timeit.default_timer()
+        with engine.begin() as connection:
+            # The view depends on the tables, which are about to be
+            # replaced
+            connection.exec_driver_sql(
+                f"DROP VIEW IF EXISTS {WIDE_VIEW_NAME}"
+            )
+            for table_name, data in zip(table_names, tables):
+                table_start = timeit.default_timer()
+                write_table(connection, data, table_name, batch_size)
+                seconds = timeit.default_timer() - table_start
+                report.append(
+                    {
+                        "table": table_name,
+                        "rows": len(data),
+                        "seconds": seconds,
+                        "rows_per_second": (
+                            len(data) / seconds if seconds > 0 else 0.0
+                        ),
+                    }
+                )
+                logger.info(
+                    "Loaded %d rows into '%s' in %.3f seconds",
+                    len(data), table_name, seconds,
+                )
+            create_indexes(
+                connection, os.path.join(STAR_SQL_PATH, "indexes")
+            )
+            with open(
+                os.path.join(STAR_SQL_PATH, f"{WIDE_VIEW_NAME}.sql")
+            ) as file:
+                connection.exec_driver_sql(file.read())
+        total_time = timeit.default_timer() - start_time
+    except Exception as e:
+        logger.error("Failed to load the star schema: %s", e)
+        raise
+    finally:
+        engine.dispose()
+
+    logger.info(
+        "Loaded %d star schema tables in %.3f seconds including indexes",
+        len(tables), total_time,
+    )
+    return pd.DataFrame(report)
+
+
+def write_table(
+    connection: Connection,
+    data: Union[pd.DataFrame, ParquetSource],
+    table_name: str,
+    batch_size: int,
+) -> None:
+    """
+    Recreate a table and fill it in batches.
+
+    PostgreSQL is streamed with COPY, other databases get batched
+    inserts.
+
+    Args:
+        connection (Connection): Open connection inside a transaction.
+        data (Union[pd.DataFrame, ParquetSource]): Rows of the table,
+            read a row group at a time from disk.
+        table_name (str): Table to recreate.
+        batch_size (int): Rows per batch.
+    """
+    for index, frame in enumerate(iter_frames(data)):
+        if index == 0:
+            frame.head(0).to_sql(
+                table_name, connection, if_exists="replace", index=False
+            )
+        if connection.dialect.name == "postgresql":
+            copy_batches(connection, frame, table_name, batch_size)
+        else:
+            insert_batches(connection, frame, table_name, batch_size)
+
+
+def insert_batches(
+    connection: Connection,
+    data: pd.DataFrame,
+    table_name: str,
+    batch_size: int,
+) -> None:
+    """
+    Insert rows in batches, one executemany call per batch.
+
+    With positional drivers such as sqlite3 the prepared INSERT is handed
+    the batch as tuples directly, which avoids building a dict per row.
+    Other drivers go through SQLAlchemy, which sends each batch as
+    multi-row INSERT statements.
+
+    Args:
+        connection (Connection): Open connection inside a transaction.
+        data (pd.DataFrame): Rows to insert.
+        table_name (str): Existing table to insert into.
+        batch_size (int): Rows per batch.
+    """
+    table = Table(table_name, MetaData(), autoload_with=connection)
+    statement = table.insert()
+    if connection.dialect.positional:
+        sql = str(statement.compile(dialect=connection.dialect))
+        for batch in _batches(data, batch_size):
+            connection.exec_driver_sql(sql, _batch_rows(batch))
+    else:
+        columns = [str(col) for col in data.columns]
+        for batch in _batches(data, batch_size):
+            connection.execute(
+                statement,
+                [dict(zip(columns, row)) for row in _batch_rows(batch)],
+            )
+
+
+def copy_batches(
+    connection: Connection,
+    data: pd.DataFrame,
+    table_name: str,
+    batch_size: int,
+) -> None:
+    """
+    Stream rows into PostgreSQL with COPY, one CSV buffer per batch.
+
+    Args:
+        connection (Connection): Open PostgreSQL connection inside a
+            transaction.
+        data (pd.DataFrame): Rows to copy.
+        table_name (str): Existing table to copy into.
+        batch_size (int): Rows per batch.
+    """
+    columns = ", ".join(f'"{col}"' for col in data.columns)
+    statement = (
+        f'COPY "{table_name}" ({columns}) FROM STDIN WITH (FORMAT csv)'
+    )
+    cursor = connection.connection.cursor()
+    try:
+        for batch in _batches(data, batch_size):
+            buffer = io.StringIO()
+            batch.to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+def create_indexes(
+    connection: Connection, indexes_path: Optional[str] = None
+) -> List[str]:
+    """
+    Run the index definitions in a directory, in file name order.
+
+    Each file holds a single CREATE INDEX statement.
+
+    Args:
+        connection (Connection): Open connection to the target database.
+        indexes_path (Optional[str]): Directory of the SQL files.
+            Defaults to INDEXES_PATH.
+
+    Returns:
+        List[str]: Names of the SQL files that were run.
+    """
+    paths = sorted(
+        glob.glob(os.path.join(indexes_path or INDEXES_PATH, "*.sql"))
+    )
+    for path in paths:
+        start_time = timeit.default_timer()
+        with open(path) as file:
+            connection.exec_driver_sql(file.read())
+        logger.info(
+            "Created index from %s in %.3f seconds",
+            os.path.basename(path), timeit.default_timer() - start_time,
+        )
+    return [os.path.basename(path) for path in paths]
+
+
+def _use_transactional_ddl(engine: Engine) -> None:
+    # sqlite3 runs DDL such as DROP TABLE outside of the transaction, so a
+    # failed reload would lose the old table. Letting SQLAlchemy emit
+    # BEGIN itself makes the whole load one transaction.
+    @event.listens_for(engine, "connect")
+    def disable_driver_transactions(dbapi_connection, record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+def _batches(data: pd.DataFrame, batch_size: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(data), batch_size):
+        yield data.iloc[start:start + batch_size]
+
+
+def _batch_rows(batch: pd.DataFrame) -> List[tuple]:
+    # Drivers accept Python scalars only, with None for missing values
+    columns = [
+        batch[col].astype(object).where(batch[col].notna(), None).tolist()
+        for col in batch.columns
+    ]
+    return list(zip(*columns))
@@ -0,0 +1,738 @@
+import os
+import timeit
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+)
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+)
+from sqlalchemy.engine import URL
+from src.etl.defaults import (
+    CHECKPOINT_PATH,
+    DEFAULT_BATCH_SIZE,
+    PARTITION_KEY,
+)
+from src.etl.extract import extract_noc_data, extract_olympic_data
+from src.etl.load.load import load_data, load_star_schema
+from src.etl.transform import (
+    aggregate_medals,
+    athlete_careers,
+    athlete_stats,
+    clean_noc_data,
+    enrich_data,
+    event_catalog,
+    medal_cube,
+)
+from src.etl.transform.aggregate_medals import create_medal_counts
+from src.etl.transform.athlete_careers import create_athlete_careers
+from src.etl.transform.athlete_stats import create_athlete_stats
+from src.etl.transform.event_catalog import create_event_catalog
+from src.etl.transform.medal_cube import create_medal_cube
+from src.etl.transform.clean_olympic_data import (
+    clean_olympic_data_chunks,
+    clean_olympic_data_parallel,
+    drop_duplicates,
+    fill_missing_values,
+    save_cleaned_data,
+    standardise_column_names,
+    standardise_object_columns,
+)
+from src.etl.transform.enrich_data import create_country_columns
+from src.etl.transform.out_of_core import transform_out_of_core
+from src.etl.transform.star_schema import (
+    OUTPUT_DIR as STAR_SCHEMA_DIR,
+    STAR_TABLES,
+    create_star_schema,
+)
+from src.utils.checkpoint_utils import (
+    checkpoint_key,
+    has_checkpoint,
+    load_checkpoint,
+    prune_checkpoints,
+    save_checkpoint,
+    stage_code_version,
+    touch_checkpoint,
+)
+from src.utils.file_utils import ROOT_DIR
+from src.utils.fingerprint_utils import hash_file
+from src.utils.logging_utils import setup_logger
+from src.utils.metrics_utils import count_rows, instrument, stage_metrics
+
+CHECKPOINT_DIR = os.path.join(ROOT_DIR, CHECKPOINT_PATH)
+
+logger = setup_logger("etl_pipeline", "etl_pipeline.log")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of the ETL pipeline.
+
+    Attributes:
+        name: Unique stage name, used on the command line.
+        func: Called with the inputs in order. Returns the single output,
+            or a tuple with one value per output.
+        inputs: Names of the upstream outputs the stage reads.
+        outputs: Names of the outputs the stage produces.
+        sources: Raw files the stage reads, hashed into its key.
+        artifacts: Files the stage writes, relative to the project root.
+            Intermediate artifacts are optional and not listed here.
+        checkpoint: Whether the outputs can be persisted as a checkpoint.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    sources: Tuple[str, ...] = ()
+    artifacts: Tuple[str, ...] = ()
+    checkpoint: bool = True
+
+
+def _artifact(module: Any) -> str:
+    return os.path.join(module.OUTPUT_DIR, module.FILE_NAME)
+
+
+def build_stages(
+    stream: bool = False,
+    out_of_core: bool = False,
+    chunk_size: Optional[int] = None,
+    clean_workers: Optional[int] = None,
+    partition_key: str = PARTITION_KEY,
+    star_schema: bool = False,
+    load: bool = False,
+    database_url: Optional[Union[str, URL]] = None,
+    load_batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[Stage]:
+    """
+    Describe the ETL pipeline as a DAG of stages.
+
+    Stages are wired together by their inputs and outputs only, so a new
+    stage is added by declaring what it reads and writes. The scheduler
+    runs independent stages, such as the two extracts or NOC cleaning and
+    Olympic cleaning, concurrently.
+
+    Args:
+        stream: If True, the Olympic data is extracted in chunks and
+            cleaned by a single stage instead of one stage per step. The
+            cleaned and transformed data are appended to Parquet files a
+            chunk at a time and left on disk for the next stages.
+        out_of_core: If True, the Olympic data is read twice in chunks
+            and transformed by a single stage that appends each chunk to
+            the transformed data file, so it is never held in memory
+            during the transform. Cannot be combined with stream or
+            clean_workers.
+        chunk_size: Rows per chunk in streaming and out-of-core mode.
+        clean_workers: If set, the Olympic data is cleaned by a single
+            stage on this many worker processes instead of one stage per
+            step. Cannot be combined with stream.
+        partition_key: Raw column the data is partitioned by when
+            cleaning on worker processes.
+        star_schema: If True, also split the transformed data into a
+            fact table and dimension tables. With load, they are loaded
+            too.
+        load: If True, end with a stage that bulk-loads the transformed
+            data into the target database.
+        database_url: Target database. Defaults to the one described by
+            the TARGET_DB_* variables.
+        load_batch_size: Rows sent to the database per batch.
+
+    Returns:
+        Stages in a valid execution order.
+    """
+    if stream and clean_workers is not None:
+        raise ValueError("clean_workers cannot be combined with stream")
+    if out_of_core and (stream or clean_workers is not None):
+        raise ValueError(
+            "out_of_core cannot be combined with stream or clean_workers"
+        )
+
+    stages = [
+        Stage("extract_noc_data", extract_noc_data.extract_noc_data,
+              outputs=("raw_noc_data",),
+              sources=(extract_noc_data.FILE_PATH,)),
+    ]
+    if stream:
+        stages += [
+            Stage("extract_olympic_data",
+                  partial(extract_olympic_data.extract_olympic_data_chunks,
+                          chunk_size),
+                  outputs=("raw_olympic_data",),
+                  sources=(extract_olympic_data.FILE_PATH,),
+                  checkpoint=False),
+            Stage("clean_olympic_data", clean_olympic_data_chunks,
+                  inputs=("raw_olympic_data",),
+                  outputs=("cleaned_olympic_data",)),
+        ]
+    elif not out_of_core:
+        # Out of core, one stage reads, cleans and enriches the data
+        stages.append(
+            Stage("extract_olympic_data",
+                  extract_olympic_data.extract_olympic_data,
+                  outputs=("raw_olympic_data",),
+                  sources=(extract_olympic_data.FILE_PATH,))
+        )
+        if clean_workers is not None:
+            stages.append(
+                Stage("clean_olympic_data",
+                      partial(clean_olympic_data_parallel,
+                              workers=clean_workers,
+                              partition_key=partition_key),
+                      inputs=("raw_olympic_data",),
+                      outputs=("cleaned_olympic_data",))
+            )
+        else:
+            stages += [
+                Stage("drop_duplicates", drop_duplicates,
+                      inputs=("raw_olympic_data",),
+                      outputs=("deduplicated_data",)),
+                Stage("standardise_column_names", standardise_column_names,
+                      inputs=("deduplicated_data",),
+                      outputs=("renamed_data",)),
+                Stage("standardise_object_columns",
+                      standardise_object_columns,
+                      inputs=("renamed_data",),
+                      outputs=("standardised_data",)),
+                Stage("fill_missing_values", fill_missing_values,
+                      inputs=("standardised_data",),
+                      outputs=("imputed_data",)),
+                Stage("save_cleaned_data", save_cleaned_data,
+                      inputs=("imputed_data",),
+                      outputs=("cleaned_olympic_data",),
+                      checkpoint=False),
+            ]
+
+    stages.append(
+        Stage("clean_noc_data", clean_noc_data.clean_noc_data,
+              inputs=("raw_noc_data",),
+              outputs=("cleaned_noc_data",))
+    )
+    if out_of_core:
+        stages.append(
+            Stage("transform_olympic_data",
+                  partial(transform_out_of_core, chunk_size=chunk_size),
+                  inputs=("cleaned_noc_data",),
+                  outputs=("transformed_data",),
+                  sources=(extract_olympic_data.FILE_PATH,),
+                  artifacts=(_artifact(enrich_data),))
+        )
+    else:
+        stages.append(
+            Stage("create_country_columns", create_country_columns,
+                  inputs=("cleaned_olympic_data", "cleaned_noc_data"),
+                  outputs=("transformed_data",),
+                  artifacts=(_artifact(enrich_data),))
+        )
+    stages += [
+        Stage("create_medal_counts", create_medal_counts,
+              inputs=("transformed_data",),
+              outputs=("medal_counts",),
+              artifacts=(_artifact(aggregate_medals),)),
+        Stage("create_medal_cube", create_medal_cube,
+              inputs=("transformed_data",),
+              outputs=("medal_cube",),
+              artifacts=(_artifact(medal_cube),)),
+        Stage("create_athlete_stats", create_athlete_stats,
+              inputs=("transformed_data",),
+              outputs=("athlete_stats",),
+              artifacts=(_artifact(athlete_stats),)),
+        Stage("create_athlete_careers", create_athlete_careers,
+              inputs=("transformed_data",),
+              outputs=("athlete_careers",),
+              artifacts=(_artifact(athlete_careers),)),
+        Stage("create_event_catalog", create_event_catalog,
+              inputs=("transformed_data",),
+              outputs=("event_catalog",),
+              artifacts=(_artifact(event_catalog),)),
+    ]
+    if star_schema:
+        stages.append(
+            Stage("create_star_schema", create_star_schema,
+                  inputs=("transformed_data", "cleaned_noc_data"),
+                  outputs=tuple(STAR_TABLES),
+                  artifacts=tuple(
+                      os.path.join(STAR_SCHEMA_DIR, f"{name}.parquet")
+                      for name in STAR_TABLES
+                  ))
+        )
+    if load:
+        # The load report is checkpointed, so with checkpoints on an
+        # unchanged dataset is not loaded into the same database twice
+        stages.append(
+            Stage("load_data",
+                  partial(load_data,
+                          database_url=database_url,
+                          batch_size=load_batch_size),
+                  inputs=("transformed_data",),
+                  outputs=("load_report",))
+        )
+    if load and star_schema:
+        stages.append(
+            Stage("load_star_schema",
+                  partial(_load_star_schema_after_load,
+                          database_url=database_url,
+                          batch_size=load_batch_size),
+                  inputs=("load_report",) + tuple(STAR_TABLES),
+                  outputs=("star_load_report",))
+        )
+    return stages
+
+
+def _load_star_schema_after_load(load_report: Any, *tables: Any,
+                                 **kwargs: Any) -> Any:
+    # Reads the wide load's report only to run after it, since SQLite
+    # takes one writer at a time
+    return load_star_schema(*tables, table_names=STAR_TABLES, **kwargs)
+
+
+def stage_dependencies(stages: List[Stage]) -> Dict[str, List[str]]:
+    """
+    Resolve which stages each stage depends on through its inputs.
+
+    Args:
+        stages: Stages of the pipeline, in any order.
+
+    Returns:
+        Names of the upstream stages by stage name, in stage order.
+
+    Raises:
+        ValueError: If two stages share a name or an output, or an input
+            is not produced by any stage.
+    """
+    producers: Dict[str, str] = {}
+    names = set()
+    for stage in stages:
+        if stage.name in names:
+            raise ValueError(f"Duplicate stage '{stage.name}'")
+        names.add(stage.name)
+        for output in stage.outputs:
+            if output in producers:
+                raise ValueError(
+                    f"Output '{output}' is produced by both "
+                    f"'{producers[output]}' and '{stage.name}'"
+                )
+            producers[output] = stage.name
+
+    dependencies = {}
+    for stage in stages:
+        upstream = []
+        for name in stage.inputs:
+            if name not in producers:
+                raise ValueError(
+                    f"Input '{name}' of stage '{stage.name}' is not "
+                    "produced by any stage"
+                )
+            if producers[name] not in upstream:
+                upstream.append(producers[name])
+        dependencies[stage.name] = upstream
+    return dependencies
+
+
+def topological_order(stages: List[Stage]) -> List[Stage]:
+    """
+    Order stages so that every stage comes after the stages it reads.
+
+    Stages whose order is not constrained keep their relative order.
+
+    Args:
+        stages: Stages of the pipeline, in any order.
+
+    Returns:
+        The stages in execution order.
+
+    Raises:
+        ValueError: If the stages depend on each other in a cycle.
+    """
+    dependencies = stage_dependencies(stages)
+    ordered: List[Stage] = []
+    done = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [
+            stage for stage in remaining
+            if all(name in done for name in dependencies[stage.name])
+        ]
+        if not ready:
+            raise ValueError(
+                "Stages depend on each other in a cycle: "
+                f"{', '.join(stage.name for stage in remaining)}"
+            )
+        ordered += ready
+        done.update(stage.name for stage in ready)
+        remaining = [stage for stage in remaining if stage.name not in done]
+    return ordered
+
+
+def stage_keys(stages: List[Stage]) -> Dict[str, str]:
+    """
+    Compute the checkpoint key of every stage.
+
+    A key covers the stage code and the keys of its upstream stages (or
+    the hashes of the raw files it reads), so a change anywhere upstream
+    gives every downstream stage a new key.
+
+    Args:
+        stages: Stages of the pipeline, in any order.
+
+    Returns:
+        Checkpoint key by stage name.
+    """
+    producer_keys: Dict[str, str] = {}
+    keys: Dict[str, str] = {}
+    for stage in topological_order(stages):
+        input_keys = [producer_keys[name] for name in stage.inputs]
+        input_keys += [hash_file(path) for path in stage.sources]
+        key = checkpoint_key(
+            stage.name, stage_code_version(stage.func), input_keys
+        )
+        keys[stage.name] = key
+        for output in stage.outputs:
+            producer_keys[output] = key
+    return keys
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """
+    When a stage ran, in seconds since the start of the pipeline run.
+
+    Attributes:
+        name: Stage name.
+        start: Time the stage started.
+        end: Time the stage finished.
+        loaded: True if the outputs were loaded from a checkpoint rather
+            than computed.
+    """
+
+    name: str
+    start: float
+    end: float
+    loaded: bool = False
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def critical_path(
+    stages: List[Stage], timings: Dict[str, StageTiming]
+) -> List[StageTiming]:
+    """
+    Find the chain of stages that determined how long a run took.
+
+    Starting from the stage that finished last, each step goes back to
+    the upstream stage that finished last, i.e. the one it waited for.
+    Speeding up any other stage would not have shortened the run.
+
+    Args:
+        stages: Stages of the pipeline.
+        timings: Timings of the stages that ran, as recorded by
+            run_pipeline.
+
+    Returns:
+        Timings along the critical path, first stage first.
+    """
+    if not timings:
+        return []
+    dependencies = stage_dependencies(stages)
+    path = [max(timings.values(), key=lambda timing: timing.end)]
+    while True:
+        upstream = [
+            timings[name]
+            for name in dependencies.get(path[-1].name, [])
+            if name in timings
+        ]
+        if not upstream:
+            break
+        path.append(max(upstream, key=lambda timing: timing.end))
+    return path[::-1]
+
+
+def _selected_stages(
+    stages: List[Stage], start: Optional[str], stop: Optional[str]
+) -> Tuple[List[Stage], set]:
+    # The stages stop needs, and those between start and stop that must
+    # run regardless of checkpoints
+    by_name = {stage.name: stage for stage in stages}
+    for name in (start, stop):
+        if name is not None and name not in by_name:
+            raise ValueError(
+                f"Unknown stage '{name}'. "
+                f"Choose from: {', '.join(by_name)}"
+            )
+    dependencies = stage_dependencies(stages)
+
+    def upstream_of(name: str) -> set:
+        found = {name}
+        pending = [name]
+        while pending:
+            for upstream in dependencies[pending.pop()]:
+                if upstream not in found:
+                    found.add(upstream)
+                    pending.append(upstream)
+        return found
+
+    selected = upstream_of(stop) if stop else set(by_name)
+    forced = set()
+    if start is not None:
+        if start not in selected:
+            raise ValueError(f"Stage '{start}' is not upstream of '{stop}'")
+        forced = {
+            name for name in selected if start in upstream_of(name)
+        }
+    ordered = [
+        stage for stage in topological_order(stages)
+        if stage.name in selected
+    ]
+    return ordered, forced
+
+
+def _stamp_path(artifact: str) -> str:
+    # Records the key of the stage run that wrote an artifact
+    return os.path.join(ROOT_DIR, f"{artifact}.key")
+
+
+def _artifacts_current(stage: Stage, key: str) -> bool:
+    # The artifacts exist and were written by the run with this key, not
+    # by an earlier run on other inputs that reused their paths
+    for artifact in stage.artifacts:
+        if not os.path.exists(os.path.join(ROOT_DIR, artifact)):
+            return False
+        try:
+            with open(_stamp_path(artifact)) as stamp:
+                if stamp.read() != key:
+                    return False
+        except FileNotFoundError:
+            return False
+    return True
+
+
+def _clear_stamps(stage: Stage) -> None:
+    # Before a stage runs, so artifacts it only partly rewrites are not
+    # taken as current
+    for artifact in stage.artifacts:
+        try:
+            os.remove(_stamp_path(artifact))
+        except FileNotFoundError:
+            pass
+
+
+def _stamp_artifacts(stage: Stage, key: str) -> None:
+    for artifact in stage.artifacts:
+        with open(_stamp_path(artifact), "w") as stamp:
+            stamp.write(key)
+
+
+def run_pipeline(
+    stages: List[Stage],
+    start: Optional[str] = None,
+    stop: Optional[str] = None,
+    checkpoint_dir: Optional[str] = None,
+    force: bool = False,
+    workers: int = 1,
+    timings: Optional[Dict[str, StageTiming]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the pipeline stages, resuming from checkpoints where possible.
+
+    Which stages run is decided up front from the DAG. Without a
+    checkpoint directory every stage stop depends on runs. With one,
+    each stage's outputs are saved under its content-addressed key, and
+    a stage whose checkpoint is valid is skipped: its outputs are only
+    loaded if a stage that does run needs them. A skipped stage's
+    artifacts must also carry its key, so files rewritten by a run on
+    other inputs are written again. Only the CHECKPOINTS_KEPT most
+    recently used checkpoints of each output are kept.
+
+    Stages downstream of start and upstream of stop always run, against
+    cached upstream results. Upstream stages without a checkpoint are
+    run first.
+
+    Stages are then run on a pool of worker threads as soon as their
+    inputs are available, so independent stages overlap. If a stage
+    fails no new stages are started, the running ones finish and the
+    error is raised. The stage timings and the critical path are logged,
+    and every stage run and checkpoint load is recorded in the stage
+    metrics.
+
+    Args:
+        stages: Stages of the pipeline.
+        start: First stage to run. Defaults to the first stage.
+        stop: Last stage to run. Defaults to the last stage listed.
+        checkpoint_dir: Directory for checkpoints. Disabled if None.
+        force: Run every stage up to stop, ignoring checkpoints.
+        workers: Stages run at the same time.
+        timings: If given, filled with the StageTiming of every stage
+            that ran or had its checkpoint loaded.
+
+    Returns:
+        Outputs of the stop stage by name, if it ran or had to be loaded.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    target = stages[-1].name if stop is None else stop
+    stages, forced = _selected_stages(stages, start, stop)
+    keys = stage_keys(stages) if checkpoint_dir else {}
+    dependencies = stage_dependencies(stages)
+    consumers: Dict[str, List[Stage]] = {stage.name: [] for stage in stages}
+    for stage in stages:
+        for name in dependencies[stage.name]:
+            consumers[name].append(stage)
+
+    def is_cached(stage: Stage) -> bool:
+        return bool(checkpoint_dir) and stage.checkpoint and has_checkpoint(
+            checkpoint_dir, keys[stage.name], stage.outputs
+        )
+
+    # Plan from the last stage back, since whether a stage has to run
+    # depends on whether a stage reading its outputs runs
+    to_run = set()
+    to_load = set()
+    for stage in reversed(stages):
+        needed = any(
+            consumer.name in to_run for consumer in consumers[stage.name]
+        )
+        if (
+            stage.name in forced
+            or not checkpoint_dir
+            or force
+            or not _artifacts_current(stage, keys[stage.name])
+            or (stage.checkpoint and not is_cached(stage))
+            or (needed and not is_cached(stage))
+        ):
+            to_run.add(stage.name)
+        else:
+            if stage.checkpoint:
+                touch_checkpoint(
+                    checkpoint_dir, keys[stage.name], stage.outputs
+                )
+            if needed:
+                to_load.add(stage.name)
+            else:
+                logger.info("Stage '%s' is up to date", stage.name)
+
+    remaining_reads = {
+        output: 0 for stage in stages for output in stage.outputs
+    }
+    for stage in stages:
+        if stage.name in to_run:
+            for name in stage.inputs:
+                remaining_reads[name] += 1
+    target_outputs = next(
+        stage.outputs for stage in stages if stage.name == target
+    )
+
+    results: Dict[str, Any] = {}
+    recorded: Dict[str, StageTiming] = {} if timings is None else timings
+    run_start = timeit.default_timer()
+
+    def execute(stage: Stage, args: List[Any]) -> Dict[str, Any]:
+        started = timeit.default_timer() - run_start
+        if stage.name in to_load:
+            logger.info("Loading checkpoint for stage '%s'", stage.name)
+            with stage_metrics(f"load checkpoint {stage.name}") as metrics:
+                outputs = load_checkpoint(
+                    checkpoint_dir, keys[stage.name], stage.outputs
+                )
+                metrics.rows_out = count_rows(list(outputs.values()))
+        else:
+            logger.info("Running stage '%s'", stage.name)
+            _clear_stamps(stage)
+            values = instrument(stage.name)(stage.func)(*args)
+            if len(stage.outputs) == 1:
+                values = (values,)
+            outputs = dict(zip(stage.outputs, values))
+            if checkpoint_dir:
+                _stamp_artifacts(stage, keys[stage.name])
+                if stage.checkpoint:
+                    save_checkpoint(
+                        checkpoint_dir, keys[stage.name], outputs
+                    )
+                    prune_checkpoints(checkpoint_dir, stage.outputs)
+        recorded[stage.name] = StageTiming(
+            stage.name,
+            started,
+            timeit.default_timer() - run_start,
+            loaded=stage.name in to_load,
+        )
+        return outputs
+
+    def release(names: Iterable[str]) -> None:
+        # Drop intermediate outputs once no remaining stage reads them
+        for name in names:
+            remaining_reads[name] -= 1
+            if remaining_reads[name] == 0 and name not in target_outputs:
+                results.pop(name, None)
+
+    # Loading a checkpoint waits for nothing, running a stage waits for
+    # the stages producing its inputs
+    order = {
+        stage.name: index for index, stage in enumerate(stages)
+        if stage.name in to_run | to_load
+    }
+    waiting = {
+        name: set(dependencies[name]) if name in to_run else set()
+        for name in order
+    }
+    ready = [stage for stage in stages if waiting.get(stage.name) == set()]
+    error: Optional[BaseException] = None
+    with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="stage") as executor:
+        running: Dict[Future, Stage] = {}
+        while running or (ready and error is None):
+            while ready and error is None and len(running) < workers:
+                stage = ready.pop(0)
+                args = [] if stage.name in to_load else [
+                    results[name] for name in stage.inputs
+                ]
+                running[executor.submit(execute, stage, args)] = stage
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(
+                    done, key=lambda f: order[running[f].name]):
+                stage = running.pop(future)
+                if future.exception() is not None:
+                    logger.error(
+                        "Stage '%s' failed: %s", stage.name, future.exception()
+                    )
+                    error = error or future.exception()
+                    continue
+                results.update(future.result())
+                if stage.name in to_run:
+                    release(stage.inputs)
+                for consumer in consumers[stage.name]:
+                    if consumer.name in waiting:
+                        waiting[consumer.name].discard(stage.name)
+                        if not waiting[consumer.name]:
+                            ready.append(consumer)
+            ready.sort(key=lambda stage: order[stage.name])
+    if error is not None:
+        raise error
+
+    _log_timings(stages, recorded)
+    return {
+        output: results[output]
+        for output in target_outputs
+        if output in results
+    }
+
+
+def _log_timings(
+    stages: List[Stage], timings: Dict[str, StageTiming]
+) -> None:
+    if not timings:
+        return
+    for timing in sorted(timings.values(), key=lambda t: t.start):
+        logger.info(
+            "Stage '%s' %s from %.3fs to %.3fs (%.3f seconds)",
+            timing.name, "loaded" if timing.loaded else "ran",
+            timing.start, timing.end, timing.duration,
+        )
+    path = critical_path(stages, timings)
+    total = max(timing.end for timing in timings.values())
+    logger.info(
+        "Critical path (%.3f of %.3f seconds): %s",
+        sum(t.duration for t in path), total,
+        " -> ".join(timing.name for timing in path),
+    )
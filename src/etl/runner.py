@@ -0,0 +1,200 @@
+import argparse
+import logging
+import os
+import sys
+import timeit
+from sqlalchemy.engine import make_url
+from typing import Dict, Optional
+from src.etl.extract import extract_noc_data, extract_olympic_data
+from src.etl.load.load import get_target_db_url
+from src.etl.pipeline import CHECKPOINT_DIR, build_stages, run_pipeline
+from src.utils.artifact_utils import (
+    configure_intermediate_artifacts,
+    wait_for_intermediate_artifacts,
+)
+from src.utils.file_utils import ROOT_DIR
+from src.utils.fingerprint_utils import (
+    compute_fingerprint,
+    hash_source_tree,
+    is_up_to_date,
+    save_manifest,
+)
+from src.utils.logging_utils import (
+    setup_logger,
+    start_queue_logging,
+    stop_queue_logging,
+)
+from src.utils.metrics_utils import (
+    metrics_table,
+    reset_metrics,
+    save_metrics_summary,
+)
+
+OUTPUT_DIR = os.path.join(ROOT_DIR, "data", "processed")
+# Code the pipeline's outputs depend on: the ETL and the utilities its
+# stages use to read, write, checkpoint and log
+ETL_CODE_DIRS = [
+    os.path.join(ROOT_DIR, "src", "etl"),
+    os.path.join(ROOT_DIR, "src", "utils"),
+]
+METRICS_DIR = os.path.join(ROOT_DIR, "data", "metrics")
+
+
+def pipeline_fingerprint(
+    intermediate_artifacts: str = "off",
+    load_target: Optional[str] = None,
+) -> Dict[str, object]:
+    """
+    Fingerprint the raw inputs, ETL code and config behind the outputs.
+
+    Args:
+        intermediate_artifacts: Intermediate artifact mode of the run.
+        load_target: Database the data is loaded into, if any, without
+            its password.
+
+    Returns:
+        Fingerprint as built by compute_fingerprint.
+    """
+    return compute_fingerprint(
+        {
+            "olympic_data": extract_olympic_data.FILE_PATH,
+            "noc_data": extract_noc_data.FILE_PATH,
+        },
+        "".join(hash_source_tree(path) for path in ETL_CODE_DIRS),
+        {
+            "env": os.environ.get("ENV"),
+            "intermediate_artifacts": intermediate_artifacts,
+            "load_target": load_target,
+        },
+    )
+
+
+def report_metrics(
+    logger: logging.Logger,
+    wall_seconds: float,
+    succeeded: bool,
+    args: argparse.Namespace,
+) -> None:
+    """
+    Log the stage metrics table and save the run's JSON summary.
+
+    Args:
+        logger: Logger for the table.
+        wall_seconds: Duration of the whole run.
+        succeeded: Whether the run completed.
+        args: Options of the run.
+    """
+    options = vars(args).copy()
+    if options["target_db_url"]:
+        options["target_db_url"] = make_url(
+            options["target_db_url"]
+        ).render_as_string()
+    path = save_metrics_summary(
+        METRICS_DIR,
+        {
+            "succeeded": succeeded,
+            "wall_seconds": wall_seconds,
+            "options": options,
+        },
+    )
+    logger.info(
+        "Stage metrics (%.3f seconds in total):\n%s",
+        wall_seconds, metrics_table(),
+    )
+    logger.info("Stage metrics saved to %s", path)
+
+
+def run_etl(args: argparse.Namespace) -> None:
+    """
+    Extract, transform and load the data with performance logging.
+
+    Exits with status 1 if the pipeline fails.
+
+    Args:
+        args: Options parsed by scripts.run_etl.parse_args.
+    """
+    if args.log_queue:
+        start_queue_logging(
+            json_lines=args.log_json, rate_limit=args.log_rate_limit
+        )
+    # Setup ETL pipeline logger
+    logger = setup_logger("etl_pipeline", "etl_pipeline.log")
+
+    try:
+        logger.info("Starting ETL pipeline")
+
+        # Resolved up front so a missing database config fails before
+        # the transform rather than after it
+        database_url = None
+        if args.load:
+            database_url = make_url(
+                args.target_db_url or get_target_db_url()
+            )
+
+        stages = build_stages(
+            stream=args.stream,
+            out_of_core=args.out_of_core,
+            chunk_size=args.chunk_size,
+            clean_workers=args.clean_workers,
+            partition_key=args.partition_key,
+            star_schema=args.star_schema,
+            load=args.load,
+            database_url=database_url,
+            load_batch_size=args.load_batch_size,
+        )
+        outputs = [
+            os.path.relpath(
+                os.path.join(ROOT_DIR, artifact), OUTPUT_DIR
+            )
+            for stage in stages
+            for artifact in stage.artifacts
+        ]
+        partial_run = bool(args.from_stage or args.to_stage)
+
+        fingerprint = pipeline_fingerprint(
+            args.intermediate_artifacts,
+            database_url.render_as_string() if database_url else None,
+        )
+        if not (args.force or partial_run) and is_up_to_date(
+                OUTPUT_DIR, fingerprint, outputs):
+            logger.info(
+                "Inputs unchanged since last run (fingerprint %s), "
+                "reusing existing outputs",
+                fingerprint["fingerprint"][:12],
+            )
+            return
+
+        use_checkpoints = args.checkpoints or partial_run
+        configure_intermediate_artifacts(args.intermediate_artifacts)
+        reset_metrics()
+        start_time = timeit.default_timer()
+        succeeded = False
+        try:
+            run_pipeline(
+                stages,
+                start=args.from_stage,
+                stop=args.to_stage,
+                checkpoint_dir=CHECKPOINT_DIR if use_checkpoints else None,
+                force=args.force,
+                workers=args.workers,
+            )
+
+            # Intermediate artifacts are written in the background and
+            # only waited on here, once the final output is in place
+            wait_for_intermediate_artifacts()
+            succeeded = True
+        finally:
+            report_metrics(
+                logger, timeit.default_timer() - start_time, succeeded, args
+            )
+
+        if not partial_run:
+            save_manifest(OUTPUT_DIR, fingerprint, outputs)
+        logger.info("ETL pipeline completed successfully")
+
+    except Exception as e:
+        logger.error("ETL pipeline failed: %s", e)
+        sys.exit(1)
+    finally:
+        # Writes out any queued records
+        stop_queue_logging()
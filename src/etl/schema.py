@@ -0,0 +1,99 @@
+import pandas as pd
+from typing import Dict, Iterable, List, Sequence
+from pandas.api.types import union_categoricals
+
+# Arrow-backed strings for high-cardinality text such as athlete names
+ARROW_STRING = pd.StringDtype("pyarrow")
+
+# Raw athlete_events columns, as read by extract_olympic_data.
+# Low-cardinality text is categorical; numbers use the narrowest type that
+# fits the domain (ages, heights and weights need NaN, so they are floats).
+OLYMPIC_DTYPES: Dict[str, object] = {
+    "ID": "int32",
+    "Name": ARROW_STRING,
+    "Sex": "category",
+    "Age": "float32",
+    "Height": "float32",
+    "Weight": "float32",
+    "Team": "category",
+    "NOC": "category",
+    "Games": "category",
+    "Year": "int16",
+    "Season": "category",
+    "City": "category",
+    "Sport": "category",
+    "Event": "category",
+    "Medal": "category",
+}
+
+# Raw noc_regions columns, as read by extract_noc_data
+NOC_DTYPES: Dict[str, object] = {
+    "NOC": "category",
+    "region": ARROW_STRING,
+    "notes": ARROW_STRING,
+}
+
+
+def is_categorical(series: pd.Series) -> bool:
+    """Return True if the series has a categorical dtype."""
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def concat_frames(
+    frames: List[pd.DataFrame], ignore_index: bool = True
+) -> pd.DataFrame:
+    """
+    Concatenate DataFrames without losing categorical dtypes.
+
+    pd.concat falls back to object for categorical columns whose
+    categories differ between frames, as they do between CSV chunks.
+    Categories are unified first so the result stays categorical.
+
+    Args:
+        frames: DataFrames with the same columns.
+        ignore_index: Give the result a fresh RangeIndex rather than
+            keeping the frames' row labels.
+
+    Returns:
+        Concatenated DataFrame.
+    """
+    frames = list(frames)
+    for col in frames[0].columns:
+        if not all(is_categorical(frame[col]) for frame in frames):
+            continue
+        categories = union_categoricals(
+            [frame[col] for frame in frames], ignore_order=True
+        ).categories
+        frames = [
+            frame.assign(**{col: frame[col].cat.set_categories(categories)})
+            for frame in frames
+        ]
+    return pd.concat(frames, ignore_index=ignore_index)
+
+
+def sum_by_keys(
+    frames: Iterable[pd.DataFrame], keys: Sequence[str]
+) -> pd.DataFrame:
+    """
+    Add up counts or sums computed on separate parts of the data.
+
+    Args:
+        frames: DataFrames with the key columns and numeric value columns,
+            e.g. one per chunk. Keys may be categoricals with different
+            categories per frame, so they are combined as plain values.
+        keys: Columns identifying a row. Missing values form their own
+            key.
+
+    Returns:
+        One row per key with the value columns summed, keys first, in
+        order of first appearance.
+    """
+    combined = pd.concat(
+        [frame.astype({key: object for key in keys}) for frame in frames],
+        ignore_index=True,
+    )
+    if not keys:
+        return combined.sum().to_frame().T
+    return combined.groupby(
+        list(keys), dropna=False, sort=False
+    ).sum().reset_index()
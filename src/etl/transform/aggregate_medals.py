@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Union
+from src.etl.schema import ARROW_STRING, sum_by_keys
+from src.etl.transform.clean_olympic_data import NO_MEDAL
+from src.utils.file_utils import (
+    ParquetSource,
+    iter_frames,
+    save_dataframe_to_parquet,
+)
+
+OUTPUT_DIR = "data/processed"
+FILE_NAME = "medal_counts.parquet"
+
+# Countries are ranked from the medal counts. Athletes are ranked from
+# athlete_careers, which keys them by id.
+KEYS = ["season", "country", "medal"]
+
+
+def create_medal_counts(
+        data: Union[pd.DataFrame, ParquetSource]) -> pd.DataFrame:
+    """
+    Count medals by season, medal and country.
+
+    The result holds one row per (season, country, medal) with at least
+    one medal, which is orders of magnitude smaller than the transformed
+    data, so the medal page can rank countries without touching the full
+    dataset. Rows without a medal are not counted. A dataset on disk is
+    counted a row group at a time.
+
+    Args:
+        data (Union[pd.DataFrame, ParquetSource]): The transformed
+            dataset.
+
+    Returns:
+        pd.DataFrame: Columns season, country, medal and medal_count.
+    """
+    medal_counts = None
+    for chunk in iter_frames(data, KEYS):
+        part = _count_medals(chunk)
+        # Folded in as it goes, so memory stays at the number of counts
+        medal_counts = sum_by_keys(
+            [part] if medal_counts is None else [medal_counts, part], KEYS
+        )
+
+    medal_counts = medal_counts.sort_values(KEYS, ignore_index=True).astype(
+        {
+            "season": "category",
+            "country": ARROW_STRING,
+            "medal": "category",
+            "medal_count": "int32",
+        }
+    )
+    save_dataframe_to_parquet(medal_counts, OUTPUT_DIR, FILE_NAME)
+    return medal_counts
+
+
+def _count_medals(data: pd.DataFrame) -> pd.DataFrame:
+    medals = data[data["medal"] != NO_MEDAL]
+    return (
+        medals
+        .groupby(KEYS, observed=True)
+        .size()
+        .reset_index(name="medal_count")
+    )
+
+
+def medal_table(
+    medal_counts: pd.DataFrame,
+    season: Optional[str] = None,
+    medal: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Rank countries by medals won.
+
+    Args:
+        medal_counts (pd.DataFrame): Output of create_medal_counts.
+        season (Optional[str]): Only count this season. All if None.
+        medal (Optional[str]): Only count this medal. All if None.
+
+    Returns:
+        pd.DataFrame: Columns country and medal_count, most medals
+            first.
+    """
+    mask = np.ones(len(medal_counts), dtype=bool)
+    if season is not None:
+        mask &= medal_counts["season"] == season
+    if medal is not None:
+        mask &= medal_counts["medal"] == medal
+    return (
+        medal_counts[mask]
+        .groupby("country")["medal_count"]
+        .sum()
+        .reset_index()
+        .sort_values(by="medal_count", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
@@ -0,0 +1,248 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from src.etl.schema import ARROW_STRING, concat_frames
+from src.utils.file_utils import (
+    ParquetSource,
+    iter_frames,
+    save_dataframe_to_parquet,
+)
+
+OUTPUT_DIR = "data/processed"
+FILE_NAME = "athlete_careers.parquet"
+
+SEASONS = ["Summer", "Winter"]
+MEDALS = ["Gold", "Silver", "Bronze"]
+# (season, medal) -> count column, e.g. summer_gold
+MEDAL_COLUMNS: Dict[Tuple[str, str], str] = {
+    (season, medal): f"{season.lower()}_{medal.lower()}"
+    for season in SEASONS
+    for medal in MEDALS
+}
+# An athlete's entries are reduced to one row per combination of these
+ENTRY_KEYS = ["id", "games", "year", "noc", "country"]
+ENTRY_COLUMNS = ENTRY_KEYS + ["name", "sex", "season", "medal"]
+
+
+def create_athlete_careers(
+        data: Union[pd.DataFrame, ParquetSource]) -> pd.DataFrame:
+    """
+    Summarise the career of every athlete, one row per athlete id.
+
+    Athletes are told apart by id, so two athletes of the same name stay
+    separate. The entries are first reduced, a row group at a time, to
+    one row per athlete, Games and NOC with the entry and medal counts,
+    so memory follows the number of such rows rather than of entries.
+    The reduced rows are sorted once by id and Games, and every
+    statistic is then reduced over the runs of equal ids, without a
+    groupby on strings. The primary NOC is the one an athlete has the
+    most entries for, the earliest on a tie.
+
+    Args:
+        data (Union[pd.DataFrame, ParquetSource]): The transformed
+            dataset.
+
+    Returns:
+        pd.DataFrame: Columns id, name, sex, noc, country, first_games,
+            last_games, first_year, last_year, games, entries, gold,
+            silver, bronze, medals and a count per season and medal
+            (summer_gold, ..., winter_bronze), ordered by id.
+    """
+    # Entries of one athlete at one Games are stored together, so little
+    # is left to merge between row groups. Parts are kept in entry order,
+    # so the first name and the earliest NOC stay first.
+    parts = [
+        _reduce_entries(_entry_counts(chunk))
+        for chunk in iter_frames(data, ENTRY_COLUMNS)
+    ]
+    rows = parts[0] if len(parts) == 1 else _reduce_entries(
+        concat_frames(parts)
+    )
+    careers = _summarise_careers(rows)
+    save_dataframe_to_parquet(careers, OUTPUT_DIR, FILE_NAME)
+    return careers
+
+
+def _entry_counts(data: pd.DataFrame) -> pd.DataFrame:
+    # One row per entry with its counts, in the shape _reduce_entries
+    # sums up
+    counts = pd.DataFrame(
+        {"entries": np.ones(len(data), dtype=np.int32)}, index=data.index
+    )
+    # Compared as categories rather than as strings
+    season = {s: (data["season"] == s).to_numpy() for s in SEASONS}
+    medal = {m: (data["medal"] == m).to_numpy() for m in MEDALS}
+    for (s, m), column in MEDAL_COLUMNS.items():
+        counts[column] = (season[s] & medal[m]).astype(np.int32)
+    # Names are nearly unique, so they are kept as strings rather than
+    # as categories that would have to be merged between chunks
+    entries = data[ENTRY_KEYS + ["name", "sex"]].astype(
+        {"name": ARROW_STRING}
+    )
+    return pd.concat([entries, counts], axis=1)
+
+
+def _reduce_entries(rows: pd.DataFrame) -> pd.DataFrame:
+    # Rows of one athlete, Games and NOC merged, keeping the first name
+    # and sex and adding up the counts, in order of first appearance
+    group = _group_codes([rows[key] for key in ENTRY_KEYS])
+    _, first_rows = np.unique(group, return_index=True)
+    reduced = rows.iloc[first_rows][ENTRY_KEYS + ["name", "sex"]]
+    reduced = reduced.reset_index(drop=True)
+    for column in ["entries"] + list(MEDAL_COLUMNS.values()):
+        reduced[column] = np.bincount(
+            group, weights=rows[column].to_numpy(),
+            minlength=len(first_rows),
+        ).astype(np.int32)
+    return reduced
+
+
+def _group_codes(columns: List[pd.Series]) -> np.ndarray:
+    # Code of each row's combination of values, numbered in order of
+    # first appearance. Folded in a column at a time, so the combined
+    # codes never exceed the number of rows times one column's values.
+    codes = np.zeros(len(columns[0]), dtype=np.int64)
+    for column in columns:
+        column_codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        codes, _ = pd.factorize(codes * len(uniques) + column_codes)
+    return codes
+
+
+def _summarise_careers(rows: pd.DataFrame) -> pd.DataFrame:
+    # Career statistics from the output of _reduce_entries
+    games_codes, games_labels = pd.factorize(
+        rows["games"], sort=True, use_na_sentinel=False
+    )
+    order = np.lexsort(
+        (games_codes, rows["year"].to_numpy(), rows["id"].to_numpy())
+    )
+    ids = rows["id"].to_numpy()[order]
+    games = games_codes[order]
+    entries = rows["entries"].to_numpy()[order]
+    new_athlete = np.r_[True, ids[1:] != ids[:-1]]
+    starts = np.flatnonzero(new_athlete)
+    ends = np.r_[starts[1:], len(ids)] - 1
+    # Index of the athlete of each sorted row
+    athlete = np.cumsum(new_athlete) - 1
+
+    def first(col: str) -> pd.Series:
+        return rows[col].take(order[starts]).reset_index(drop=True)
+
+    careers = pd.DataFrame(
+        {
+            "id": ids[starts].astype("int32"),
+            "name": first("name").astype(ARROW_STRING),
+            "sex": first("sex").astype("category"),
+        }
+    )
+    primary = _primary_rows(rows["noc"], order, athlete, entries)
+    for col in ("noc", "country"):
+        careers[col] = (
+            rows[col].take(primary).reset_index(drop=True).astype("category")
+        )
+
+    careers["first_games"] = pd.Categorical(
+        games_labels.take(games[starts]), categories=games_labels
+    )
+    careers["last_games"] = pd.Categorical(
+        games_labels.take(games[ends]), categories=games_labels
+    )
+    careers["first_year"] = first("year").to_numpy()
+    careers["last_year"] = rows["year"].take(order[ends]).to_numpy()
+    _, first_position, _ = _pairs(athlete, games, len(games_labels))
+    careers["games"] = np.bincount(
+        athlete[first_position], minlength=len(starts)
+    ).astype("int16")
+    careers["entries"] = _run_sums(entries, starts).astype("int32")
+
+    counts = {
+        column: _run_sums(rows[column].to_numpy()[order], starts)
+        for column in MEDAL_COLUMNS.values()
+    }
+    for m in MEDALS:
+        careers[m.lower()] = sum(
+            counts[MEDAL_COLUMNS[(s, m)]] for s in SEASONS
+        ).astype("int16")
+    careers["medals"] = careers[[m.lower() for m in MEDALS]].sum(
+        axis=1
+    ).astype("int16")
+    for column, count in counts.items():
+        careers[column] = count.astype("int16")
+    return careers
+
+
+def athlete_leaderboard(
+    careers: pd.DataFrame,
+    season: Optional[str] = None,
+    medal: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Rank athletes by medals won, from their career summaries.
+
+    Args:
+        careers (pd.DataFrame): Output of create_athlete_careers.
+        season (Optional[str]): Only count this season. All if None.
+        medal (Optional[str]): Only count this medal. All if None.
+
+    Returns:
+        pd.DataFrame: Columns id, name, noc, country and medal_count of
+            the athletes with at least one such medal, most medals
+            first, then by id.
+    """
+    columns = _medal_columns(season, medal)
+    ranked = careers[["id", "name", "noc", "country"]].assign(
+        medal_count=careers[columns].sum(axis=1).astype("int32")
+    )
+    ranked = ranked[ranked["medal_count"] > 0]
+    return ranked.sort_values(
+        by="medal_count", ascending=False, kind="stable"
+    ).reset_index(drop=True)
+
+
+def _medal_columns(season: Optional[str], medal: Optional[str]) -> List[str]:
+    return [
+        column for (s, m), column in MEDAL_COLUMNS.items()
+        if season in (None, s) and medal in (None, m)
+    ]
+
+
+def _run_sums(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    # Sum of values over each run of one athlete's rows
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    return np.add.reduceat(values.astype(np.int64), starts)
+
+
+def _pairs(
+        athlete: np.ndarray,
+        codes: np.ndarray,
+        size: int,
+        weights: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Distinct (athlete, code) pairs, with the position of each pair's
+    # first row and the sum of its rows' weights (its row count without)
+    pairs = athlete.astype(np.int64) * max(size, 1) + codes
+    unique, first_position, inverse = np.unique(
+        pairs, return_index=True, return_inverse=True
+    )
+    counts = np.bincount(inverse.ravel(), weights=weights)
+    return unique, first_position, counts
+
+
+def _primary_rows(
+        noc: pd.Series,
+        order: np.ndarray,
+        athlete: np.ndarray,
+        entries: np.ndarray) -> np.ndarray:
+    # Row of each athlete's first entry for the NOC they have the most
+    # entries for
+    codes, uniques = pd.factorize(noc, use_na_sentinel=False)
+    # Positions are in sorted order, so the first is the earliest entry
+    _, first_position, counts = _pairs(
+        athlete, codes[order], len(uniques), entries
+    )
+    pair_athlete = athlete[first_position]
+    best = np.lexsort((first_position, -counts, pair_athlete))
+    ranked = pair_athlete[best]
+    chosen = best[np.r_[True, ranked[1:] != ranked[:-1]]]
+    return order[first_position[chosen]]
@@ -0,0 +1,107 @@
+import pandas as pd
+from typing import Dict, Optional, Tuple, Union
+from src.utils.file_utils import (
+    ParquetSource,
+    read_frame,
+    save_dataframe_to_parquet,
+)
+
+OUTPUT_DIR = "data/processed"
+FILE_NAME = "athlete_stats.parquet"
+
+KEY_COLUMNS = ["sex", "sport", "event", "scope"]
+STAT_COLUMNS = ["age", "height_cm", "weight_kg"]
+QUANTILES = {"q25": 0.25, "median": 0.5, "q75": 0.75}
+# Sex of the rows summarising both sexes together
+ANY_SEX = "any"
+
+
+def create_athlete_stats(
+        data: Union[pd.DataFrame, ParquetSource]) -> pd.DataFrame:
+    """
+    Summarise athlete age, height and weight per sex, sport and event.
+
+    Every combination gets two rows: scope "all" covers every entry and
+    scope "gold" only Gold medalists. Each sport and event also gets
+    rows with sex ANY_SEX, covering both sexes, for when no sex is
+    chosen. All are computed by one groupby over the entries stacked
+    with the Gold medal entries and with copies of both under ANY_SEX.
+    Quantiles need every value of a group, so the columns used are read
+    whole from a dataset on disk.
+
+    Args:
+        data (Union[pd.DataFrame, ParquetSource]): The transformed
+            dataset.
+
+    Returns:
+        pd.DataFrame: The key columns, then count, mean, std, q25, median
+            and q75 of each of age, height_cm and weight_kg, named
+            e.g. age_mean.
+    """
+    columns = KEY_COLUMNS[:-1] + STAT_COLUMNS
+    data = read_frame(data, columns + ["medal"])
+    gold = data.loc[data["medal"] == "Gold", columns]
+    scopes = [data[columns].assign(scope="all"), gold.assign(scope="gold")]
+    tagged = pd.concat(
+        scopes + [scope.assign(sex=ANY_SEX) for scope in scopes],
+        ignore_index=True,
+    )
+    tagged["sex"] = tagged["sex"].astype(str).astype("category")
+    tagged["scope"] = tagged["scope"].astype("category")
+
+    grouped = tagged.groupby(KEY_COLUMNS, observed=True)[STAT_COLUMNS]
+    moments = grouped.agg(["count", "mean", "std"])
+    quantiles = grouped.quantile(list(QUANTILES.values())).unstack()
+    quantiles = quantiles.rename(
+        columns={q: name for name, q in QUANTILES.items()}, level=1
+    )
+
+    stats = pd.concat([moments, quantiles], axis=1)[STAT_COLUMNS]
+    stats.columns = [f"{col}_{stat}" for col, stat in stats.columns]
+    stats = stats.reset_index()
+
+    save_dataframe_to_parquet(stats, OUTPUT_DIR, FILE_NAME)
+    return stats
+
+
+def build_stats_index(
+    stats: pd.DataFrame,
+) -> Dict[Tuple[str, str, str, str], Dict[str, float]]:
+    """
+    Index athlete statistics by (sex, sport, event, scope).
+
+    Args:
+        stats (pd.DataFrame): Output of create_athlete_stats.
+
+    Returns:
+        Dict[Tuple[str, str, str, str], Dict[str, float]]: Statistics of
+            each combination, e.g. index[("M", "Judo", event, "gold")]
+            ["age_mean"].
+    """
+    return stats.set_index(KEY_COLUMNS).to_dict("index")
+
+
+def lookup_stats(
+    stats_index: Dict[Tuple[str, str, str, str], Dict[str, float]],
+    sex: Optional[str],
+    sport: Optional[str],
+    event: Optional[str],
+    scope: str,
+) -> Dict[str, float]:
+    """
+    Look up the statistics of one combination.
+
+    Args:
+        stats_index: Output of build_stats_index.
+        sex (Optional[str]): "M" or "F". Both sexes if None.
+        sport (Optional[str]): Sport.
+        event (Optional[str]): Event.
+        scope (str): "all" or "gold".
+
+    Returns:
+        Dict[str, float]: Statistics by name, empty if the combination
+            has none.
+    """
+    return stats_index.get(
+        (sex if sex is not None else ANY_SEX, sport, event, scope), {}
+    )
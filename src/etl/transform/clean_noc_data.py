@@ -1,9 +1,9 @@
 import pandas as pd
-from src.utils.file_utils import save_dataframe_to_csv
+from src.utils.artifact_utils import save_intermediate_artifact
 
 
 OUTPUT_DIR = "data/processed"
-FILE_NAME = "cleaned_noc_data.csv"
+FILE_NAME = "cleaned_noc_data.parquet"
 
 
 def clean_noc_data(noc_data: pd.DataFrame) -> pd.DataFrame:
@@ -16,8 +16,8 @@ def clean_noc_data(noc_data: pd.DataFrame) -> pd.DataFrame:
         noc_data["NOC"].map(region_map)
     )
 
-    # Save the dataframe as a CSV for logging purposes
-    # Ensure the directory exists
-    save_dataframe_to_csv(noc_data, OUTPUT_DIR, FILE_NAME)
+    # Save the dataframe for logging purposes, in the background and only
+    # if intermediate artifacts are on
+    save_intermediate_artifact(noc_data, OUTPUT_DIR, FILE_NAME)
 
     return noc_data
@@ -1,8 +1,38 @@
+import numpy as np
+import os
 import pandas as pd
-from src.utils.file_utils import save_dataframe_to_csv
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import (
+    Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+)
+from src.etl.defaults import PARTITION_KEY
+from src.etl.schema import concat_frames, is_categorical, sum_by_keys
+from src.etl.transform.deduplicate import (
+    DuplicateReport,
+    RowDeduplicator,
+    drop_duplicate_rows,
+)
+from src.utils.artifact_utils import save_intermediate_artifact
+from src.utils.file_utils import ROOT_DIR, ParquetSource, write_parquet_frames
+from src.utils.logging_utils import setup_logger
 
 OUTPUT_DIR = "data/processed"
-FILE_NAME = "cleaned_data.csv"
+FILE_NAME = "cleaned_data.parquet"
+# Stream mode keeps the cleaned data here for the next stage rather than
+# in memory. Unlike OUTPUT_DIR, it is a working file, not an artifact.
+WORK_DIR = "data/interim"
+
+IMPUTED_COLUMNS = ["age", "height_cm", "weight_kg"]
+NO_MEDAL = "No Medal"
+
+# Groups whose means fill missing values, most specific first. Sports
+# where a value was never recorded fall back to the global mean.
+IMPUTATION_LEVELS = [("event", "sex"), ("sport", "sex"), ("sport",), ()]
+
+PARTITIONS_PER_WORKER = 4
+
+logger = setup_logger(__name__, "transform_data.log")
 
 
 def clean_olympic_data(data: pd.DataFrame) -> pd.DataFrame:
@@ -10,12 +40,317 @@ def clean_olympic_data(data: pd.DataFrame) -> pd.DataFrame:
     data = standardise_column_names(data)
     data = standardise_object_columns(data)
     data = fill_missing_values(data)
+    data = save_cleaned_data(data)
+
+    return data
+
+
+def clean_olympic_data_chunks(
+        chunks: Iterable[pd.DataFrame]) -> ParquetSource:
+    """
+    Clean the raw Olympic data a chunk at a time, without holding it.
+
+    A ChunkStatistics deduplicates and standardises each chunk as it
+    arrives and adds up what imputation needs, and the chunk is appended
+    to a spill file. Once every chunk is in, impute_chunks imputes the
+    spill file a row group at a time into the cleaned data file under
+    WORK_DIR, which is left there for the next stage to stream. Out of
+    core mode runs the same steps, rereading the raw data rather than
+    spilling it. The result matches clean_olympic_data.
+
+    Args:
+        chunks: Raw Olympic data in chunks.
+
+    Returns:
+        The written cleaned data file.
+    """
+    statistics = ChunkStatistics()
+    path = os.path.join(ROOT_DIR, WORK_DIR, FILE_NAME)
+    spill_path = f"{path}.chunks"
+    try:
+        write_parquet_frames(
+            (statistics.add(chunk) for chunk in chunks), spill_path
+        )
+        logger.info(statistics.duplicates.summary())
+        rows = write_parquet_frames(
+            impute_chunks(
+                ParquetSource(spill_path).iter_frames(), statistics
+            ),
+            path,
+        )
+    finally:
+        if os.path.exists(spill_path):
+            os.remove(spill_path)
+    logger.info("Wrote %d cleaned rows to %s", rows, path)
+    return save_cleaned_data(ParquetSource(path))
+
+
+class ChunkStatistics:
+    """
+    What imputing chunked data needs, gathered a chunk at a time.
+
+    add deduplicates and standardises each raw chunk, remembering which
+    rows it kept, and adds the chunk's key_statistics to running totals.
+    The totals roll up to the statistics of every imputation level, so
+    impute_chunks fills each chunk as if the data were imputed whole.
+    Only the row hashes, the kept-row masks and the group sums are held.
+
+    Attributes:
+        keep: Per chunk, a bit mask (np.packbits) of the rows that are
+            not duplicates of an earlier row.
+        chunk_rows: Raw rows per chunk.
+        groups: key_statistics of the imputed columns per combination of
+            the level keys, missing keys included. None until a chunk is
+            added.
+        levels: Imputation levels whose keys the data has.
+    """
+
+    def __init__(self, columns: Sequence[str] = IMPUTED_COLUMNS) -> None:
+        self.columns = list(columns)
+        self.keep: List[np.ndarray] = []
+        self.chunk_rows: List[int] = []
+        self.groups: Optional[pd.DataFrame] = None
+        self.levels: List[Tuple[str, ...]] = []
+        self._deduplicator = RowDeduplicator()
+
+    @property
+    def duplicates(self) -> DuplicateReport:
+        return self._deduplicator.report
+
+    @property
+    def rows(self) -> int:
+        return sum(self.chunk_rows)
+
+    @property
+    def rows_kept(self) -> int:
+        return sum(
+            int(np.unpackbits(keep, count=rows).sum())
+            for keep, rows in zip(self.keep, self.chunk_rows)
+        )
+
+    def add(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Deduplicate and standardise a raw chunk and add up its values."""
+        is_new = self._deduplicator.first_occurrences(chunk)
+        self.keep.append(np.packbits(is_new))
+        self.chunk_rows.append(len(chunk))
+        chunk = _standardise(chunk[is_new])
+        if self.groups is None:
+            # As in memory, levels whose keys are absent are skipped
+            self.levels = [
+                keys for keys in IMPUTATION_LEVELS
+                if set(keys) <= set(chunk.columns)
+            ]
+        keys = level_keys(self.levels)
+        present = [col for col in self.columns if col in chunk.columns]
+        part = key_statistics(chunk, keys, present)
+        # Folded in as it goes, so memory stays at the number of groups
+        self.groups = combine_key_statistics(
+            [part] if self.groups is None else [self.groups, part], keys
+        )
+        return chunk
+
+    def replay(
+            self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Deduplicate and standardise the added raw chunks again.
+
+        Rows are dropped by the kept-row masks, without hashing them.
+
+        Args:
+            chunks: The raw chunks passed to add, read again.
 
-    save_dataframe_to_csv(data, OUTPUT_DIR, FILE_NAME)
+        Yields:
+            The chunks as add returned them.
+
+        Raises:
+            ValueError: If the chunks differ from those added.
+        """
+        masks = zip(self.keep, self.chunk_rows)
+        for index, chunk in enumerate(chunks):
+            keep, chunk_rows = next(masks, (None, None))
+            if chunk_rows != len(chunk):
+                raise ValueError(
+                    f"Chunk {index} differs from the first pass; "
+                    "the raw data changed while it was transformed"
+                )
+            is_new = np.unpackbits(keep, count=chunk_rows).astype(bool)
+            yield _standardise(chunk[is_new])
+        if next(masks, None) is not None:
+            raise ValueError(
+                "Fewer chunks than in the first pass; "
+                "the raw data changed while it was transformed"
+            )
+
+    def imputation_statistics(self) -> Dict[Tuple[str, ...], pd.DataFrame]:
+        """Statistics of every imputation level, from the totals."""
+        return roll_up_statistics(self.groups, self.levels)
+
+
+def impute_chunks(
+        chunks: Iterable[pd.DataFrame],
+        statistics: ChunkStatistics) -> Iterator[pd.DataFrame]:
+    """
+    Impute standardised chunks with the statistics of all of them.
+
+    Missing medals are filled too. The values imputed per level are
+    logged once the last chunk is done.
+
+    Args:
+        chunks: Chunks as returned by ChunkStatistics.add or replay.
+        statistics: The ChunkStatistics of those chunks.
+
+    Yields:
+        The cleaned chunks.
+    """
+    levels = statistics.imputation_statistics()
+    report: Dict[str, Dict[str, int]] = {}
+    for chunk in chunks:
+        chunk, filled = impute_missing_values(chunk, statistics=levels)
+        for level, counts in filled.items():
+            totals = report.setdefault(level, {})
+            for col, count in counts.items():
+                totals[col] = totals.get(col, 0) + count
+        yield fill_missing_medals(chunk)
+    for level, filled in report.items():
+        logger.info("Imputed by %s: %s", level, filled)
+
+
+def _standardise(chunk: pd.DataFrame) -> pd.DataFrame:
+    return standardise_object_columns(standardise_column_names(chunk))
+
+
+def clean_olympic_data_parallel(
+        data: pd.DataFrame,
+        workers: Optional[int] = None,
+        partition_key: str = PARTITION_KEY) -> pd.DataFrame:
+    """
+    Clean the raw Olympic data in partitions on a process pool.
+
+    Rows are partitioned by the value of a raw column, so identical rows
+    always land in the same partition and per-partition deduplication
+    removes exactly the duplicates serial deduplication would. Each
+    worker deduplicates and standardises its partition and returns its
+    key_statistics. The parent restores the original row order, adds
+    the partition statistics up, rolls them up to every imputation level
+    and imputes with them, so the result matches clean_olympic_data.
+
+    Args:
+        data: Raw Olympic data.
+        workers: Worker processes. Defaults to the number of CPUs. With
+            one worker the partitions are cleaned in this process.
+        partition_key: Raw column to partition by, e.g. "Sport" or
+            "Games".
+
+    Returns:
+        The cleaned data.
+    """
+    workers = workers or os.cpu_count() or 1
+    partitions = partition_frame(
+        data, partition_key, workers * PARTITIONS_PER_WORKER
+    )
+    logger.info(
+        "Cleaning %d rows in %d partitions by %s on %d worker(s)",
+        len(data), len(partitions), partition_key, workers,
+    )
+    keys = level_keys(IMPUTATION_LEVELS)
+    clean = partial(_clean_partition, keys=keys)
+    if workers == 1:
+        results = [clean(partition) for partition in partitions]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(clean, partitions))
+
+    duplicates = DuplicateReport()
+    for _, _, report in results:
+        duplicates.update(report)
+    logger.info(duplicates.summary())
+
+    # Partitions keep the original row labels, so sorting on them
+    # restores the order serial deduplication leaves the rows in
+    data = concat_frames(
+        [cleaned for cleaned, _, _ in results], ignore_index=False
+    ).sort_index()
+    data.reset_index(drop=True, inplace=True)
+    statistics = {}
+    if all(stats is not None for _, stats, _ in results):
+        statistics = roll_up_statistics(
+            combine_key_statistics(
+                [stats for _, stats, _ in results], keys
+            ),
+            IMPUTATION_LEVELS,
+        )
+    data = fill_missing_values(data, statistics=statistics)
+    data = save_cleaned_data(data)
 
     return data
 
 
+def partition_frame(
+        data: pd.DataFrame,
+        key: str,
+        max_partitions: int) -> List[pd.DataFrame]:
+    """
+    Split a frame into balanced partitions without splitting any group.
+
+    Groups of rows sharing a key value (missing values form one group)
+    are assigned largest first to the partition with the fewest rows.
+
+    Args:
+        data: Data to split.
+        key: Column whose values define the groups.
+        max_partitions: Upper bound on the number of partitions.
+
+    Returns:
+        Non-empty partitions, each keeping the original row labels.
+    """
+    if key not in data.columns:
+        raise ValueError(
+            f"Unknown partition key '{key}'. "
+            f"Choose from: {', '.join(map(str, data.columns))}"
+        )
+    codes, _ = pd.factorize(data[key], use_na_sentinel=False)
+    sizes = np.bincount(codes) if len(codes) else np.empty(0, dtype=int)
+    n_partitions = max(1, min(max_partitions, len(sizes)))
+    loads = np.zeros(n_partitions, dtype=np.int64)
+    group_partition = np.empty(len(sizes), dtype=np.intp)
+    for group in np.argsort(-sizes, kind="stable"):
+        target = int(loads.argmin())
+        group_partition[group] = target
+        loads[target] += sizes[group]
+    row_partition = group_partition[codes]
+    return [
+        data[row_partition == index]
+        for index in range(n_partitions)
+        if loads[index] > 0
+    ] or [data]
+
+
+def _clean_partition(
+        partition: pd.DataFrame,
+        keys: List[str]
+) -> Tuple[pd.DataFrame, Optional[pd.DataFrame], DuplicateReport]:
+    # Runs in a worker process. The original row labels are kept (unlike
+    # drop_duplicates) so the parent can restore the row order.
+    partition, duplicates = drop_duplicate_rows(partition)
+    partition = standardise_column_names(partition)
+    partition = standardise_object_columns(partition)
+    statistics = None
+    if set(keys) <= set(partition.columns):
+        statistics = key_statistics(
+            partition, keys,
+            [col for col in IMPUTED_COLUMNS if col in partition.columns]
+        )
+    return partition, statistics, duplicates
+
+
+def save_cleaned_data(
+        data: Union[pd.DataFrame, ParquetSource]
+) -> Union[pd.DataFrame, ParquetSource]:
+    # Written in the background, and only if intermediate artifacts are on
+    save_intermediate_artifact(data, OUTPUT_DIR, FILE_NAME)
+    return data
+
+
 def standardise_column_names(data: pd.DataFrame) -> pd.DataFrame:
     # Ensure consistent column names, including units
     cols = data.columns
@@ -26,36 +361,255 @@ def standardise_column_names(data: pd.DataFrame) -> pd.DataFrame:
 
 
 def standardise_object_columns(data: pd.DataFrame) -> pd.DataFrame:
-    object_cols = data.select_dtypes(include=["object"])
+    object_cols = data.select_dtypes(include=["object", "category", "string"])
     for col in object_cols:
-        data[col] = data[col].str.title()
-    data["event"] = data["event"].str.capitalize()
-    data["noc"] = data["noc"].str.upper()
+        data[col] = _apply_str_method(data[col], "title")
+    data["event"] = _apply_str_method(data["event"], "capitalize")
+    data["noc"] = _apply_str_method(data["noc"], "upper")
     return data
 
 
+def _apply_str_method(series: pd.Series, method: str) -> pd.Series:
+    # Text columns repeat a few hundred distinct values, so the string
+    # method runs on the distinct values only and the results are mapped
+    # back to the rows through integer codes
+    if is_categorical(series):
+        codes = series.cat.codes.to_numpy()
+        values = series.cat.categories
+    else:
+        codes, values = pd.factorize(series)
+    mapped = getattr(pd.Series(values, dtype=_text_dtype(series)).str,
+                     method)()
+
+    # Distinct values may normalise to the same string, e.g. "GBR" and
+    # "gbr", so the results are factorised again. A trailing -1 lets the
+    # missing code -1 index straight into the lookup
+    mapped_codes, uniques = pd.factorize(mapped, sort=True)
+    new_codes = np.append(mapped_codes, -1)[codes]
+
+    if is_categorical(series):
+        result = pd.Categorical.from_codes(new_codes, categories=uniques)
+    elif series.dtype == object:
+        # Missing values are carried over as they were (None or NaN)
+        result = series.to_numpy(dtype=object, copy=True)
+        present = new_codes >= 0
+        result[present] = uniques.to_numpy(dtype=object)[new_codes[present]]
+    else:
+        result = uniques.array.take(new_codes, allow_fill=True)
+    return pd.Series(result, index=series.index, name=series.name)
+
+
+def _text_dtype(series: pd.Series) -> object:
+    if is_categorical(series):
+        return series.cat.categories.dtype
+    return series.dtype
+
+
 def drop_duplicates(data: pd.DataFrame) -> pd.DataFrame:
-    data = data.drop_duplicates()
+    # Same rows as DataFrame.drop_duplicates, found through row hashes
+    # rather than by factorising every column
+    data, duplicates = drop_duplicate_rows(data)
+    logger.info(duplicates.summary())
     data.reset_index(drop=True, inplace=True)
     return data
 
 
-def fill_missing_values(data: pd.DataFrame) -> pd.DataFrame:
-    # -- Issue, needs resolving --
-    # Use sport groups to impute missing age, height, weight
-    data["age"] = data.groupby("sport")["age"].transform(
-         lambda x: x.fillna(x.mean())
-    )
-    data["height_cm"] = data.groupby("sport")["height_cm"].transform(
-        lambda x: x.fillna(x.mean())
+def fill_missing_values(
+        data: pd.DataFrame,
+        levels: Sequence[Tuple[str, ...]] = IMPUTATION_LEVELS,
+        statistics: Optional[Dict[Tuple[str, ...], pd.DataFrame]] = None
+) -> pd.DataFrame:
+    data, report = impute_missing_values(data, levels, statistics)
+    for level, filled in report.items():
+        logger.info("Imputed by %s: %s", level, filled)
+    data = fill_missing_medals(data)
+    return data
+
+
+def fill_missing_medals(data: pd.DataFrame) -> pd.DataFrame:
+    if is_categorical(data["medal"]) and (
+            NO_MEDAL not in data["medal"].cat.categories):
+        data["medal"] = data["medal"].cat.add_categories(NO_MEDAL)
+    data["medal"] = data["medal"].fillna(NO_MEDAL)
+    return data
+
+
+def level_keys(levels: Sequence[Tuple[str, ...]]) -> List[str]:
+    """Every key of the given imputation levels, in order of appearance."""
+    return list(dict.fromkeys(key for keys in levels for key in keys))
+
+
+def key_statistics(
+        data: pd.DataFrame,
+        keys: Sequence[str],
+        columns: Sequence[str] = IMPUTED_COLUMNS) -> pd.DataFrame:
+    """
+    Sum and count the observed values of each column per key combination.
+
+    With the keys of every imputation level, this is the one aggregation
+    imputation needs: roll_up_statistics derives each level from it.
+    Parts computed on separate chunks or partitions are added up with
+    combine_key_statistics.
+
+    Args:
+        data: Data to aggregate.
+        keys: Columns to group by. Missing values form their own group.
+        columns: Columns to aggregate.
+
+    Returns:
+        DataFrame with the keys as columns, then "<col>_sum" and
+        "<col>_count" columns, one row per key combination.
+    """
+    values = data[list(columns)].astype("float64")
+    parts = {}
+    for col in columns:
+        parts[f"{col}_sum"] = values[col].fillna(0.0)
+        parts[f"{col}_count"] = values[col].notna().astype("int64")
+    parts = pd.DataFrame(parts, index=data.index)
+    if not keys:
+        return parts.sum().to_frame().T
+    return (
+        parts
+        .groupby([data[key] for key in keys], observed=True, dropna=False,
+                 sort=False)
+        .sum()
+        .reset_index()
     )
-    data["weight_kg"] = data.groupby("sport")["weight_kg"].transform(
-        lambda x: x.fillna(x.mean())
+
+
+def combine_key_statistics(
+        parts: Iterable[pd.DataFrame],
+        keys: Sequence[str]) -> pd.DataFrame:
+    """Add up key_statistics computed on separate parts of the data."""
+    return sum_by_keys(parts, keys)
+
+
+def roll_up_statistics(
+        groups: pd.DataFrame,
+        levels: Sequence[Tuple[str, ...]] = IMPUTATION_LEVELS
+) -> Dict[Tuple[str, ...], pd.DataFrame]:
+    """
+    Derive the statistics of every imputation level.
+
+    Args:
+        groups: key_statistics over at least the keys of every level.
+        levels: Grouping keys, most specific first.
+
+    Returns:
+        Statistics by level, as impute_missing_values takes them: the
+        "<col>_sum" and "<col>_count" columns indexed by the level's
+        keys. Rows with a missing key are left out.
+    """
+    stat_columns = [
+        col for col in groups.columns if col.endswith(("_sum", "_count"))
+    ]
+    result = {}
+    for keys in levels:
+        if keys:
+            result[keys] = groups.groupby(
+                list(keys), observed=True, sort=False
+            )[stat_columns].sum()
+        else:
+            result[keys] = groups[stat_columns].sum().to_frame().T
+    return result
+
+
+def level_statistics(
+        data: pd.DataFrame,
+        levels: Sequence[Tuple[str, ...]] = IMPUTATION_LEVELS,
+        columns: Sequence[str] = IMPUTED_COLUMNS
+) -> Dict[Tuple[str, ...], pd.DataFrame]:
+    """Statistics of every imputation level, from one aggregation."""
+    return roll_up_statistics(
+        key_statistics(data, level_keys(levels), columns), levels
     )
-    data["medal"] = data["medal"].fillna("No Medal")
 
-    # For sports with entirely missing height, weight
-    # fill using overall averages
-    data["height_cm"] = data["height_cm"].fillna(data["height_cm"].mean())
-    data["weight_kg"] = data["weight_kg"].fillna(data["weight_kg"].mean())
-    return data
+
+def impute_missing_values(
+        data: pd.DataFrame,
+        levels: Sequence[Tuple[str, ...]] = IMPUTATION_LEVELS,
+        statistics: Optional[Dict[Tuple[str, ...], pd.DataFrame]] = None,
+        columns: Sequence[str] = IMPUTED_COLUMNS
+) -> Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]:
+    """
+    Fill missing values with group means, from the most specific level.
+
+    Every level's means are taken over the observed values only, from
+    statistics gathered before anything is filled, so a coarser mean is
+    never skewed by the values finer levels imputed. Missing statistics
+    are computed by level_statistics in one aggregation. Level by level,
+    means are looked up for the rows that still have gaps and filled in
+    one vectorised step; whatever a level cannot fill (no observed value
+    in the group) falls through to the next. Levels whose key columns
+    are absent are skipped.
+
+    Args:
+        data: Data to impute.
+        levels: Grouping keys, most specific first. An empty tuple is the
+            global mean.
+        statistics: Precomputed statistics by level from
+            roll_up_statistics, e.g. combined over all chunks. Computed
+            from data for missing levels.
+        columns: Columns to impute.
+
+    Returns:
+        The imputed data and the number of values filled per level and
+        column.
+    """
+    columns = [col for col in columns if col in data.columns]
+    levels = [keys for keys in levels if set(keys) <= set(data.columns)]
+    report: Dict[str, Dict[str, int]] = {}
+    if not data[columns].isna().any(axis=None):
+        return data, report
+    statistics = dict(statistics or {})
+    unknown = [keys for keys in levels if keys not in statistics]
+    if unknown:
+        statistics.update(level_statistics(data, unknown, columns))
+
+    for keys in levels:
+        missing = data[columns].isna()
+        rows = missing.any(axis=1).to_numpy()
+        if not rows.any():
+            break
+
+        means = _group_means(statistics[keys], columns)
+
+        if keys:
+            row_keys = data.loc[rows, list(keys)]
+            if len(keys) == 1:
+                row_index = pd.Index(row_keys[keys[0]])
+            else:
+                row_index = pd.MultiIndex.from_frame(row_keys)
+            positions = means.index.get_indexer(row_index)
+        else:
+            positions = np.zeros(rows.sum(), dtype=np.intp)
+
+        looked_up = np.vstack(
+            [means.to_numpy(), np.full((1, len(columns)), np.nan)]
+        )[positions]
+
+        filled = {}
+        for i, col in enumerate(columns):
+            col_missing = missing[col].to_numpy()
+            fill = col_missing[rows] & ~np.isnan(looked_up[:, i])
+            if not fill.any():
+                filled[col] = 0
+                continue
+            values = data[col].to_numpy(dtype="float64", na_value=np.nan)
+            target = np.flatnonzero(rows)[fill]
+            values[target] = looked_up[fill, i]
+            data[col] = pd.Series(
+                values, index=data.index
+            ).astype(data[col].dtype)
+            filled[col] = int(fill.sum())
+        report["+".join(keys) or "global"] = filled
+
+    return data, report
+
+
+def _group_means(stats: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    sums = stats[[f"{col}_sum" for col in columns]].to_numpy()
+    counts = stats[[f"{col}_count" for col in columns]].to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / counts, np.nan)
+    return pd.DataFrame(means, index=stats.index, columns=list(columns))
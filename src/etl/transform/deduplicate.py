@@ -0,0 +1,233 @@
+import numpy as np
+import pandas as pd
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, Tuple
+
+# Column whose values the duplicate report is broken down by
+REPORT_KEY = "ID"
+REPORT_TOP_KEYS = 5
+
+# Key of the second, independent row hash (must be 16 bytes)
+_SECOND_HASH_KEY = "dedup-verify-key"
+
+
+@dataclass
+class DuplicateReport:
+    """
+    What a RowDeduplicator has removed so far.
+
+    Attributes:
+        rows: Rows checked.
+        duplicates: Rows removed as duplicates of an earlier row.
+        collisions: Distinct rows that shared a 64-bit hash with an
+            earlier row and were kept.
+        keys: Duplicates removed per value of the report key column.
+    """
+
+    rows: int = 0
+    duplicates: int = 0
+    collisions: int = 0
+    keys: Counter = field(default_factory=Counter)
+
+    def update(self, other: "DuplicateReport") -> None:
+        """Add the counts of another report, e.g. of a partition."""
+        self.rows += other.rows
+        self.duplicates += other.duplicates
+        self.collisions += other.collisions
+        self.keys.update(other.keys)
+
+    def summary(self, key_name: str = REPORT_KEY) -> str:
+        text = (
+            f"Removed {self.duplicates} duplicate rows of {self.rows}"
+            f" ({self.collisions} hash collisions)"
+        )
+        if self.keys:
+            top = ", ".join(
+                f"{key} ({count})"
+                for key, count in self.keys.most_common(REPORT_TOP_KEYS)
+            )
+            text += f"; {len(self.keys)} {key_name} values, most: {top}"
+        return text
+
+
+class RowDeduplicator:
+    """
+    Drop rows identical to an earlier row, one frame or chunk at a time.
+
+    Each row is reduced to a 64-bit hash of all its columns, and only the
+    sorted hashes of the rows kept so far are remembered, rather than
+    the factorised columns DataFrame.drop_duplicates builds. Rows of the
+    same frame that share a hash are compared value by value, so a hash
+    collision there never drops a distinct row. Rows of earlier chunks
+    are no longer available, so a match with one is confirmed by a
+    second, independent 64-bit hash instead.
+
+    The first occurrence is kept, so the result equals
+    DataFrame.drop_duplicates on all chunks concatenated.
+
+    Args:
+        report_key: Column the report counts duplicates by. Not counted
+            if the column is absent.
+    """
+
+    def __init__(self, report_key: Optional[str] = REPORT_KEY) -> None:
+        self.report_key = report_key
+        self.report = DuplicateReport()
+        # Sorted, unique hashes of the kept rows, with their second hash
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._second_hashes = np.empty(0, dtype=np.uint64)
+        # Second hashes of kept rows whose first hash was already taken
+        self._collided: Dict[int, Set[int]] = {}
+
+    def first_occurrences(self, chunk: pd.DataFrame) -> np.ndarray:
+        """
+        Find the rows of a chunk not seen in it or any earlier chunk.
+
+        Args:
+            chunk: Rows to check. The kept rows are remembered.
+
+        Returns:
+            Boolean mask of the rows to keep.
+        """
+        hashes = _row_hashes(chunk)
+        second = _row_hashes(chunk, _SECOND_HASH_KEY)
+        keep, collided = _first_in_frame(chunk, hashes)
+        # A row colliding within the chunk is not in the sorted hashes
+        in_sorted = keep & ~collided
+
+        positions = np.searchsorted(self._hashes, hashes)
+        found = positions < len(self._hashes)
+        found[found] = self._hashes[positions[found]] == hashes[found]
+        seen = np.flatnonzero(keep & found)
+        confirmed = self._second_hashes[positions[seen]] == second[seen]
+        keep[seen[confirmed]] = False
+        for row in seen[~confirmed]:
+            if int(second[row]) in self._collided.get(int(hashes[row]), ()):
+                keep[row] = False
+            else:
+                in_sorted[row] = False
+                collided[row] = True
+        for row in np.flatnonzero(keep & ~in_sorted):
+            self._collided.setdefault(int(hashes[row]), set()).add(
+                int(second[row])
+            )
+
+        self._remember(hashes[in_sorted], second[in_sorted])
+        _record(self.report, chunk, keep, collided, self.report_key)
+        return keep
+
+    def drop_duplicates(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop the rows of a chunk seen before, keeping the row labels.
+
+        Args:
+            chunk: Rows to deduplicate.
+
+        Returns:
+            The rows seen for the first time.
+        """
+        return chunk[self.first_occurrences(chunk)]
+
+    def _remember(self, hashes: np.ndarray, second: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        merged = np.concatenate([self._hashes, hashes])
+        order = np.argsort(merged, kind="stable")
+        self._hashes = merged[order]
+        self._second_hashes = np.concatenate(
+            [self._second_hashes, second]
+        )[order]
+
+
+def drop_duplicate_rows(
+        data: pd.DataFrame,
+        report_key: Optional[str] = REPORT_KEY
+) -> Tuple[pd.DataFrame, DuplicateReport]:
+    """
+    Drop the duplicate rows of one frame.
+
+    Same as RowDeduplicator on a single chunk, but without the second
+    hash, which is only needed to compare with earlier chunks.
+
+    Args:
+        data: Rows to deduplicate.
+        report_key: Column the report counts duplicates by.
+
+    Returns:
+        The first occurrence of each row, keeping the row labels, and
+        the report.
+    """
+    keep, collided = _first_in_frame(data, _row_hashes(data))
+    report = DuplicateReport()
+    _record(report, data, keep, collided, report_key)
+    return data[keep], report
+
+
+def _record(
+        report: DuplicateReport,
+        data: pd.DataFrame,
+        keep: np.ndarray,
+        collided: np.ndarray,
+        report_key: Optional[str]) -> None:
+    report.rows += len(data)
+    report.duplicates += int((~keep).sum())
+    report.collisions += int(collided[keep].sum())
+    if report_key in data.columns and not keep.all():
+        report.keys.update(data.loc[~keep, report_key].tolist())
+
+
+def _row_hashes(data: pd.DataFrame, hash_key: Optional[str] = None
+                ) -> np.ndarray:
+    kwargs = {"hash_key": hash_key} if hash_key else {}
+    return pd.util.hash_pandas_object(
+        data, index=False, **kwargs
+    ).to_numpy()
+
+
+def _first_in_frame(
+        data: pd.DataFrame,
+        hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Rows after the first of their hash are compared with that first
+    # row. Runs where a row differs (a collision) are resolved exactly.
+    keep = np.ones(len(data), dtype=bool)
+    collided = np.zeros(len(data), dtype=bool)
+    if len(data) < 2:
+        return keep, collided
+    order = np.argsort(hashes, kind="stable")
+    sorted_hashes = hashes[order]
+    starts = np.r_[True, sorted_hashes[1:] != sorted_hashes[:-1]]
+    if starts.all():
+        return keep, collided
+    first = order[np.maximum.accumulate(
+        np.where(starts, np.arange(len(order)), 0)
+    )]
+    candidates = order[~starts]
+    same = _rows_equal(data, candidates, first[~starts])
+    keep[candidates[same]] = False
+
+    collided_runs = np.unique(sorted_hashes[~starts][~same])
+    for value in collided_runs:
+        rows = np.sort(order[sorted_hashes == value])
+        is_new = ~data.iloc[rows].duplicated().to_numpy()
+        keep[rows] = is_new
+        # All but the first distinct row share their hash with it
+        collided[rows[is_new][1:]] = True
+    return keep, collided
+
+
+def _rows_equal(
+        data: pd.DataFrame,
+        rows: np.ndarray,
+        others: np.ndarray) -> np.ndarray:
+    equal = np.ones(len(rows), dtype=bool)
+    for col in data.columns:
+        values = data[col].take(rows).to_numpy(dtype=object)
+        other_values = data[col].take(others).to_numpy(dtype=object)
+        missing = pd.isna(values)
+        other_missing = pd.isna(other_values)
+        present = ~missing & ~other_missing
+        same = missing & other_missing
+        same[present] = values[present] == other_values[present]
+        equal &= same
+    return equal
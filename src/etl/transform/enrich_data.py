@@ -1,17 +1,62 @@
+import os
 import pandas as pd
-from src.utils.file_utils import save_dataframe_to_csv
+from typing import Dict, Union
+from src.etl.schema import is_categorical
+from src.utils.file_utils import (
+    ROOT_DIR,
+    ParquetSource,
+    save_dataframe_to_parquet,
+    write_parquet_frames,
+)
 
 OUTPUT_DIR = "data/processed"
-FILE_NAME = "transformed_data.csv"
+FILE_NAME = "transformed_data.parquet"
 
 
 def create_country_columns(
+        olympic_data: Union[pd.DataFrame, ParquetSource],
+        noc_data: pd.DataFrame) -> Union[pd.DataFrame, ParquetSource]:
+    if isinstance(olympic_data, ParquetSource):
+        # Cleaned data left on disk is enriched a row group at a time
+        # and stays on disk
+        path = os.path.join(ROOT_DIR, OUTPUT_DIR, FILE_NAME)
+        write_parquet_frames(
+            (
+                add_country_column(chunk, noc_data)
+                for chunk in olympic_data.iter_frames()
+            ),
+            path,
+        )
+        return ParquetSource(path)
+
+    olympic_data = add_country_column(olympic_data, noc_data)
+
+    save_dataframe_to_parquet(olympic_data, OUTPUT_DIR, FILE_NAME)
+
+    return olympic_data
+
+
+def add_country_column(
         olympic_data: pd.DataFrame,
         noc_data: pd.DataFrame) -> pd.DataFrame:
-    country_map = dict(zip(noc_data["NOC"], noc_data["region"]))
-    country_map["SGP"] = "Singapore"  # Not in NOC dataset
-    olympic_data["country"] = olympic_data["noc"].map(country_map)
+    # Row by row, so it also works on chunks of the cleaned data
+    country = olympic_data["noc"].map(country_map(noc_data))
+    if is_categorical(olympic_data["noc"]):
+        country = country.astype("category")
+    olympic_data["country"] = country
+    return olympic_data
 
-    save_dataframe_to_csv(olympic_data, OUTPUT_DIR, FILE_NAME)
 
-    return olympic_data
+def country_map(noc_data: pd.DataFrame) -> Dict[str, str]:
+    """
+    Map each NOC code to its country.
+
+    Args:
+        noc_data (pd.DataFrame): The cleaned NOC data.
+
+    Returns:
+        Dict[str, str]: Country (region) by NOC code.
+    """
+    countries = dict(zip(noc_data["NOC"], noc_data["region"]))
+    countries["SGP"] = "Singapore"  # Not in NOC dataset
+    return countries
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Union
+from src.etl.schema import ARROW_STRING
+from src.utils.file_utils import (
+    ParquetSource,
+    iter_frames,
+    save_dataframe_to_parquet,
+)
+
+OUTPUT_DIR = "data/processed"
+FILE_NAME = "event_catalog.parquet"
+
+# Leading word of the event name after the sport -> sex category
+SEX_CATEGORIES = {"men's": "men", "women's": "women", "mixed": "mixed"}
+
+DISTANCE_PATTERN = (
+    r"(?P<distance>\d[\d,.]*(?:\s*x\s*\d[\d,.]*)?\s*"
+    r"(?:metres|kilometres|miles|yards|km|m)\b)"
+)
+WEIGHT_CLASS_PATTERN = (
+    r"(?P<weight_class>[a-z-]*weight\b|[+-]?\d+(?:\.\d+)?\s*"
+    r"(?:kg|kilograms)\b)"
+)
+
+
+def create_event_catalog(
+        data: Union[pd.DataFrame, ParquetSource]) -> pd.DataFrame:
+    """
+    Build the event dimension with attributes parsed from event names.
+
+    Event names follow "<Sport> <men's|women's|mixed> <rest>", e.g.
+    "Swimming women's 4 x 100 metres freestyle relay". Only the distinct
+    (sport, event) pairs are parsed, so the cost does not depend on the
+    number of entries. A dataset on disk is read a row group at a time.
+
+    Args:
+        data (Union[pd.DataFrame, ParquetSource]): The transformed
+            dataset.
+
+    Returns:
+        pd.DataFrame: One row per event with event_id, sport, event,
+            sex_category (men, women or mixed), discipline, distance and
+            weight_class. Attributes that do not apply are missing.
+    """
+    pairs = [
+        chunk.dropna().drop_duplicates().astype(str)
+        for chunk in iter_frames(data, ["sport", "event"])
+    ]
+    catalog = (
+        pd.concat(pairs)
+        .drop_duplicates()
+        .sort_values(["sport", "event"])
+        .reset_index(drop=True)
+    )
+
+    # Drop the sport prefix, whose case differs after standardisation
+    rest = pd.Series(
+        [
+            event[len(sport) + 1:]
+            if event.lower().startswith(sport.lower() + " ") else event
+            for sport, event in zip(catalog["sport"], catalog["event"])
+        ],
+        dtype=str,
+    ).str.lower()
+    parts = rest.str.partition(" ")
+    sex_category = parts[0].map(SEX_CATEGORIES)
+    remainder = parts[2].where(sex_category.notna(), rest)
+
+    distance = remainder.str.extract(DISTANCE_PATTERN)["distance"]
+    weight_class = remainder.str.extract(WEIGHT_CLASS_PATTERN)[
+        "weight_class"
+    ]
+    discipline = (
+        remainder
+        .str.replace(DISTANCE_PATTERN, "", regex=True)
+        .str.replace(WEIGHT_CLASS_PATTERN, "", regex=True)
+        .str.replace(r"\s*,[\s,]*", ", ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip(" ,")
+        .replace("", np.nan)
+    )
+
+    catalog.insert(0, "event_id", np.arange(1, len(catalog) + 1))
+    catalog = catalog.assign(
+        sex_category=sex_category,
+        discipline=discipline,
+        distance=distance,
+        weight_class=weight_class,
+    ).astype(
+        {
+            "event_id": "int32",
+            "sport": "category",
+            "event": ARROW_STRING,
+            "sex_category": "category",
+            "discipline": ARROW_STRING,
+            "distance": ARROW_STRING,
+            "weight_class": ARROW_STRING,
+        }
+    )
+
+    save_dataframe_to_parquet(catalog, OUTPUT_DIR, FILE_NAME)
+    return catalog
+
+
+def build_event_lookup(
+    catalog: pd.DataFrame,
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Index event names by sport and sex category for the event dropdowns.
+
+    Mixed events are listed under both men and women. "all" lists every
+    event of the sport.
+
+    Args:
+        catalog (pd.DataFrame): Output of create_event_catalog.
+
+    Returns:
+        Dict[str, Dict[str, List[str]]]: Sorted event names, e.g.
+            lookup["Judo"]["women"].
+    """
+    lookup: Dict[str, Dict[str, List[str]]] = {}
+    for sport, events in catalog.groupby("sport", observed=True):
+        by_sex = events.groupby("sex_category", observed=True)["event"]
+        names = {sex: sorted(group) for sex, group in by_sex}
+        mixed = names.get("mixed", [])
+        lookup[sport] = {
+            "men": sorted(names.get("men", []) + mixed),
+            "women": sorted(names.get("women", []) + mixed),
+            "mixed": mixed,
+            "all": sorted(events["event"]),
+        }
+    return lookup
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from src.etl.schema import sum_by_keys
+from src.etl.transform.clean_olympic_data import NO_MEDAL
+from src.utils.file_utils import (
+    ParquetSource,
+    iter_frames,
+    save_dataframe_to_parquet,
+)
+
+OUTPUT_DIR = "data/processed"
+FILE_NAME = "medal_cube.parquet"
+
+# Axes of the cube, in order
+DIMENSIONS = ["year", "season", "sport", "sex", "country", "medal"]
+
+# A selection on one axis: one label, several labels, or for year an
+# inclusive (first, last) range
+Selection = Union[str, int, Sequence, Tuple[int, int], None]
+
+
+def create_medal_cube(
+        data: Union[pd.DataFrame, ParquetSource]) -> pd.DataFrame:
+    """
+    Count medals by year, season, sport, sex, country and medal.
+
+    Only the non-empty cells are kept, one row each, so the cube is
+    stored sparsely. Labels are saved as categories, which
+    build_medal_cube turns into the axes of a MedalCube. Rows without a
+    medal or with a missing label are not counted. A dataset on disk is
+    counted a row group at a time.
+
+    Args:
+        data (Union[pd.DataFrame, ParquetSource]): The transformed
+            dataset.
+
+    Returns:
+        pd.DataFrame: The DIMENSIONS columns and medal_count.
+    """
+    cells = None
+    for chunk in iter_frames(data, DIMENSIONS):
+        medals = chunk[chunk["medal"] != NO_MEDAL]
+        part = (
+            medals
+            .groupby(DIMENSIONS, observed=True)
+            .size()
+            .reset_index(name="medal_count")
+        )
+        # Folded in as it goes, so memory stays at the number of cells
+        cells = sum_by_keys(
+            [part] if cells is None else [cells, part], DIMENSIONS
+        )
+    cells = cells.sort_values(DIMENSIONS, ignore_index=True).astype(
+        {
+            **{dim: "category" for dim in DIMENSIONS if dim != "year"},
+            "year": "int16",
+            "medal_count": "int32",
+        }
+    )
+    save_dataframe_to_parquet(cells, OUTPUT_DIR, FILE_NAME)
+    return cells
+
+
+class MedalCube:
+    """
+    Sparse medal-count cube held as NumPy arrays.
+
+    Each non-empty cell has one integer code per axis in codes and its
+    count in counts. Selections are turned into a boolean array per axis
+    and looked up by code, and roll-ups are a bincount over the codes of
+    the kept axes, so neither touches a string.
+
+    Args:
+        axes: Sorted labels of each axis, by name.
+        codes: Cell coordinates, one column per axis in axes order.
+        counts: Medals in each cell.
+    """
+
+    def __init__(
+            self,
+            axes: Dict[str, np.ndarray],
+            codes: np.ndarray,
+            counts: np.ndarray) -> None:
+        self.axes = axes
+        self.codes = codes
+        self.counts = counts
+        self._position = {name: i for i, name in enumerate(axes)}
+
+    def labels(self, axis: str) -> List:
+        """Labels of an axis, sorted."""
+        return self.axes[axis].tolist()
+
+    def mask(self, **selections: Selection) -> np.ndarray:
+        """
+        Find the cells within a selection.
+
+        Args:
+            **selections: Labels to keep per axis, e.g. sport="Judo",
+                sex=["F"] or year=(1960, 1980). None or an empty list
+                keeps the whole axis.
+
+        Returns:
+            Boolean mask over the cells.
+        """
+        keep = np.ones(len(self.counts), dtype=bool)
+        for axis, selection in selections.items():
+            allowed = self._allowed(axis, selection)
+            if allowed is not None:
+                keep &= allowed[self.codes[:, self._position[axis]]]
+        return keep
+
+    def roll_up(
+            self,
+            by: Union[str, Sequence[str]],
+            **selections: Selection) -> pd.DataFrame:
+        """
+        Total the medals of a selection along some axes.
+
+        Args:
+            by: Axis or axes to keep. The others are summed out.
+            **selections: As for mask.
+
+        Returns:
+            pd.DataFrame: The by columns and medal_count, one row per
+                non-empty combination, most medals first, then by label.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        keep = self.mask(**selections)
+        shape = tuple(len(self.axes[axis]) for axis in by)
+        cells = np.ravel_multi_index(
+            tuple(self.codes[keep, self._position[axis]] for axis in by),
+            shape,
+        )
+        totals = np.bincount(
+            cells, weights=self.counts[keep], minlength=int(np.prod(shape))
+        ).astype(np.int64)
+        present = np.flatnonzero(totals)
+        order = present[np.argsort(-totals[present], kind="stable")]
+        coordinates = np.unravel_index(order, shape)
+        rolled = pd.DataFrame(
+            {
+                axis: self.axes[axis][coordinate]
+                for axis, coordinate in zip(by, coordinates)
+            }
+        )
+        rolled["medal_count"] = totals[order]
+        return rolled
+
+    def total(self, **selections: Selection) -> int:
+        """Medals in a selection."""
+        return int(self.counts[self.mask(**selections)].sum())
+
+    def _allowed(
+            self, axis: str, selection: Selection) -> Optional[np.ndarray]:
+        if axis not in self._position:
+            raise ValueError(
+                f"Unknown axis '{axis}'. Choose from: {', '.join(self.axes)}"
+            )
+        labels = self.axes[axis]
+        if selection is None:
+            return None
+        if axis == "year" and isinstance(selection, tuple):
+            first, last = selection
+            return (labels >= first) & (labels <= last)
+        if isinstance(selection, (str, int)):
+            selection = [selection]
+        if not len(selection):
+            return None
+        return np.isin(labels, list(selection))
+
+
+def build_medal_cube(cells: pd.DataFrame) -> MedalCube:
+    """
+    Load the cells saved by create_medal_cube into a MedalCube.
+
+    Args:
+        cells (pd.DataFrame): Output of create_medal_cube.
+
+    Returns:
+        MedalCube: The cube, with the year axis in numeric order and the
+            others in label order.
+    """
+    axes = {}
+    codes = np.empty((len(cells), len(DIMENSIONS)), dtype=np.int32)
+    for i, dim in enumerate(DIMENSIONS):
+        codes[:, i], labels = pd.factorize(cells[dim], sort=True)
+        axes[dim] = np.asarray(labels)
+    return MedalCube(axes, codes, cells["medal_count"].to_numpy())
@@ -0,0 +1,118 @@
+import os
+import pandas as pd
+from typing import Callable, Iterable, Iterator, List, Optional
+from src.etl.extract import extract_olympic_data
+from src.etl.transform import enrich_data
+from src.etl.transform.clean_olympic_data import (
+    IMPUTED_COLUMNS,
+    ChunkStatistics,
+    impute_chunks,
+)
+from src.etl.transform.enrich_data import add_country_column
+from src.utils.file_utils import (
+    ROOT_DIR,
+    ParquetSource,
+    write_parquet_frames,
+)
+from src.utils.logging_utils import setup_logger
+
+logger = setup_logger(__name__, "transform_data.log")
+
+
+def transform_out_of_core(
+        noc_data: pd.DataFrame,
+        chunk_size: Optional[int] = None,
+        read_chunks: Callable[[int], Iterator[pd.DataFrame]] = (
+            extract_olympic_data.extract_olympic_data_chunks
+        )) -> ParquetSource:
+    """
+    Clean and enrich the raw Olympic data without holding it in memory.
+
+    The raw data is streamed twice. The first pass finds the duplicate
+    rows and gathers the sums and counts imputation needs. The second
+    deduplicates, standardises, imputes and adds the country to each
+    chunk and appends it to the transformed Parquet file. Only a chunk,
+    the row hashes and the group sums are in memory at a time. The
+    result matches clean_olympic_data followed by create_country_columns,
+    and is left on disk for the next stages to stream.
+
+    Args:
+        noc_data: Cleaned NOC data.
+        chunk_size: Rows per chunk. Picked from available memory if None.
+        read_chunks: Streams the raw data in chunks of the given size.
+            Called once per pass.
+
+    Returns:
+        The written transformed data file.
+    """
+    if chunk_size is None:
+        # Fixed for both passes, so the chunks line up
+        chunk_size = extract_olympic_data.get_chunk_size()
+    statistics = gather_statistics(read_chunks(chunk_size))
+    logger.info(
+        "First pass: %d rows in %d chunks, %d imputation groups",
+        statistics.rows, len(statistics.chunk_rows),
+        len(statistics.groups),
+    )
+    path = os.path.join(
+        ROOT_DIR, enrich_data.OUTPUT_DIR, enrich_data.FILE_NAME
+    )
+    rows = write_transformed_chunks(
+        read_chunks(chunk_size), statistics, noc_data, path
+    )
+    logger.info("Second pass: wrote %d rows to %s", rows, path)
+    return ParquetSource(path)
+
+
+def gather_statistics(
+        chunks: Iterable[pd.DataFrame],
+        columns: List[str] = IMPUTED_COLUMNS) -> ChunkStatistics:
+    """
+    First pass: find duplicates and sum up the values to impute from.
+
+    Args:
+        chunks: Raw Olympic data in chunks.
+        columns: Columns to impute.
+
+    Returns:
+        The duplicate masks and group sums of the data.
+
+    Raises:
+        ValueError: If there are no chunks.
+    """
+    statistics = ChunkStatistics(columns)
+    for chunk in chunks:
+        statistics.add(chunk)
+    if statistics.groups is None:
+        raise ValueError("No Olympic data to transform")
+    logger.info(statistics.duplicates.summary())
+    return statistics
+
+
+def write_transformed_chunks(
+        chunks: Iterable[pd.DataFrame],
+        statistics: ChunkStatistics,
+        noc_data: pd.DataFrame,
+        path: str) -> int:
+    """
+    Second pass: transform each chunk and append it to a Parquet file.
+
+    The file is written under a temporary name and renamed into place
+    once complete.
+
+    Args:
+        chunks: Raw Olympic data in the same chunks as the first pass.
+        statistics: Output of gather_statistics on those chunks.
+        noc_data: Cleaned NOC data.
+        path: Parquet file to write.
+
+    Returns:
+        Rows written.
+
+    Raises:
+        ValueError: If the chunks differ from those of the first pass.
+    """
+    cleaned = impute_chunks(statistics.replay(chunks), statistics)
+    return write_parquet_frames(
+        (add_country_column(chunk, noc_data) for chunk in cleaned), path
+    )
@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple, Union
+from src.etl.schema import is_categorical
+from src.etl.transform.clean_olympic_data import NO_MEDAL
+from src.etl.transform.enrich_data import country_map
+from src.utils.file_utils import (
+    ParquetSource,
+    load_dataframe_from_parquet,
+    read_frame,
+    save_dataframe_to_parquet,
+)
+
+OUTPUT_DIR = "data/processed/star"
+
+FACT_TABLE = "fact_results"
+MEASURES = ["age", "height_cm", "weight_kg"]
+# Medals are stored as small integers in the fact table
+MEDALS = [NO_MEDAL, "Gold", "Silver", "Bronze"]
+
+# Dimension -> (surrogate key, columns of the transformed data). A
+# dimension row is a distinct combination of its columns, so the wide
+# view can be rebuilt exactly: athletes are told apart by id, name and
+# sex, and Games by label, year, season and city (the 1956 Summer Games
+# were held in two cities).
+DIMENSIONS: Dict[str, Tuple[str, List[str]]] = {
+    "dim_athlete": ("athlete_key", ["id", "name", "sex"]),
+    "dim_games": ("games_key", ["games", "year", "season", "city"]),
+    "dim_event": ("event_key", ["event"]),
+    "dim_sport": ("sport_key", ["sport"]),
+    "dim_team": ("team_key", ["team"]),
+    "dim_country": ("country_key", ["noc", "country"]),
+}
+STAR_TABLES = [FACT_TABLE] + list(DIMENSIONS)
+
+# Column order of the transformed data
+WIDE_COLUMNS = [
+    "id", "name", "sex", "age", "height_cm", "weight_kg", "team", "noc",
+    "games", "year", "season", "city", "sport", "event", "medal",
+    "country",
+]
+
+
+def create_star_schema(
+        data: Union[pd.DataFrame, ParquetSource],
+        noc_data: pd.DataFrame) -> Tuple[pd.DataFrame, ...]:
+    """
+    Split the transformed data into a fact table and dimension tables.
+
+    Each table is saved under OUTPUT_DIR as <table>.parquet. The fact
+    table has a row per entry, so a dataset on disk is read whole.
+
+    Args:
+        data (Union[pd.DataFrame, ParquetSource]): The transformed
+            dataset.
+        noc_data (pd.DataFrame): The cleaned NOC data, for the country
+            dimension.
+
+    Returns:
+        Tuple[pd.DataFrame, ...]: The tables in STAR_TABLES order.
+    """
+    tables = build_star_schema(read_frame(data), noc_data)
+    for name, table in tables.items():
+        save_dataframe_to_parquet(table, OUTPUT_DIR, f"{name}.parquet")
+    return tuple(tables[name] for name in STAR_TABLES)
+
+
+def build_star_schema(
+        data: pd.DataFrame,
+        noc_data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Build the dimensional model of the transformed data.
+
+    The fact table has one row per row of the transformed data, holding
+    an integer surrogate key per dimension, the measures and a medal
+    code (the index into MEDALS). Keys number the sorted distinct values
+    of a dimension from 1. Key 0 stands for a missing value and has no
+    dimension row. The country dimension lists every NOC of the NOC
+    data, not only those that competed.
+
+    Args:
+        data (pd.DataFrame): The transformed dataset.
+        noc_data (pd.DataFrame): The cleaned NOC data.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Tables by name, in STAR_TABLES order.
+    """
+    fact = {}
+    dimensions = {}
+    for name, (key, columns) in DIMENSIONS.items():
+        values = data[columns]
+        if name == "dim_country":
+            values = _all_countries(values, noc_data)
+        dimension = _dimension(values, key)
+        dimensions[name] = dimension
+        fact[key] = _lookup_keys(dimension, data[columns], key)
+
+    for col in MEASURES:
+        fact[col] = data[col].to_numpy()
+    medal = data["medal"].astype(object).fillna(NO_MEDAL)
+    fact["medal_code"] = (
+        medal.map({label: code for code, label in enumerate(MEDALS)})
+        .to_numpy(dtype="int8")
+    )
+    return {FACT_TABLE: pd.DataFrame(fact), **dimensions}
+
+
+def build_wide_view(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Rebuild the transformed data from the star schema.
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Tables by name, as made by
+            build_star_schema.
+
+    Returns:
+        pd.DataFrame: The transformed data, columns in WIDE_COLUMNS
+            order.
+    """
+    fact = tables[FACT_TABLE]
+    columns = {}
+    for name, (key, dimension_columns) in DIMENSIONS.items():
+        dimension = tables[name]
+        positions = pd.Index(dimension[key]).get_indexer(fact[key])
+        missing = (positions < 0).any()
+        for col in dimension_columns:
+            columns[col] = dimension[col].array.take(
+                positions, allow_fill=bool(missing)
+            )
+    for col in MEASURES:
+        columns[col] = fact[col].to_numpy()
+    columns["medal"] = pd.Categorical.from_codes(
+        fact["medal_code"].to_numpy(), categories=MEDALS
+    )
+    return pd.DataFrame({col: columns[col] for col in WIDE_COLUMNS})
+
+
+def load_wide_view(relative_dir: str = OUTPUT_DIR) -> pd.DataFrame:
+    """
+    Read the saved star schema and rebuild the transformed data.
+
+    Args:
+        relative_dir (str): Directory of the star schema files, relative
+            to the project root.
+
+    Returns:
+        pd.DataFrame: The transformed data.
+    """
+    return build_wide_view(
+        {
+            name: load_dataframe_from_parquet(
+                f"{relative_dir}/{name}.parquet"
+            )
+            for name in STAR_TABLES
+        }
+    )
+
+
+def _dimension(values: pd.DataFrame, key: str) -> pd.DataFrame:
+    dimension = (
+        values.drop_duplicates()
+        .dropna(how="all")
+        .sort_values(list(values.columns), ignore_index=True)
+    )
+    for col in dimension.columns:
+        if is_categorical(dimension[col]):
+            dimension[col] = dimension[col].cat.remove_unused_categories()
+    dimension.insert(
+        0, key,
+        np.arange(1, len(dimension) + 1, dtype=_key_dtype(len(dimension))),
+    )
+    return dimension
+
+
+def _lookup_keys(
+        dimension: pd.DataFrame,
+        values: pd.DataFrame,
+        key: str) -> np.ndarray:
+    columns = list(values.columns)
+    if len(columns) == 1:
+        index = pd.Index(dimension[columns[0]])
+        target = pd.Index(values[columns[0]])
+    else:
+        index = pd.MultiIndex.from_frame(dimension[columns])
+        target = pd.MultiIndex.from_frame(values)
+    positions = index.get_indexer(target)
+    keys = np.append(dimension[key].to_numpy(), 0)[positions]
+    return keys.astype(dimension[key].dtype)
+
+
+def _all_countries(
+        values: pd.DataFrame, noc_data: pd.DataFrame) -> pd.DataFrame:
+    # NOCs that never competed get a key too, and those missing from the
+    # NOC data keep the country add_country_column gave them
+    countries = country_map(noc_data)
+    listed = pd.DataFrame(
+        {"noc": list(countries), "country": list(countries.values())}
+    )
+    combined = pd.concat(
+        [values.astype(object), listed], ignore_index=True
+    )
+    return combined.astype(
+        {
+            col: "category" if is_categorical(values[col])
+            else values[col].dtype
+            for col in values.columns
+        }
+    )
+
+
+def _key_dtype(size: int) -> np.dtype:
+    if size <= np.iinfo("int16").max:
+        return np.dtype("int16")
+    return np.dtype("int32")
@@ -1,4 +1,5 @@
 import streamlit as st
+from src.streamlit.data_access import cache_stats
 
 
 # Define pages
@@ -12,6 +13,11 @@ medal_stats_page = st.Page(
     title="Medal Records",
     icon="🏅"
 )
+athlete_profile_page = st.Page(
+    "pages/athlete_profile.py",
+    title="Athlete Profiles",
+    icon="🧑‍🎤"
+)
 optimal_athlete_page = st.Page(
     "pages/optimal_athlete.py",
     title="Build the Optimal Athlete!",
@@ -28,8 +34,14 @@ fun_facts_page = st.Page(
 pg = st.navigation(
     [home_page,
      medal_stats_page,
+     athlete_profile_page,
      optimal_athlete_page,
      fun_facts_page]
 )
 
 pg.run()
+
+stats = cache_stats()
+st.sidebar.caption(
+    f"Dataset cache: {stats['hits']} hits, {stats['misses']} misses"
+)
@@ -0,0 +1,151 @@
+import os
+import threading
+import timeit
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.utils.file_utils import ROOT_DIR, load_dataframe_from_parquet
+from src.utils.fingerprint_utils import MANIFEST_FILE
+from src.utils.logging_utils import setup_logger
+
+TRANSFORMED_DATA = "data/processed/transformed_data.parquet"
+MEDAL_COUNTS = "data/processed/medal_counts.parquet"
+MEDAL_CUBE = "data/processed/medal_cube.parquet"
+ATHLETE_STATS = "data/processed/athlete_stats.parquet"
+ATHLETE_CAREERS = "data/processed/athlete_careers.parquet"
+EVENT_CATALOG = "data/processed/event_catalog.parquet"
+
+logger = setup_logger("data_access", "streamlit_app.log")
+
+_Key = Tuple[str, Optional[Tuple[str, ...]], Optional[Callable]]
+_Signature = Tuple[Optional[Tuple[int, int]], ...]
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DatasetCache:
+    """
+    Process-wide cache of the datasets written by the ETL.
+
+    Streamlit re-runs page scripts on every interaction and for every
+    session, but imported modules live for the whole server process. The
+    cache therefore lives here, so each dataset is read once and the same
+    DataFrame is shared by every page and session. Callers must treat it
+    as read-only.
+
+    An entry is reloaded when the file's modification time or size
+    changes, or when the ETL manifest next to it changes, so a new ETL
+    run is picked up without restarting the app.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[_Key, Tuple[_Signature, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        relative_path: str,
+        columns: Optional[List[str]] = None,
+        build: Optional[Callable[[pd.DataFrame], Any]] = None,
+    ) -> Any:
+        """
+        Return a dataset, loading it only if it is not cached or stale.
+
+        Args:
+            relative_path (str): Parquet file, relative to the project
+                root.
+            columns (Optional[List[str]]): Columns to load. Each distinct
+                projection is cached separately. Loads all if None.
+            build (Optional[Callable[[pd.DataFrame], Any]]): Turns the
+                loaded DataFrame into the cached value, e.g. a lookup
+                index. Runs once per load. Pass a function imported from
+                a module, not one defined in a page script, since pages
+                define new functions on every rerun.
+
+        Returns:
+            Any: The shared, read-only dataset, or what build made of it.
+        """
+        key = (relative_path, tuple(columns) if columns else None, build)
+        signature = self._signature(relative_path)
+        # Loads happen under the lock, so concurrent sessions opening the
+        # app wait for one load instead of each reading the file
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            start_time = timeit.default_timer()
+            df = load_dataframe_from_parquet(relative_path, columns=columns)
+            value = build(df) if build is not None else df
+            self._entries[key] = (signature, value)
+            logger.info(
+                "Loaded %s (%d rows) in %.3f seconds%s",
+                relative_path, len(df), timeit.default_timer() - start_time,
+                " after it changed" if entry is not None else "",
+            )
+            return value
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the hit, miss and entry counts of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _signature(self, relative_path: str) -> _Signature:
+        path = os.path.join(ROOT_DIR, relative_path)
+        manifest = os.path.join(os.path.dirname(path), MANIFEST_FILE)
+        return _file_signature(path), _file_signature(manifest)
+
+
+_cache = DatasetCache()
+
+
+def get_dataset(
+    relative_path: str = TRANSFORMED_DATA,
+    columns: Optional[List[str]] = None,
+    build: Optional[Callable[[pd.DataFrame], Any]] = None,
+) -> Any:
+    """
+    Return a processed dataset from the shared cache.
+
+    Args:
+        relative_path (str): Parquet file, relative to the project root.
+            Defaults to the transformed dataset.
+        columns (Optional[List[str]]): Columns to load. Loads all if None.
+        build (Optional[Callable[[pd.DataFrame], Any]]): Turns the loaded
+            DataFrame into the cached value. Returns the DataFrame if None.
+
+    Returns:
+        Any: The shared dataset. Do not modify it in place.
+    """
+    return _cache.get(relative_path, columns, build)
+
+
+def cache_stats() -> Dict[str, int]:
+    """
+    Return the hit, miss and entry counts of the shared cache.
+    """
+    return _cache.stats()
@@ -0,0 +1,76 @@
+import streamlit as st
+import plotly.express as px
+from src.etl.transform.athlete_careers import MEDAL_COLUMNS
+from src.streamlit.data_access import ATHLETE_CAREERS, get_dataset
+
+MAX_MATCHES = 50
+
+
+# One row per athlete, summarised by the ETL
+athlete_careers = get_dataset(ATHLETE_CAREERS)
+
+st.title("🧑‍🎤 Athlete Profiles")
+st.text("Search for an athlete by name to see their Olympic career.")
+
+query = st.text_input("Athlete name", placeholder="e.g. Michael Phelps")
+
+if query:
+    matches = athlete_careers[
+        athlete_careers["name"].str.contains(
+            query, case=False, regex=False, na=False
+        )
+    ].sort_values(by=["medals", "id"], ascending=[False, True])
+    if matches.empty:
+        st.text("No athlete found.")
+    else:
+        if len(matches) > MAX_MATCHES:
+            st.caption(
+                f"{len(matches)} athletes found, showing the "
+                f"{MAX_MATCHES} with the most medals."
+            )
+            matches = matches.head(MAX_MATCHES)
+        # Athletes sharing a name are told apart by NOC and years
+        labels = {
+            row.id: (
+                f"{row.name} ({row.noc}, {row.first_year}"
+                + (f"-{row.last_year}" if row.last_year != row.first_year
+                   else "")
+                + ")"
+            )
+            for row in matches.itertuples()
+        }
+        athlete_id = st.selectbox(
+            "Athlete", list(labels), format_func=labels.get
+        )
+        athlete = matches[matches["id"] == athlete_id].iloc[0]
+
+        st.header(athlete["name"])
+        st.text(
+            f"{athlete['country']} ({athlete['noc']}), "
+            f"{'Male' if athlete['sex'] == 'M' else 'Female'}"
+        )
+
+        col0, col1, col2, col3 = st.columns(4)
+        col0.metric("Games", int(athlete["games"]))
+        col1.metric("Entries", int(athlete["entries"]))
+        col2.metric("Medals", int(athlete["medals"]))
+        col3.metric("Gold", int(athlete["gold"]))
+
+        col0, col1 = st.columns(2)
+        col0.metric("First Games", athlete["first_games"])
+        col1.metric("Last Games", athlete["last_games"])
+
+        medals = [
+            {"season": season, "medal": medal, "count": int(athlete[col])}
+            for (season, medal), col in MEDAL_COLUMNS.items()
+        ]
+        if athlete["medals"]:
+            fig = px.bar(
+                medals,
+                x="season", y="count", color="medal",
+                title="Medals by Season",
+                color_discrete_map={
+                    "Gold": "gold", "Silver": "silver", "Bronze": "peru"
+                },
+            )
+            st.plotly_chart(fig)
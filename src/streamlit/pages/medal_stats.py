@@ -1,71 +1,119 @@
+import timeit
 import streamlit as st
-import pandas as pd
 import plotly.express as px
+from src.etl.transform.aggregate_medals import medal_table
+from src.etl.transform.athlete_careers import athlete_leaderboard
+from src.etl.transform.medal_cube import build_medal_cube
+from src.streamlit.data_access import (
+    ATHLETE_CAREERS,
+    MEDAL_COUNTS,
+    MEDAL_CUBE,
+    get_dataset,
+)
 
+SEX_LABELS = {"M": "Male", "F": "Female"}
 
-st.title("🏅 Medal Records")
 
-# Load data
-df = pd.read_csv("data/processed/transformed_data.csv")
+st.title("🏅 Medal Records")
 
-summer = df[df["season"] == "Summer"]
-winter = df[df["season"] == "Winter"]
+# Every filter combination is answered from the medal cube built by the
+# ETL, so widget changes never re-filter the full dataset
+medal_cube = get_dataset(MEDAL_CUBE, build=build_medal_cube)
+
+st.header("Medal Explorer")
+years = medal_cube.labels("year")
+col0, col1 = st.columns(2)
+with col0:
+    year_range = st.slider(
+        "Years", min(years), max(years), (min(years), max(years)),
+        key="explorer_years"
+    )
+with col1:
+    seasons = st.multiselect(
+        "Season", medal_cube.labels("season"),
+        placeholder="All seasons", key="explorer_seasons"
+    )
+col0, col1, col2 = st.columns(3)
+with col0:
+    sports = st.multiselect(
+        "Sport", medal_cube.labels("sport"),
+        placeholder="All sports", key="explorer_sports"
+    )
+with col1:
+    sexes = st.multiselect(
+        "Sex", medal_cube.labels("sex"), format_func=SEX_LABELS.get,
+        placeholder="Both", key="explorer_sexes"
+    )
+with col2:
+    medals = st.multiselect(
+        "Medal", medal_cube.labels("medal"),
+        placeholder="All medals", key="explorer_medals"
+    )
 
-summer_medal_count = (
-    summer
-    .groupby("country")["medal"]
-    .count()
-    .reset_index(name="medal_count")
-    .sort_values(by="medal_count", ascending=False)
+selection = dict(
+    year=tuple(year_range), season=seasons, sport=sports, sex=sexes,
+    medal=medals,
 )
-
-winter_medal_count = (
-    winter
-    .groupby("country")["medal"]
-    .count()
-    .reset_index(name="medal_count")
-    .sort_values(by="medal_count", ascending=False)
+start_time = timeit.default_timer()
+explorer_total = medal_cube.total(**selection)
+explorer_countries = medal_cube.roll_up("country", **selection).head(10)
+explorer_years = medal_cube.roll_up(["year", "medal"], **selection)
+explorer_ms = 1000 * (timeit.default_timer() - start_time)
+
+st.caption(
+    f"{explorer_total:,} medals match, "
+    f"answered from the medal cube in {explorer_ms:.1f} ms"
 )
+if explorer_total:
+    st.plotly_chart(
+        px.bar(
+            explorer_countries,
+            title="Top 10 Countries for the Selected Medals",
+            y="medal_count", x="country",
+        )
+    )
+    st.plotly_chart(
+        px.bar(
+            explorer_years.sort_values(by="year"),
+            title="Selected Medals per Games Year",
+            y="medal_count", x="year", color="medal",
+            color_discrete_map={
+                "Gold": "gold", "Silver": "silver", "Bronze": "peru"
+            },
+        )
+    )
+else:
+    st.text("No medals match the filters.")
 
-summer_and_winter_medal_count = (
-    df
-    .groupby("country")["medal"]
-    .count()
-    .reset_index(name="medal_count")
-    .sort_values(by="medal_count", ascending=False)
-)
+st.header("All-Time Records")
 
-summer_gold_medal_count = (
-    summer[summer["medal"] == "Gold"]
-    .groupby("country")["medal"]
-    .count()
-    .reset_index(name="medal_count")
-    .sort_values(by="medal_count", ascending=False)
-)
+# Load the medal counts and athlete careers summarised by the ETL, rather
+# than the full dataset
+medal_counts = get_dataset(MEDAL_COUNTS)
+athlete_careers = get_dataset(ATHLETE_CAREERS)
 
-winter_gold_medal_count = (
-    winter[winter["medal"] == "Gold"]
-    .groupby("country")["medal"]
-    .count()
-    .reset_index(name="medal_count")
-    .sort_values(by="medal_count", ascending=False)
+summer_medal_count = medal_table(medal_counts, season="Summer")
+winter_medal_count = medal_table(medal_counts, season="Winter")
+summer_and_winter_medal_count = medal_table(medal_counts)
+summer_gold_medal_count = medal_table(
+    medal_counts, season="Summer", medal="Gold"
 )
-
-summer_athlete_gold_medal_count = (
-    summer[summer["medal"] == "Gold"]
-    .groupby("name")["medal"]
-    .count()
-    .reset_index(name="medal_count")
-    .sort_values(by="medal_count", ascending=False)
+winter_gold_medal_count = medal_table(
+    medal_counts, season="Winter", medal="Gold"
 )
 
-winter_athlete_gold_medal_count = (
-    winter[winter["medal"] == "Gold"]
-    .groupby("name")["medal"]
-    .count()
-    .reset_index(name="medal_count")
-    .sort_values(by="medal_count", ascending=False)
-)
+
+def top_athletes(season, medal, top=10):
+    # Athletes are ranked by id, so namesakes are labelled with their NOC
+    leaders = athlete_leaderboard(athlete_careers, season, medal).head(top)
+    return leaders.assign(
+        athlete=leaders["name"].astype(str)
+        + " (" + leaders["noc"].astype(str) + ")"
+    )
+
+
+summer_athlete_gold_medal_count = top_athletes("Summer", "Gold")
+winter_athlete_gold_medal_count = top_athletes("Winter", "Gold")
 
 fig1 = px.bar(
     summer_medal_count.head(10),
@@ -128,16 +176,16 @@ fig7.update_layout(
 )
 
 fig8 = px.bar(
-    summer_athlete_gold_medal_count.head(10),
+    summer_athlete_gold_medal_count,
     title="Top 10 Athletes with Most Total Summer Gold Medals",
-    y="medal_count", x="name",
+    y="medal_count", x="athlete",
     color=(["red",] * 10), color_discrete_map="identity",
 )
 
 fig9 = px.bar(
-    winter_athlete_gold_medal_count.head(10),
+    winter_athlete_gold_medal_count,
     title="Top 10 Athletes with Most Total Winter Gold Medals",
-    y="medal_count", x="name",
+    y="medal_count", x="athlete",
 )
 
 st.plotly_chart(fig1)
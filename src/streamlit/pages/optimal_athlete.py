@@ -1,13 +1,21 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
+from src.etl.transform.athlete_stats import build_stats_index, lookup_stats
+from src.etl.transform.event_catalog import build_event_lookup
+from src.streamlit.data_access import (
+    ATHLETE_STATS,
+    EVENT_CATALOG,
+    get_dataset,
+)
 
 
-# Load data
-df = pd.read_csv("data/processed/transformed_data.csv")
+# Load data, shared with other pages and sessions
+event_lookup = get_dataset(EVENT_CATALOG, build=build_event_lookup)
+stats_index = get_dataset(ATHLETE_STATS, build=build_stats_index)
+SEX_CODES = {"Male": "M", "Female": "F"}
+SEX_CATEGORIES = {"Male": "men", "Female": "women"}
 
-sports = df["sport"].unique()
-sports.sort()
+sports = sorted(event_lookup)
 
 st.set_page_config(layout="wide")
 st.title("Optimal Athlete Builder")
@@ -17,13 +25,10 @@ st.text("The percentages indicate the deviation from the mean across other athle
 
 
 def get_events(sport, sex):
-    sport_df = df[df["sport"] == sport]
-    events = sport_df["event"].unique()
-    mapper = {"Male": " men's", "Female": "women's"}
-    events = [e for e in events if mapper[sex] in e]
-    events.sort()
+    sport_events = event_lookup.get(sport, {})
+    events = sport_events.get(SEX_CATEGORIES.get(sex, "all"))
     if not events:
-        return sport_df["event"].unique()
+        return sport_events.get("all", [])
     return events
 
 
@@ -58,24 +63,20 @@ with col2:
     )
 
 
-def get_avg(sport, event, is_optimal):
+def get_avg(sex, sport, event, is_optimal):
     """
-    Return: average age, height, weight for sport, event; if is_optimal,
-    then averages for Gold medalists
+    Return: average age, height, weight for sex, sport, event; if
+    is_optimal, then averages for Gold medalists
     """
-    avg_df = df[(df["sport"] == sport) & (df["event"] == event)]
-    if is_optimal:
-        avg_age = avg_df[avg_df["medal"] == "Gold"]["age"].mean()
-        avg_height = avg_df[avg_df["medal"] == "Gold"]["height_cm"].mean()
-        avg_weight = avg_df[avg_df["medal"] == "Gold"]["weight_kg"].mean()
-    else:
-        avg_age = avg_df["age"].mean()
-        avg_height = avg_df["height_cm"].mean()
-        avg_weight = avg_df["weight_kg"].mean()
-
-    return (np.round(avg_age, 1),
-            np.round(avg_height, 1),
-            np.round(avg_weight, 1))
+    # Without a chosen sex, both sexes are summarised together
+    stats = lookup_stats(
+        stats_index, SEX_CODES.get(sex), sport, event,
+        "gold" if is_optimal else "all",
+    )
+    return tuple(
+        np.round(stats.get(f"{col}_mean", np.nan), 1)
+        for col in ["age", "height_cm", "weight_kg"]
+    )
 
 
 def perc_dif(value, avg_value):
@@ -88,7 +89,7 @@ def display_card(
         opt_height, avg_height, opt_weight,
         avg_weight):
     col0, col1, col2, col3 = st.columns(4)
-    col0.metric("Sex", f"{sex}")
+    col0.metric("Sex", sex or "Any")
     col1.metric("Age", f"{opt_age}", f"{perc_dif(opt_age, avg_age)}%")
     col2.metric(
         "Height",
@@ -102,13 +103,10 @@ def display_card(
     )
 
 
-avg_age_optimal = get_avg(sport, event, True)[0]
-avg_height_optimal = get_avg(sport, event, True)[1]
-avg_weight_optimal = get_avg(sport, event, True)[2]
-
-avg_age = get_avg(sport, event, False)[0]
-avg_height = get_avg(sport, event, False)[1]
-avg_weight = get_avg(sport, event, False)[2]
+avg_age_optimal, avg_height_optimal, avg_weight_optimal = get_avg(
+    sex, sport, event, True
+)
+avg_age, avg_height, avg_weight = get_avg(sex, sport, event, False)
 
 if event:
     display_card(
@@ -146,13 +144,10 @@ with col2:
         key="event2"
     )
 
-avg_age_optimal2 = get_avg(sport2, event2, True)[0]
-avg_height_optimal2 = get_avg(sport2, event2, True)[1]
-avg_weight_optimal2 = get_avg(sport2, event2, True)[2]
-
-avg_age2 = get_avg(sport2, event2, False)[0]
-avg_height2 = get_avg(sport2, event2, False)[1]
-avg_weight2 = get_avg(sport2, event2, False)[2]
+avg_age_optimal2, avg_height_optimal2, avg_weight_optimal2 = get_avg(
+    sex2, sport2, event2, True
+)
+avg_age2, avg_height2, avg_weight2 = get_avg(sex2, sport2, event2, False)
 
 
 if event2:
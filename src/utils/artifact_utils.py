@@ -0,0 +1,187 @@
+import numpy as np
+import os
+import queue
+import threading
+import pandas as pd
+from typing import Optional, Tuple, Union
+from src.etl.defaults import ARTIFACT_MODES
+from src.etl.schema import concat_frames
+from src.utils.file_utils import ROOT_DIR, ParquetSource, write_parquet_file
+from src.utils.logging_utils import setup_logger
+
+# What an artifact can be written from
+Artifact = Union[pd.DataFrame, ParquetSource]
+
+DEFAULT_MODE = "off"
+SAMPLE_ROWS = 1_000
+MAX_QUEUED_WRITES = 2
+
+logger = setup_logger(__name__, "etl_pipeline.log")
+
+
+class ArtifactWriter:
+    """
+    Write intermediate artifacts on a background thread.
+
+    Artifacts are snapshots of a stage's output kept for inspection. They
+    are not read by later stages, so the pipeline hands them to a writer
+    thread instead of serialising them on the critical path. The queue is
+    bounded, so a slow disk applies back-pressure rather than letting
+    snapshots pile up in memory. Data left on disk as a ParquetSource is
+    copied, or sampled a row group at a time, without loading it.
+
+    Attributes:
+        mode: "off" writes nothing, "sampled" writes a fixed random
+            sample of rows and "full" writes every row.
+        sample_rows: Rows written per artifact in sampled mode.
+    """
+
+    def __init__(
+        self,
+        mode: str = DEFAULT_MODE,
+        sample_rows: int = SAMPLE_ROWS,
+        max_queued: int = MAX_QUEUED_WRITES,
+    ) -> None:
+        if mode not in ARTIFACT_MODES:
+            raise ValueError(
+                f"Unknown artifact mode '{mode}'. "
+                f"Choose from: {', '.join(ARTIFACT_MODES)}"
+            )
+        self.mode = mode
+        self.sample_rows = sample_rows
+        self.failures = 0
+        self._queue: "queue.Queue[Optional[Tuple[Artifact, str]]]" = (
+            queue.Queue(maxsize=max_queued)
+        )
+        self._thread: Optional[threading.Thread] = None
+        # Stages running at the same time may both submit the first
+        # artifact, so the thread is started under a lock
+        self._thread_lock = threading.Lock()
+
+    def submit(
+        self, df: Artifact, relative_output_dir: str, filename: str
+    ) -> None:
+        """
+        Queue a DataFrame to be written as a Parquet artifact.
+
+        A snapshot is taken before returning, so the caller can keep
+        modifying the DataFrame. Blocks while the queue is full.
+
+        Args:
+            df (Artifact): The DataFrame, or the file, to write.
+            relative_output_dir (str): The directory to save the file to,
+                relative to the project root.
+            filename (str): The name of the file to save.
+        """
+        if self.mode == "off":
+            return
+        if isinstance(df, ParquetSource):
+            # Not modified once written, so the file is its own snapshot
+            snapshot = df
+        elif self.mode == "sampled" and len(df) > self.sample_rows:
+            snapshot = df.sample(n=self.sample_rows, random_state=0)
+        else:
+            snapshot = df.copy()
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="artifact-writer", daemon=True
+                )
+                self._thread.start()
+        path = os.path.join(ROOT_DIR, relative_output_dir, filename)
+        self._queue.put((snapshot, path))
+
+    def close(self) -> None:
+        """
+        Wait for the queued artifacts to be written and stop the thread.
+        """
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            snapshot, path = item
+            try:
+                if isinstance(snapshot, ParquetSource):
+                    self._write_source(snapshot, path)
+                else:
+                    write_parquet_file(snapshot, path)
+                logger.info("Intermediate artifact saved to %s", path)
+            except Exception as e:
+                # Artifacts are diagnostic only, so a failed write is
+                # reported without failing the run
+                self.failures += 1
+                logger.warning("Failed to write artifact %s: %s", path, e)
+
+    def _write_source(self, source: ParquetSource, path: str) -> None:
+        if self.mode == "sampled" and len(source) > self.sample_rows:
+            write_parquet_file(_sample_rows(source, self.sample_rows), path)
+        else:
+            source.copy(path)
+
+
+def _sample_rows(source: ParquetSource, rows: int) -> pd.DataFrame:
+    # A fixed random sample, taken a row group at a time so the file is
+    # never read whole
+    positions = np.sort(
+        np.random.default_rng(0).choice(len(source), rows, replace=False)
+    )
+    parts = []
+    start = 0
+    for frame in source.iter_frames():
+        end = start + len(frame)
+        first, last = np.searchsorted(positions, [start, end])
+        parts.append(frame.iloc[positions[first:last] - start])
+        start = end
+    return concat_frames(parts)
+
+
+_writer = ArtifactWriter()
+
+
+def configure_intermediate_artifacts(mode: str) -> ArtifactWriter:
+    """
+    Replace the shared writer with one in the given mode.
+
+    Any artifacts queued on the previous writer are written first.
+
+    Args:
+        mode: One of ARTIFACT_MODES.
+
+    Returns:
+        ArtifactWriter: The new shared writer.
+    """
+    global _writer
+    writer = ArtifactWriter(mode)
+    _writer.close()
+    _writer = writer
+    return writer
+
+
+def save_intermediate_artifact(
+    df: Artifact, relative_output_dir: str, filename: str
+) -> None:
+    """
+    Hand an intermediate DataFrame to the shared artifact writer.
+
+    Args:
+        df (Artifact): The DataFrame, or the file, to save.
+        relative_output_dir (str): The directory to save the file to,
+            relative to the project root.
+        filename (str): The name of the file to save.
+    """
+    _writer.submit(df, relative_output_dir, filename)
+
+
+def wait_for_intermediate_artifacts() -> None:
+    """
+    Block until every queued intermediate artifact has been written.
+    """
+    _writer.close()
@@ -0,0 +1,209 @@
+import hashlib
+import inspect
+import os
+import re
+import types
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Union
+import pandas as pd
+from src.utils.file_utils import (
+    ParquetSource,
+    read_parquet_file,
+    write_parquet_file,
+)
+
+# Constants referenced by stage code are part of its version
+_VERSIONED_CONSTANTS = (str, int, float, bool, tuple, list, dict)
+
+# Checkpoints kept per output, most recently used first. Two keep the
+# previous inputs cached when switching back and forth between datasets.
+CHECKPOINTS_KEPT = 2
+
+
+def _referenced_names(code: types.CodeType) -> List[str]:
+    """Return global names used by a code object and any nested code."""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.extend(_referenced_names(const))
+    return names
+
+
+def stage_code_version(func: Callable) -> str:
+    """
+    Version stamp for the code a pipeline stage runs.
+
+    Hashes the source of the stage function, of every function from the
+    same package it calls (transitively) and the values of the constants
+    it references.
+    Editing one cleaning step therefore only invalidates the checkpoints
+    of the stages that actually run that code.
+
+    Args:
+        func: Stage function, or a functools.partial of one.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    root = func.func if isinstance(func, partial) else func
+    package = root.__module__.split(".")[0]
+    pending = [func]
+    seen = set()
+    while pending:
+        func = pending.pop()
+        if isinstance(func, partial):
+            digest.update(repr((func.args, func.keywords)).encode())
+            func = func.func
+        if not inspect.isfunction(func) or func in seen:
+            continue
+        seen.add(func)
+        digest.update(inspect.getsource(func).encode())
+        for name in _referenced_names(func.__code__):
+            value = func.__globals__.get(name)
+            if inspect.isfunction(value):
+                if value.__module__.split(".")[0] == package:
+                    pending.append(value)
+            elif isinstance(value, _VERSIONED_CONSTANTS):
+                digest.update(f"{name}={value!r}".encode())
+    return digest.hexdigest()
+
+
+def checkpoint_key(
+    stage_name: str, code_version: str, input_keys: Iterable[str]
+) -> str:
+    """
+    Content address of a stage's output.
+
+    Args:
+        stage_name: Name of the stage.
+        code_version: Version stamp from stage_code_version.
+        input_keys: Keys of the upstream checkpoints, or hashes of the raw
+            files, the stage reads.
+
+    Returns:
+        Hex SHA-256 digest identifying the stage output.
+    """
+    digest = hashlib.sha256()
+    for part in (stage_name, code_version, *input_keys):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def checkpoint_path(checkpoint_dir: str, key: str, output: str) -> str:
+    """Return the file path of one output of a checkpoint."""
+    return os.path.join(checkpoint_dir, f"{output}-{key[:16]}.parquet")
+
+
+def _on_disk_marker(path: str) -> str:
+    # Marks a checkpoint of an output that was left on disk, so it is
+    # loaded back the same way
+    return f"{path}.on_disk"
+
+
+def has_checkpoint(
+    checkpoint_dir: str, key: str, outputs: Iterable[str]
+) -> bool:
+    """Return True if every output of the checkpoint has been saved."""
+    return all(
+        os.path.exists(checkpoint_path(checkpoint_dir, key, output))
+        for output in outputs
+    )
+
+
+def save_checkpoint(
+    checkpoint_dir: str,
+    key: str,
+    outputs: Dict[str, Union[pd.DataFrame, ParquetSource]],
+) -> None:
+    """
+    Persist the outputs of a stage under its key.
+
+    Outputs already saved as Parquet are copied file to file, without
+    loading them, and load_checkpoint leaves them on disk.
+
+    Args:
+        checkpoint_dir: Directory holding the checkpoints.
+        key: Checkpoint key from checkpoint_key.
+        outputs: Output DataFrames or ParquetSources by name.
+    """
+    for output, df in outputs.items():
+        path = checkpoint_path(checkpoint_dir, key, output)
+        if isinstance(df, ParquetSource):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(_on_disk_marker(path), "w").close()
+            df.copy(path)
+        else:
+            write_parquet_file(df, path)
+
+
+def load_checkpoint(
+    checkpoint_dir: str, key: str, outputs: Iterable[str]
+) -> Dict[str, Union[pd.DataFrame, ParquetSource]]:
+    """
+    Load the outputs of a stage saved under its key.
+
+    Outputs that were a ParquetSource are returned as a ParquetSource of
+    the checkpoint file, so data too large for memory stays on disk.
+
+    Args:
+        checkpoint_dir: Directory holding the checkpoints.
+        key: Checkpoint key from checkpoint_key.
+        outputs: Names of the outputs to load.
+
+    Returns:
+        Output DataFrames or ParquetSources by name.
+    """
+    loaded: Dict[str, Union[pd.DataFrame, ParquetSource]] = {}
+    for output in outputs:
+        path = checkpoint_path(checkpoint_dir, key, output)
+        if os.path.exists(_on_disk_marker(path)):
+            loaded[output] = ParquetSource(path)
+        else:
+            loaded[output] = read_parquet_file(path)
+    return loaded
+
+
+def touch_checkpoint(
+    checkpoint_dir: str, key: str, outputs: Iterable[str]
+) -> None:
+    """Mark a checkpoint as used, so prune_checkpoints keeps it longer."""
+    for output in outputs:
+        os.utime(checkpoint_path(checkpoint_dir, key, output))
+
+
+def prune_checkpoints(
+    checkpoint_dir: str, outputs: Iterable[str], keep: int = CHECKPOINTS_KEPT
+) -> int:
+    """
+    Delete all but the most recently used checkpoints of some outputs.
+
+    Every new input or code change gives a stage a new key, so without
+    pruning superseded checkpoints pile up.
+
+    Args:
+        checkpoint_dir: Directory holding the checkpoints.
+        outputs: Names of the outputs to prune.
+        keep: Checkpoints kept per output.
+
+    Returns:
+        Number of checkpoints deleted.
+    """
+    if not os.path.isdir(checkpoint_dir):
+        return 0
+    names = os.listdir(checkpoint_dir)
+    removed = 0
+    for output in outputs:
+        pattern = re.compile(rf"{re.escape(output)}-[0-9a-f]{{16}}\.parquet")
+        paths = [
+            os.path.join(checkpoint_dir, name)
+            for name in names if pattern.fullmatch(name)
+        ]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[keep:]:
+            os.remove(path)
+            if os.path.exists(_on_disk_marker(path)):
+                os.remove(_on_disk_marker(path))
+            removed += 1
+    return removed
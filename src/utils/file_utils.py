@@ -1,5 +1,13 @@
 import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shutil
+from typing import Iterable, Iterator, List, Optional, Union
+from src.utils.logging_utils import setup_logger
+from src.utils.metrics_utils import stage_metrics
+
+logger = setup_logger(__name__, "etl_pipeline.log")
 
 
 def find_project_root(marker_file: str = "README.md") -> str:
@@ -14,7 +22,7 @@ def find_project_root(marker_file: str = "README.md") -> str:
     """
     current_dir = os.path.abspath(os.path.dirname(__file__))
     while current_dir != os.path.dirname(current_dir):
-        if marker_file in os.listdir(current_dir):
+        if os.path.exists(os.path.join(current_dir, marker_file)):
             return current_dir
         current_dir = os.path.dirname(current_dir)
     raise FileNotFoundError(
@@ -25,6 +33,14 @@ def find_project_root(marker_file: str = "README.md") -> str:
 ROOT_DIR = find_project_root()
 INDEXES_PATH = os.path.join(ROOT_DIR, "etl", "sql", "indexes")
 QUERY_PATH = os.path.join(ROOT_DIR, "etl", "sql")
+STAR_SQL_PATH = os.path.join(ROOT_DIR, "etl", "sql", "star")
+PARQUET_COMPRESSION = "zstd"
+
+# Read Parquet strings back as Arrow-backed strings rather than Python ones
+_ARROW_STRING_TYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow"),
+}
 
 
 def save_dataframe_to_csv(
@@ -41,4 +57,233 @@ def save_dataframe_to_csv(
     output_dir = os.path.join(ROOT_DIR, relative_output_dir)
     os.makedirs(output_dir, exist_ok=True)
     df.to_csv(os.path.join(output_dir, filename), index=False)
-    print(f"Data saved to {os.path.join(output_dir, filename)}")
+    logger.info("Data saved to %s", os.path.join(output_dir, filename))
+
+
+def save_dataframe_to_parquet(
+    df: pd.DataFrame, relative_output_dir: str, filename: str
+) -> None:
+    """
+    Save a pandas DataFrame to a compressed Parquet file.
+
+    Unlike CSV, Parquet keeps the column dtypes (categoricals, Arrow
+    strings, narrow numerics) and lets readers load a subset of columns.
+    The file is replaced atomically, so readers such as the app never see
+    a partially written file.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to save.
+        relative_output_dir (str): The directory to save the file to,
+            relative to the project root.
+        filename (str): The name of the file to save.
+    """
+    path = os.path.join(ROOT_DIR, relative_output_dir, filename)
+    with stage_metrics(f"save {filename}", rows_in=len(df)) as metrics:
+        write_parquet_file(df, path)
+        metrics.rows_out = len(df)
+    logger.info("Data saved to %s", path)
+
+
+def load_dataframe_from_parquet(
+    relative_path: str, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Load a DataFrame from a Parquet file, optionally only some columns.
+
+    Args:
+        relative_path (str): Path of the file, relative to the project root.
+        columns (Optional[List[str]]): Columns to read. Reads all if None.
+
+    Returns:
+        pd.DataFrame: The loaded DataFrame, with its saved dtypes.
+    """
+    return read_parquet_file(
+        os.path.join(ROOT_DIR, relative_path), columns=columns
+    )
+
+
+def read_parquet_file(
+    path: str, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a Parquet file, keeping Arrow-backed strings.
+
+    Args:
+        path (str): Absolute path of the file.
+        columns (Optional[List[str]]): Columns to read. Reads all if None.
+
+    Returns:
+        pd.DataFrame: The loaded DataFrame.
+    """
+    table = pq.read_table(path, columns=columns)
+    return table.to_pandas(types_mapper=_ARROW_STRING_TYPES.get)
+
+
+class ParquetSource:
+    """
+    A dataset saved as Parquet, read only when needed.
+
+    Stages whose output may not fit in memory return one instead of a
+    DataFrame. Consumers read it a row group at a time with iter_frames,
+    or whole (or some columns) with read_frame.
+
+    Args:
+        path: Absolute path of the file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __repr__(self) -> str:
+        return f"ParquetSource({self.path!r})"
+
+    @property
+    def num_rows(self) -> int:
+        return pq.ParquetFile(self.path).metadata.num_rows
+
+    @property
+    def columns(self) -> List[str]:
+        return pq.ParquetFile(self.path).schema_arrow.names
+
+    def iter_frames(
+        self, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the data one row group at a time.
+
+        A file without row groups yields one empty frame, so consumers
+        always see the columns.
+        """
+        parquet_file = pq.ParquetFile(self.path)
+        if not parquet_file.num_row_groups:
+            yield self.read(columns)
+        for index in range(parquet_file.num_row_groups):
+            table = parquet_file.read_row_group(index, columns=columns)
+            yield table.to_pandas(types_mapper=_ARROW_STRING_TYPES.get)
+
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the whole dataset, or some of its columns."""
+        return read_parquet_file(self.path, columns=columns)
+
+    def copy(self, path: str) -> None:
+        """Copy the file to path atomically, without loading it."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copyfile(self.path, f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+
+
+def iter_frames(
+    data: Union[pd.DataFrame, ParquetSource],
+    columns: Optional[List[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a dataset in pieces that fit in memory.
+
+    Args:
+        data: A DataFrame, yielded whole, or a ParquetSource, yielded one
+            row group at a time.
+        columns (Optional[List[str]]): Columns to read. Reads all if None.
+
+    Yields:
+        pd.DataFrame: Pieces of the dataset, in row order.
+    """
+    if isinstance(data, ParquetSource):
+        yield from data.iter_frames(columns)
+    else:
+        yield data if columns is None else data[columns]
+
+
+def read_frame(
+    data: Union[pd.DataFrame, ParquetSource],
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Load a dataset into memory, optionally only some columns.
+
+    Args:
+        data: A DataFrame or a ParquetSource.
+        columns (Optional[List[str]]): Columns to read. Reads all if None.
+
+    Returns:
+        pd.DataFrame: The dataset.
+    """
+    if isinstance(data, ParquetSource):
+        return data.read(columns)
+    return data if columns is None else data[columns]
+
+
+def write_parquet_frames(frames: Iterable[pd.DataFrame], path: str) -> int:
+    """
+    Write DataFrames to one Parquet file as they come, one or more row
+    groups each.
+
+    Only one frame is in memory at a time. Categorical columns are
+    written with a wide dictionary index, so frames with their own
+    categories, such as chunks, share the file's schema. Like
+    write_parquet_file, the file is written under a temporary name and
+    renamed into place once complete.
+
+    Args:
+        frames (Iterable[pd.DataFrame]): Frames with the same columns.
+        path (str): Absolute path of the file.
+
+    Returns:
+        int: Rows written.
+
+    Raises:
+        ValueError: If there are no frames.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    writer = None
+    rows = 0
+    try:
+        for frame in frames:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                schema = _file_schema(table.schema)
+                writer = pq.ParquetWriter(
+                    tmp_path, schema, compression=PARQUET_COMPRESSION
+                )
+            writer.write_table(table.cast(schema))
+            rows += len(frame)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError(f"No data to write to {path}")
+    os.replace(tmp_path, path)
+    return rows
+
+
+def _file_schema(schema: pa.Schema) -> pa.Schema:
+    # Frames encode categoricals with the narrowest index type and their
+    # own dictionary, so the file uses one wide index type for all frames
+    return pa.schema(
+        [
+            pa.field(field.name, pa.dictionary(pa.int32(), pa.string()))
+            if pa.types.is_dictionary(field.type) else field
+            for field in schema
+        ],
+        metadata=schema.metadata,
+    )
+
+
+def write_parquet_file(df: pd.DataFrame, path: str) -> None:
+    """
+    Write a DataFrame to Parquet atomically.
+
+    The data is written to a temporary file in the same directory and
+    renamed into place, so readers never see a partially written file.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        path (str): Absolute path of the file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    df.to_parquet(tmp_path, index=False, compression=PARQUET_COMPRESSION)
+    os.replace(tmp_path, path)
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+MANIFEST_FILE = "manifest.json"
+_READ_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        path: Path of the file to hash.
+
+    Returns:
+        Hex SHA-256 digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_READ_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_source_tree(root: str, suffix: str = ".py") -> str:
+    """
+    Hash every source file under a directory, as a code version stamp.
+
+    Args:
+        root: Directory to walk.
+        suffix: Only files ending with this suffix are hashed.
+
+    Returns:
+        Hex SHA-256 digest covering the relative paths and contents.
+    """
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(suffix):
+                continue
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, root).encode())
+            digest.update(hash_file(path).encode())
+    return digest.hexdigest()
+
+
+def compute_fingerprint(
+    input_paths: Dict[str, str], code_version: str, config: Dict[str, object]
+) -> Dict[str, object]:
+    """
+    Build a fingerprint of everything that determines the ETL outputs.
+
+    Args:
+        input_paths: Named paths of the raw input files.
+        code_version: Version stamp of the transform code.
+        config: Configuration values that affect the outputs.
+
+    Returns:
+        Dict with the per-input hashes, code version, config and a
+        combined "fingerprint" digest.
+    """
+    inputs = {name: hash_file(path) for name, path in input_paths.items()}
+    payload = {"inputs": inputs, "code_version": code_version,
+               "config": config}
+    combined = hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode()
+    ).hexdigest()
+    return {**payload, "fingerprint": combined}
+
+
+def load_manifest(output_dir: str) -> Optional[Dict[str, object]]:
+    """
+    Load the manifest stored next to the processed outputs.
+
+    Args:
+        output_dir: Directory holding the outputs and manifest.
+
+    Returns:
+        The manifest, or None if it is missing or unreadable.
+    """
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_manifest(
+    output_dir: str, fingerprint: Dict[str, object], outputs: List[str]
+) -> None:
+    """
+    Store the fingerprint of a completed run next to its outputs.
+
+    The file is written to a temporary name first and then renamed, so
+    an interrupted run never leaves a manifest claiming fresh outputs.
+
+    Args:
+        output_dir: Directory holding the outputs.
+        fingerprint: Fingerprint from compute_fingerprint.
+        outputs: Output file names, relative to output_dir.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({**fingerprint, "outputs": outputs}, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def is_up_to_date(
+    output_dir: str, fingerprint: Dict[str, object], outputs: Iterable[str]
+) -> bool:
+    """
+    Check whether the stored outputs were built from the same inputs.
+
+    Args:
+        output_dir: Directory holding the outputs and manifest.
+        fingerprint: Fingerprint of the current inputs.
+        outputs: Output file names that must all still exist.
+
+    Returns:
+        True if the manifest matches and every output is present.
+    """
+    manifest = load_manifest(output_dir)
+    if manifest is None:
+        return False
+    if manifest.get("fingerprint") != fingerprint["fingerprint"]:
+        return False
+    return all(
+        os.path.exists(os.path.join(output_dir, output)) for output in outputs
+    )
@@ -1,6 +1,35 @@
 from pathlib import Path
+import json
 import logging
-from typing import Optional, Tuple
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Tuple
+
+QUEUE_LOG_FILE = "etl.log"
+JSON_LOG_FILE = "etl.jsonl"
+# Messages let through per logger and message template per window
+DEFAULT_RATE_LIMIT = 20
+RATE_LIMIT_SECONDS = 60.0
+
+# Loggers configured by setup_logger: name -> (log file, level, base path)
+_managed_loggers: Dict[str, Tuple[str, int, Optional[str]]] = {}
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def _log_directory(base_path: Optional[str] = None) -> Path:
+    """Return the logs directory without creating it.
+
+    Args:
+        base_path: Base path for log directory. Defaults to project root.
+
+    Returns:
+        Path to the logs directory.
+    """
+    project_root = Path(base_path or __file__).resolve().parent.parent
+    return project_root / "logs"
 
 
 def _ensure_log_directory(base_path: Optional[str] = None) -> Path:
@@ -12,12 +41,28 @@ def _ensure_log_directory(base_path: Optional[str] = None) -> Path:
     Returns:
         Path to the logs directory.
     """
-    project_root = Path(base_path or __file__).resolve().parent.parent
-    log_directory = project_root / "logs"
+    log_directory = _log_directory(base_path)
     log_directory.mkdir(parents=True, exist_ok=True)
     return log_directory
 
 
+class DelayedFileHandler(logging.FileHandler):
+    """
+    File handler that creates the log directory and opens the file only
+    when the first record is written.
+
+    Modules set up their loggers at import, so this keeps importing them
+    free of file system side effects.
+    """
+
+    def __init__(self, filename: Path) -> None:
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 def _create_formatter() -> logging.Formatter:
     """Create standard log formatter with timestamp and level.
 
@@ -42,7 +87,7 @@ def _create_handlers(
     Returns:
         Tuple of file handler and console handler.
     """
-    file_handler = logging.FileHandler(log_directory / log_file)
+    file_handler = DelayedFileHandler(log_directory / log_file)
     file_handler.setLevel(level)
 
     console_handler = logging.StreamHandler()
@@ -72,21 +117,211 @@ def setup_logger(
     Returns:
         Configured logger instance.
     """
-    log_directory = _ensure_log_directory(base_path)
+    log_directory = _log_directory(base_path)
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     if not logger.handlers:
-        file_handler, console_handler = _create_handlers(
-            log_directory, log_file, level
-        )
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        _managed_loggers[name] = (log_file, level, base_path)
+        if _queue_handler is not None:
+            logger.addHandler(_queue_handler)
+        else:
+            file_handler, console_handler = _create_handlers(
+                log_directory, log_file, level
+            )
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
 
     return logger
 
 
+class JsonLinesFormatter(logging.Formatter):
+    """Format each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drop repeats of a message beyond a limit per time window.
+
+    Messages are keyed by logger and message template (the unformatted
+    msg), so "Loaded chunk %d" counts as one message however many chunks
+    there are. When a window with dropped messages ends, the next message
+    is preceded by a count of what was dropped.
+
+    Args:
+        limit: Messages let through per key and window.
+        period: Window length in seconds.
+    """
+
+    def __init__(
+        self, limit: int = DEFAULT_RATE_LIMIT,
+        period: float = RATE_LIMIT_SECONDS
+    ) -> None:
+        super().__init__()
+        self.limit = limit
+        self.period = period
+        # key -> [window start, messages in window, messages dropped]
+        self._windows: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                dropped = int(window[2]) if window else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.limit:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                return False
+        if dropped:
+            _log_dropped(record.name, record.levelno, key[1], dropped)
+        return True
+
+    def report_dropped(self) -> None:
+        """Log how many messages were dropped in the current windows."""
+        with self._lock:
+            pending = [
+                (key, int(window[2]))
+                for key, window in self._windows.items() if window[2]
+            ]
+            self._windows.clear()
+        for (name, msg), dropped in pending:
+            _log_dropped(name, logging.WARNING, msg, dropped)
+
+
+def _log_dropped(name: str, level: int, msg: str, dropped: int) -> None:
+    # Handled directly, since the level check was already passed by the
+    # dropped messages. The report has its own template, so it is not
+    # counted against the messages it reports on.
+    logger = logging.getLogger(name)
+    logger.handle(logger.makeRecord(
+        name, level, __file__, 0,
+        "Dropped %d repeats of %r by rate limit", (dropped, msg), None,
+    ))
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Queue records without formatting them.
+
+    QueueHandler formats each message before queuing it. Here the
+    message and its %-style arguments are left for the writer thread to
+    format, so a log call on a busy thread costs a filter check and a
+    queue put. Arguments must not be modified after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_queue_logging(
+    json_lines: bool = False,
+    rate_limit: Optional[int] = DEFAULT_RATE_LIMIT,
+    level: int = logging.DEBUG,
+    base_path: Optional[str] = None,
+) -> QueueListener:
+    """
+    Route every logger set up by setup_logger through one writer thread.
+
+    Log calls only put the record on a queue. A single background
+    listener formats the records and writes them to one file
+    (QUEUE_LOG_FILE, or JSON_LOG_FILE with json_lines) and the console,
+    instead of each module writing to its own file synchronously.
+    Loggers set up later are routed the same way until
+    stop_queue_logging is called.
+
+    Records logged from worker processes are not collected.
+
+    Args:
+        json_lines: Write the file as JSON lines rather than text.
+        rate_limit: Messages let through per logger and message template
+            per minute. No limit if None or 0.
+        level: Lowest level written.
+        base_path: Base path for log directory.
+
+    Returns:
+        QueueListener: The running listener.
+    """
+    global _queue_handler, _listener
+    stop_queue_logging()
+
+    file_handler = DelayedFileHandler(
+        _log_directory(base_path)
+        / (JSON_LOG_FILE if json_lines else QUEUE_LOG_FILE)
+    )
+    file_handler.setFormatter(
+        JsonLinesFormatter() if json_lines else _create_formatter()
+    )
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(_create_formatter())
+    for handler in (file_handler, console_handler):
+        handler.setLevel(level)
+
+    handler = LazyQueueHandler(queue.SimpleQueue())
+    if rate_limit:
+        handler.addFilter(RateLimitFilter(rate_limit))
+    _listener = QueueListener(
+        handler.queue, file_handler, console_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
+    _queue_handler = handler
+
+    for name in _managed_loggers:
+        logger = logging.getLogger(name)
+        for old_handler in list(logger.handlers):
+            logger.removeHandler(old_handler)
+            old_handler.close()
+        logger.addHandler(handler)
+    return _listener
+
+
+def stop_queue_logging() -> None:
+    """
+    Write out queued records, stop the writer thread and go back to the
+    synchronous per-module handlers. Does nothing if queue logging is off.
+    """
+    global _queue_handler, _listener
+    if _queue_handler is None:
+        return
+    for log_filter in _queue_handler.filters:
+        if isinstance(log_filter, RateLimitFilter):
+            log_filter.report_dropped()
+    handler, listener = _queue_handler, _listener
+    _queue_handler = _listener = None
+    listener.stop()
+    for listener_handler in listener.handlers:
+        listener_handler.close()
+
+    for name, (log_file, level, base_path) in _managed_loggers.items():
+        logger = logging.getLogger(name)
+        if handler in logger.handlers:
+            logger.removeHandler(handler)
+            file_handler, console_handler = _create_handlers(
+                _log_directory(base_path), log_file, level
+            )
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
+
+
 def log_extract_success(
     logger: logging.Logger,
     type: str,
@@ -103,16 +338,16 @@ def log_extract_success(
         execution_time: Time taken for extraction in seconds.
         expected_rate: Expected time per row threshold.
     """
-    logger.info(f"Data extraction successful for {type}!")
-    logger.info(f"Extracted {shape[0]} rows " f"and {shape[1]} columns")
-    logger.info(f"Execution time: {execution_time} seconds")
+    logger.info("Data extraction successful for %s!", type)
+    logger.info("Extracted %d rows and %d columns", shape[0], shape[1])
+    logger.info("Execution time: %s seconds", execution_time)
 
     if execution_time / shape[0] <= expected_rate:
         logger.info(
-            "Execution time per row: " f"{execution_time / shape[0]} seconds"
+            "Execution time per row: %s seconds", execution_time / shape[0]
         )
     else:
         logger.warning(
-            f"Execution time per row exceeds {expected_rate}: "
-            f"{execution_time / shape[0]} seconds"
+            "Execution time per row exceeds %s: %s seconds",
+            expected_rate, execution_time / shape[0],
         )
@@ -0,0 +1,321 @@
+import datetime
+import functools
+import json
+import os
+import threading
+import timeit
+import pandas as pd
+import psutil
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+RSS_SAMPLE_SECONDS = 0.01
+
+
+class PeakMemory:
+    """
+    Track the peak resident set size of this process while in use.
+
+    RSS is sampled on a background thread, so it covers allocations by
+    NumPy, Arrow and C extensions that tracemalloc would not see, without
+    slowing down the code being measured.
+    """
+
+    def __init__(self, interval: float = RSS_SAMPLE_SECONDS) -> None:
+        self.interval = interval
+        self.start_rss = 0
+        self.peak_rss = 0
+        self.end_rss = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PeakMemory":
+        self.start_rss = self.peak_rss = self._process.memory_info().rss
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._sample, name="rss-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.end_rss = self._process.memory_info().rss
+        self.peak_rss = max(self.peak_rss, self.end_rss)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_rss = max(
+                self.peak_rss, self._process.memory_info().rss
+            )
+
+
+@dataclass
+class StageMetrics:
+    """
+    Resource use of one run of a stage.
+
+    CPU time and RSS are those of the whole process (CPU time includes
+    finished worker processes), so stages running at the same time share
+    them.
+
+    Attributes:
+        stage: Stage name.
+        started: When the stage started, as an ISO timestamp.
+        wall_seconds: Elapsed time.
+        cpu_seconds: User and system CPU time.
+        peak_rss_mb: Highest resident set size while the stage ran.
+        peak_rss_delta_mb: How far the peak rose above the RSS at the
+            start of the stage.
+        rows_in: Rows read, if known.
+        rows_out: Rows produced, if known.
+        failed: True if the stage raised.
+    """
+
+    stage: str
+    started: str = ""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    peak_rss_delta_mb: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    failed: bool = False
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        rows = self.rows_in if self.rows_in is not None else self.rows_out
+        if rows is None or self.wall_seconds <= 0:
+            return None
+        return rows / self.wall_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = asdict(self)
+        record["rows_per_second"] = self.rows_per_second
+        return record
+
+
+class MetricsRecorder:
+    """
+    Collect the StageMetrics of a run. Safe to use from several threads.
+    """
+
+    def __init__(self) -> None:
+        self._records: List[StageMetrics] = []
+        self._lock = threading.Lock()
+
+    def record(self, metrics: StageMetrics) -> None:
+        with self._lock:
+            self._records.append(metrics)
+
+    def records(self) -> List[StageMetrics]:
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+_recorder = MetricsRecorder()
+
+
+def count_rows(value: Any) -> Optional[int]:
+    """
+    Count the rows of a DataFrame, or of the DataFrames in a tuple or list.
+
+    Datasets left on disk, such as a ParquetSource, are counted by their
+    num_rows.
+
+    Args:
+        value: A stage input or output.
+
+    Returns:
+        The number of rows, or None if value holds no DataFrame (e.g. a
+        chunk iterator).
+    """
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(getattr(value, "num_rows", None), int):
+        return value.num_rows
+    if isinstance(value, (tuple, list)):
+        counts = [count_rows(item) for item in value]
+        counts = [count for count in counts if count is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+@contextmanager
+def stage_metrics(
+    stage: str,
+    rows_in: Optional[int] = None,
+    recorder: Optional[MetricsRecorder] = None,
+) -> Iterator[StageMetrics]:
+    """
+    Measure the block as a stage and record its metrics.
+
+    Set rows_out (or rows_in) on the yielded StageMetrics inside the
+    block. The metrics are recorded even if the block raises.
+
+    Example:
+        with stage_metrics("extract") as metrics:
+            data = pd.read_csv(path)
+            metrics.rows_out = len(data)
+
+    Args:
+        stage: Stage name.
+        rows_in: Rows read by the stage, if known up front.
+        recorder: Where to record the metrics. Defaults to the shared
+            recorder reported by main_etl.
+
+    Yields:
+        StageMetrics: Filled in when the block exits.
+    """
+    metrics = StageMetrics(
+        stage,
+        started=datetime.datetime.now().isoformat(timespec="milliseconds"),
+        rows_in=rows_in,
+    )
+    process = psutil.Process()
+    start_cpu = _cpu_seconds(process)
+    start_time = timeit.default_timer()
+    memory = PeakMemory()
+    try:
+        with memory:
+            yield metrics
+    except BaseException:
+        metrics.failed = True
+        raise
+    finally:
+        metrics.wall_seconds = timeit.default_timer() - start_time
+        metrics.cpu_seconds = _cpu_seconds(process) - start_cpu
+        metrics.peak_rss_mb = memory.peak_rss / 2**20
+        metrics.peak_rss_delta_mb = (
+            memory.peak_rss - memory.start_rss
+        ) / 2**20
+        (recorder or _recorder).record(metrics)
+
+
+def instrument(
+    name: Optional[str] = None,
+    recorder: Optional[MetricsRecorder] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a stage function so every call is measured and recorded.
+
+    Rows in are counted from the DataFrame arguments, rows out from the
+    returned DataFrame or tuple of DataFrames.
+
+    Args:
+        name: Stage name. Defaults to the function's name.
+        recorder: Where to record the metrics. Defaults to the shared
+            recorder.
+
+    Returns:
+        The decorator.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        stage = name or getattr(func, "__name__", repr(func))
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            rows_in = count_rows(list(args) + list(kwargs.values()))
+            with stage_metrics(stage, rows_in, recorder) as metrics:
+                result = func(*args, **kwargs)
+                metrics.rows_out = count_rows(result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_metrics() -> List[StageMetrics]:
+    """
+    Return the metrics recorded so far, in the order stages finished.
+    """
+    return _recorder.records()
+
+
+def reset_metrics() -> None:
+    """
+    Forget the metrics recorded so far, e.g. at the start of a run.
+    """
+    _recorder.clear()
+
+
+def metrics_table(records: Optional[List[StageMetrics]] = None) -> str:
+    """
+    Format stage metrics as a human-readable table.
+
+    Args:
+        records: Metrics to format. Defaults to those recorded so far.
+
+    Returns:
+        str: One line per stage, in the order the stages started.
+    """
+    records = get_metrics() if records is None else records
+    if not records:
+        return "No stage metrics recorded"
+    table = pd.DataFrame(
+        [
+            {
+                "stage": m.stage + (" (failed)" if m.failed else ""),
+                "wall_s": m.wall_seconds,
+                "cpu_s": m.cpu_seconds,
+                "peak_rss_mb": m.peak_rss_mb,
+                "rss_delta_mb": m.peak_rss_delta_mb,
+                "rows_in": m.rows_in,
+                "rows_out": m.rows_out,
+                "rows_per_s": m.rows_per_second,
+            }
+            for m in sorted(records, key=lambda m: m.started)
+        ]
+    ).astype({"rows_in": "Int64", "rows_out": "Int64"})
+    return table.to_string(
+        index=False, na_rep="-", float_format="{:,.3f}".format
+    )
+
+
+def save_metrics_summary(
+    output_dir: str,
+    run_info: Optional[Dict[str, Any]] = None,
+    records: Optional[List[StageMetrics]] = None,
+) -> str:
+    """
+    Write the stage metrics of a run to a JSON file.
+
+    Args:
+        output_dir: Directory for the summary files.
+        run_info: Extra fields for the summary, e.g. the run's options
+            and total time.
+        records: Metrics to write. Defaults to those recorded so far.
+
+    Returns:
+        str: Path of the written file, named after the current time.
+    """
+    records = get_metrics() if records is None else records
+    now = datetime.datetime.now()
+    summary = {
+        "created": now.isoformat(timespec="seconds"),
+        **(run_info or {}),
+        "stages": [m.to_dict() for m in records],
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"etl_metrics_{now:%Y%m%d_%H%M%S}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(summary, file, indent=2, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _cpu_seconds(process: psutil.Process) -> float:
+    times = process.cpu_times()
+    return (
+        times.user + times.system + times.children_user
+        + times.children_system
+    )
@@ -0,0 +1,257 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+from src.etl.extract import extract_noc_data, extract_olympic_data
+from src.etl.transform.clean_noc_data import clean_noc_data
+from src.etl.transform.clean_olympic_data import (
+    drop_duplicates,
+    fill_missing_values,
+    standardise_column_names,
+    standardise_object_columns,
+)
+from src.etl.transform.enrich_data import create_country_columns
+from src.utils import file_utils
+from src.utils.metrics_utils import MetricsRecorder, stage_metrics
+from tests.benchmarks.synthetic_data import write_athlete_events
+
+RESULTS_DIR = os.path.join(
+    file_utils.ROOT_DIR, "tests", "benchmarks", "results"
+)
+BASELINE_FILE = "baseline.json"
+DEFAULT_SIZES = [10_000, 100_000]
+# A stage this much slower than the baseline is reported as a regression
+REGRESSION_THRESHOLD = 1.2
+
+_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a row count such as 10000, 10k or 10M.
+
+    Args:
+        text: Row count, optionally with a k or M suffix.
+
+    Returns:
+        The number of rows.
+    """
+    text = text.strip().lower().replace("_", "")
+    if text[-1:] in _SUFFIXES:
+        return int(float(text[:-1]) * _SUFFIXES[text[-1]])
+    return int(text)
+
+
+def measure(
+    stage: str, rows: int, func: Callable[..., Any], *args: Any
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run one stage, timing it and tracking its memory use.
+
+    Args:
+        stage: Stage name recorded in the result.
+        rows: Rows in the benchmark dataset.
+        func: The stage function.
+        *args: Arguments passed to func.
+
+    Returns:
+        The stage's return value and its result record.
+    """
+    # Kept out of the shared recorder reported by run_etl
+    with stage_metrics(stage, rows, MetricsRecorder()) as metrics:
+        value = func(*args)
+    return value, {
+        "rows": rows,
+        "stage": stage,
+        "seconds": metrics.wall_seconds,
+        "cpu_seconds": metrics.cpu_seconds,
+        "rows_per_second": metrics.rows_per_second,
+        "peak_rss_mb": metrics.peak_rss_mb,
+        "rss_increase_mb": metrics.peak_rss_delta_mb,
+    }
+
+
+def benchmark_size(rows: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Benchmark each ETL stage on generated data of the given size.
+
+    The generated CSV replaces the raw Olympic data and outputs go to a
+    temporary directory, so the project's data is left untouched.
+
+    Args:
+        rows: Rows of generated athlete_events data.
+        seed: Random seed of the generated data.
+
+    Returns:
+        One result record per stage.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "athlete_events.csv")
+        write_athlete_events(csv_path, rows, seed)
+        noc_data = extract_noc_data.extract_noc_data()
+        with patch.object(extract_olympic_data, "FILE_PATH", csv_path), \
+                patch.object(file_utils, "ROOT_DIR", tmp_dir):
+            results = []
+            data, result = measure(
+                "extract", rows, extract_olympic_data.extract_olympic_data
+            )
+            results.append(result)
+            for stage in (
+                drop_duplicates,
+                standardise_column_names,
+                standardise_object_columns,
+                fill_missing_values,
+            ):
+                data, result = measure(stage.__name__, rows, stage, data)
+                results.append(result)
+            noc_data, result = measure(
+                "clean_noc_data", rows, clean_noc_data, noc_data
+            )
+            results.append(result)
+            _, result = measure(
+                "create_country_columns", rows,
+                create_country_columns, data, noc_data,
+            )
+            results.append(result)
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float = REGRESSION_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Compare stage timings with a baseline run.
+
+    Args:
+        results: Result records of this run.
+        baseline: Result records of the baseline run.
+        threshold: Ratio of this run's time to the baseline's above
+            which a stage counts as a regression.
+
+    Returns:
+        DataFrame with rows, stage, seconds, baseline_seconds, ratio and
+        regression for every stage timed in both runs.
+    """
+    columns = ["rows", "stage", "seconds"]
+    comparison = pd.DataFrame(results, columns=columns).merge(
+        pd.DataFrame(baseline, columns=columns).rename(
+            columns={"seconds": "baseline_seconds"}
+        ),
+        on=["rows", "stage"],
+    )
+    comparison["ratio"] = (
+        comparison["seconds"] / comparison["baseline_seconds"]
+    )
+    comparison["regression"] = comparison["ratio"] > threshold
+    return comparison
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=file_utils.ROOT_DIR, capture_output=True, text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    sizes: List[int], seed: int = 0, results_dir: str = RESULTS_DIR
+) -> Dict[str, Any]:
+    """
+    Benchmark every size and save the results as JSON.
+
+    Args:
+        sizes: Row counts to benchmark.
+        seed: Random seed of the generated data.
+        results_dir: Directory for the JSON results.
+
+    Returns:
+        The saved report, with the environment and result records.
+    """
+    results = []
+    for rows in sizes:
+        print(f"Benchmarking {rows:,} rows...")
+        results += benchmark_size(rows, seed)
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "cpus": os.cpu_count(),
+        "seed": seed,
+        "results": results,
+    }
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(
+        results_dir,
+        f"bench_{datetime.datetime.now():%Y%m%d_%H%M%S}.json",
+    )
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results saved to {path}")
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="run_tests bench",
+        description="Benchmark the ETL stages on generated data.",
+    )
+    parser.add_argument(
+        "sizes",
+        nargs="*",
+        type=parse_size,
+        default=DEFAULT_SIZES,
+        help="Row counts to benchmark, e.g. 10k 1M 10M. "
+        "Defaults to 10k and 100k.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--baseline",
+        default=os.path.join(RESULTS_DIR, BASELINE_FILE),
+        help="Results to compare against.",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Make this run the baseline for later comparisons.",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any stage regressed.",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.seed)
+    table = pd.DataFrame(report["results"])
+    print(table.to_string(index=False, float_format="{:,.3f}".format))
+
+    regressed = False
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        comparison = compare(report["results"], baseline["results"])
+        print(f"\nCompared with {args.baseline} ({baseline['commit']}):")
+        print(comparison.to_string(index=False, float_format="{:,.3f}".format))
+        regressed = bool(comparison["regression"].any())
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    return 1 if regressed and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,224 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from src.etl.extract import extract_noc_data
+
+# Shape of the Kaggle athlete_events data (271,116 rows): about two rows
+# per athlete, 230 NOCs, 51 Games in 42 cities, 66 sports, 765 events
+ROWS_PER_ATHLETE = 2
+N_SPORTS = 66
+EVENTS_PER_SPORT = 12
+
+# Share of missing values in athlete_events
+MISSING_AGE = 0.035
+MISSING_HEIGHT = 0.22
+MISSING_WEIGHT = 0.23
+MEDAL_RATE = 0.147
+DUPLICATE_RATE = 0.005
+MALE_RATE = 0.725
+
+SPORTS = [
+    "Athletics", "Swimming", "Gymnastics", "Rowing", "Cycling", "Fencing",
+    "Shooting", "Wrestling", "Boxing", "Judo", "Sailing", "Canoeing",
+    "Weightlifting", "Equestrianism", "Hockey", "Football", "Basketball",
+    "Volleyball", "Handball", "Water Polo", "Diving", "Tennis",
+    "Table Tennis", "Badminton", "Archery", "Modern Pentathlon",
+    "Triathlon", "Taekwondo", "Cross Country Skiing", "Alpine Skiing",
+    "Biathlon", "Speed Skating", "Figure Skating", "Ice Hockey",
+    "Bobsleigh", "Luge", "Ski Jumping", "Nordic Combined", "Curling",
+    "Snowboarding", "Freestyle Skiing", "Short Track Speed Skating",
+    "Skeleton", "Art Competitions", "Golf", "Rugby", "Baseball",
+    "Softball", "Beach Volleyball", "Synchronized Swimming",
+    "Rhythmic Gymnastics", "Trampolining", "Tug-Of-War", "Polo",
+    "Lacrosse", "Cricket", "Croquet", "Motorboating", "Jeu De Paume",
+    "Rugby Sevens", "Racquets", "Roque", "Alpinism", "Aeronautics",
+    "Basque Pelota", "Military Ski Patrol",
+]
+DISCIPLINES = [
+    "100 metres", "200 metres", "400 metres", "1,500 metres",
+    "4 x 100 metres Relay", "10 kilometres", "Lightweight",
+    "Middleweight", "Heavyweight", "-60 kilograms", "Individual", "Team",
+    "Singles", "Doubles", "Pairs", "Fours", "Sprint", "All-Around",
+]
+CITIES = [
+    "Athina", "Paris", "St. Louis", "London", "Stockholm", "Antwerpen",
+    "Chamonix", "Amsterdam", "Sankt Moritz", "Los Angeles",
+    "Lake Placid", "Berlin", "Garmisch-Partenkirchen", "Helsinki",
+    "Oslo", "Cortina d'Ampezzo", "Melbourne", "Roma", "Squaw Valley",
+    "Tokyo", "Innsbruck", "Mexico City", "Grenoble", "Munich", "Sapporo",
+    "Montreal", "Moskva", "Sarajevo", "Calgary", "Seoul", "Albertville",
+    "Barcelona", "Lillehammer", "Atlanta", "Nagano", "Sydney",
+    "Salt Lake City", "Torino", "Beijing", "Vancouver", "Sochi",
+    "Rio de Janeiro",
+]
+
+
+def _games() -> pd.DataFrame:
+    # 29 Summer Games from 1896 and 22 Winter Games from 1924, as held
+    summer = [
+        year for year in range(1896, 2017, 4)
+        if year not in (1916, 1940, 1944)
+    ] + [1906]
+    winter = [
+        year for year in range(1924, 1993, 4) if year not in (1940, 1944)
+    ] + list(range(1994, 2015, 4))
+    games = pd.DataFrame(
+        {
+            "Year": summer + winter,
+            "Season": ["Summer"] * len(summer) + ["Winter"] * len(winter),
+        }
+    ).sort_values(["Year", "Season"], ignore_index=True)
+    games["Games"] = games["Year"].astype(str) + " " + games["Season"]
+    games["City"] = [
+        CITIES[index % len(CITIES)] for index in range(len(games))
+    ]
+    return games
+
+
+def _events(rng: np.random.Generator) -> pd.DataFrame:
+    # Each sport has men's and women's events and a few mixed ones
+    rows = []
+    for sport in SPORTS[:N_SPORTS]:
+        disciplines = rng.choice(
+            DISCIPLINES, size=EVENTS_PER_SPORT, replace=False
+        )
+        for index, discipline in enumerate(disciplines):
+            sex = ("Men's", "Women's", "Mixed")[
+                0 if index % 2 == 0 else (2 if index == 11 else 1)
+            ]
+            rows.append((sport, f"{sport} {sex} {discipline}", sex))
+    return pd.DataFrame(rows, columns=["Sport", "Event", "event_sex"])
+
+
+def generate_athlete_events(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Generate deterministic data shaped like Kaggle's athlete_events.
+
+    Cardinalities (athletes, NOCs, Games, sports, events) and the rates
+    of missing ages, heights, weights and medals follow the real data,
+    and about 0.5% of rows are exact duplicates. Attributes such as sex,
+    NOC, sport, height and weight are drawn per athlete, so they are
+    consistent across an athlete's rows. Every step is vectorised, so
+    10M rows take seconds rather than minutes.
+
+    Args:
+        rows: Number of rows, duplicates included.
+        seed: Random seed. The same rows and seed give the same data.
+
+    Returns:
+        DataFrame with the athlete_events columns. Text columns are
+        categorical to keep large sizes in memory.
+    """
+    rng = np.random.default_rng(seed)
+    games = _games()
+    events = _events(rng)
+    nocs = pd.read_csv(extract_noc_data.FILE_PATH)
+    noc_codes = nocs["NOC"].to_numpy()
+    team_codes, teams = pd.factorize(nocs["region"].fillna(nocs["NOC"]))
+    season_codes, seasons = pd.factorize(games["Season"])
+    city_codes, cities = pd.factorize(games["City"])
+
+    n_duplicates = int(rows * DUPLICATE_RATE)
+    n_unique = rows - n_duplicates
+    n_athletes = max(1, n_unique // ROWS_PER_ATHLETE)
+
+    # Per athlete
+    is_male = rng.random(n_athletes) < MALE_RATE
+    athlete_noc = rng.integers(0, len(noc_codes), n_athletes)
+    athlete_sport = rng.integers(0, N_SPORTS, n_athletes)
+    height = np.where(
+        is_male, rng.normal(179, 9, n_athletes), rng.normal(168, 8, n_athletes)
+    ).round()
+    weight = np.where(
+        is_male, rng.normal(76, 12, n_athletes), rng.normal(61, 9, n_athletes)
+    ).round()
+    height[rng.random(n_athletes) < MISSING_HEIGHT] = np.nan
+    weight[rng.random(n_athletes) < MISSING_WEIGHT] = np.nan
+
+    # Per row
+    athlete = rng.integers(0, n_athletes, n_unique)
+    row_male = is_male[athlete]
+    row_sport = athlete_sport[athlete]
+    # Events of the athlete's sport and sex, mixed events included
+    sport_events = events.groupby("Sport", sort=False).indices
+    event_codes = np.empty(n_unique, dtype=np.int64)
+    for sport_index, sport in enumerate(SPORTS[:N_SPORTS]):
+        positions = sport_events[sport]
+        sexes = events["event_sex"].to_numpy()[positions]
+        for male in (True, False):
+            allowed = positions[
+                (sexes == ("Men's" if male else "Women's"))
+                | (sexes == "Mixed")
+            ]
+            mask = (row_sport == sport_index) & (row_male == male)
+            event_codes[mask] = allowed[
+                rng.integers(0, len(allowed), mask.sum())
+            ]
+    # Later Games have more entries
+    weights = np.linspace(1, 4, len(games))
+    row_games = rng.choice(len(games), n_unique, p=weights / weights.sum())
+    age = rng.normal(25.5, 5.5, n_unique).clip(10, 70).round()
+    age[rng.random(n_unique) < MISSING_AGE] = np.nan
+    medal = np.full(n_unique, -1)
+    has_medal = rng.random(n_unique) < MEDAL_RATE
+    medal[has_medal] = rng.integers(0, 3, has_medal.sum())
+
+    # Duplicates are copies of random rows, placed at random positions
+    order = np.concatenate(
+        [np.arange(n_unique), rng.integers(0, n_unique, n_duplicates)]
+    )
+    order = order[rng.permutation(len(order))]
+
+    def categorical(codes: np.ndarray, categories) -> pd.Categorical:
+        return pd.Categorical.from_codes(codes[order], categories)
+
+    athlete_ids = np.arange(1, n_athletes + 1)
+    names = pd.Index([f"athlete {i}" for i in athlete_ids])
+    return pd.DataFrame(
+        {
+            "ID": athlete_ids[athlete][order].astype("int32"),
+            "Name": categorical(athlete, names),
+            "Sex": categorical(np.where(row_male, 1, 0), ["F", "M"]),
+            "Age": age[order],
+            "Height": height[athlete][order],
+            "Weight": weight[athlete][order],
+            "Team": categorical(team_codes[athlete_noc[athlete]], teams),
+            "NOC": categorical(athlete_noc[athlete], noc_codes),
+            "Games": categorical(row_games, games["Games"]),
+            "Year": games["Year"].to_numpy()[row_games][order],
+            "Season": categorical(season_codes[row_games], seasons),
+            "City": categorical(city_codes[row_games], cities),
+            "Sport": categorical(row_sport, SPORTS[:N_SPORTS]),
+            "Event": categorical(event_codes, events["Event"]),
+            "Medal": categorical(medal, ["Gold", "Silver", "Bronze"]),
+        }
+    )
+
+
+def write_athlete_events(path: str, rows: int, seed: int = 0) -> None:
+    """
+    Write generated athlete_events data to a CSV file.
+
+    Args:
+        path: CSV file to write.
+        rows: Number of rows.
+        seed: Random seed.
+    """
+    data = generate_athlete_events(rows, seed)
+    # pyarrow writes CSV many times faster than DataFrame.to_csv, which
+    # matters at 10M rows
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    table = table.cast(
+        pa.schema(
+            [
+                pa.field(field.name, pa.string())
+                if pa.types.is_dictionary(field.type) else field
+                for field in table.schema
+            ]
+        )
+    )
+    pa_csv.write_csv(
+        table, path,
+        write_options=pa_csv.WriteOptions(quoting_style="needed"),
+    )
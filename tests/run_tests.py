@@ -39,6 +39,12 @@ def main():
         subprocess.run(cov_command, shell=True)
     elif command == "lint":
         run_lint()
+    elif command == "bench":
+        # Extra arguments (sizes, --save-baseline, ...) are passed on
+        subprocess.run(
+            [sys.executable, "-m", "tests.benchmarks.run_benchmarks",
+             *sys.argv[2:]]
+        )
     else:
         raise ValueError(f"Unknown command: {command}")
 
@@ -53,6 +59,8 @@ def run_lint() -> None:
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        raise ValueError("Usage: run_tests.py <unit|component|e2e|all|lint>")
+        raise ValueError(
+            "Usage: run_tests.py <unit|component|e2e|all|lint|bench>"
+        )
     else:
         main()
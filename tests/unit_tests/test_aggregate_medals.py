@@ -0,0 +1,76 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from unittest.mock import patch
+from src.etl.transform.aggregate_medals import (
+    create_medal_counts,
+    medal_table,
+)
+from src.utils.file_utils import ParquetSource
+
+
+def _data():
+    return pd.DataFrame(
+        {
+            "name": ["Ann", "Ann", "Bo", "Cy", "Cy", "Di"],
+            "country": ["UK", "UK", "USA", "USA", "USA", "UK"],
+            "season": pd.Series(
+                ["Summer", "Winter", "Summer", "Summer", "Summer", "Summer"],
+                dtype="category",
+            ),
+            "medal": pd.Series(
+                ["Gold", "Gold", "Silver", "Gold", "Gold", "No Medal"],
+                dtype="category",
+            ),
+        }
+    )
+
+
+@patch("src.etl.transform.aggregate_medals.save_dataframe_to_parquet")
+def test_create_medal_counts_saves_compact_table(mock_save):
+    result = create_medal_counts(_data())
+
+    mock_save.assert_called_once()
+    args, _ = mock_save.call_args
+    assert args[2] == "medal_counts.parquet"
+    assert "No Medal" not in set(result["medal"])
+    assert list(result.columns) == [
+        "season", "country", "medal", "medal_count"
+    ]
+    usa = result[(result["country"] == "USA") & (result["medal"] == "Gold")]
+    assert usa["medal_count"].tolist() == [2]
+
+
+@patch("src.etl.transform.aggregate_medals.save_dataframe_to_parquet")
+def test_medal_table_matches_groupby_on_full_data(mock_save):
+    data = _data()
+    medal_counts = create_medal_counts(data)
+
+    result = medal_table(medal_counts, season="Summer")
+
+    medals = data[(data["medal"] != "No Medal")
+                  & (data["season"] == "Summer")]
+    expected = medals.groupby("country")["medal"].count()
+    assert dict(zip(result["country"], result["medal_count"])) == (
+        expected.to_dict()
+    )
+    assert result["country"].tolist() == ["USA", "UK"]
+
+
+def _parquet(data, tmp_path):
+    # Written in row groups of two rows, to be streamed
+    path = str(tmp_path / "transformed_data.parquet")
+    pq.write_table(
+        pa.Table.from_pandas(data, preserve_index=False), path,
+        row_group_size=2,
+    )
+    return ParquetSource(path)
+
+
+@patch("src.etl.transform.aggregate_medals.save_dataframe_to_parquet")
+def test_create_medal_counts_streams_row_groups(mock_save, tmp_path):
+    data = _data()
+
+    streamed = create_medal_counts(_parquet(data, tmp_path))
+
+    pd.testing.assert_frame_equal(streamed, create_medal_counts(data))
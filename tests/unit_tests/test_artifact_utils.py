@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+from src.utils import artifact_utils
+from src.utils.artifact_utils import ArtifactWriter
+from src.utils.file_utils import (
+    ParquetSource,
+    read_parquet_file,
+    write_parquet_frames,
+)
+
+
+@pytest.fixture
+def root_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_utils, "ROOT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_off_mode_writes_nothing(root_dir):
+    writer = ArtifactWriter("off")
+
+    writer.submit(pd.DataFrame({"a": [1]}), "out", "a.parquet")
+    writer.close()
+
+    assert not (root_dir / "out").exists()
+
+
+def test_full_mode_writes_snapshot_in_background(root_dir):
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    writer = ArtifactWriter("full")
+
+    writer.submit(df, "out", "a.parquet")
+    # Later changes by the caller must not leak into the artifact
+    df["b"] = 0
+    writer.close()
+
+    result = read_parquet_file(str(root_dir / "out" / "a.parquet"))
+    pd.testing.assert_frame_equal(result, pd.DataFrame({"a": [1, 2, 3]}))
+
+
+def test_sampled_mode_writes_sample_of_rows(root_dir):
+    df = pd.DataFrame({"a": range(100)})
+    writer = ArtifactWriter("sampled", sample_rows=10)
+
+    writer.submit(df, "out", "a.parquet")
+    writer.close()
+
+    result = read_parquet_file(str(root_dir / "out" / "a.parquet"))
+    assert len(result) == 10
+    assert set(result["a"]) <= set(range(100))
+
+
+def test_parquet_source_is_copied_or_sampled_from_disk(root_dir):
+    df = pd.DataFrame({"a": range(100)})
+    path = str(root_dir / "data.parquet")
+    write_parquet_frames(
+        (df.iloc[start:start + 30] for start in range(0, 100, 30)), path
+    )
+
+    full = ArtifactWriter("full")
+    full.submit(ParquetSource(path), "out", "full.parquet")
+    full.close()
+    sampled = ArtifactWriter("sampled", sample_rows=10)
+    sampled.submit(ParquetSource(path), "out", "sampled.parquet")
+    sampled.close()
+
+    result = read_parquet_file(str(root_dir / "out" / "full.parquet"))
+    pd.testing.assert_frame_equal(result, df)
+    sample = read_parquet_file(str(root_dir / "out" / "sampled.parquet"))
+    assert len(sample) == sample["a"].nunique() == 10
+    assert set(sample["a"]) <= set(range(100))
+
+
+def test_failed_write_is_counted_not_raised(root_dir, mocker):
+    mocker.patch(
+        "src.utils.artifact_utils.write_parquet_file",
+        side_effect=OSError("disk full"),
+    )
+    writer = ArtifactWriter("full")
+
+    writer.submit(pd.DataFrame({"a": [1]}), "out", "a.parquet")
+    writer.close()
+
+    assert writer.failures == 1
+
+
+def test_submit_blocks_when_queue_is_full(root_dir, mocker):
+    release = threading.Event()
+    mocker.patch(
+        "src.utils.artifact_utils.write_parquet_file",
+        side_effect=lambda df, path: release.wait(),
+    )
+    writer = ArtifactWriter("full", max_queued=1)
+    df = pd.DataFrame({"a": [1]})
+
+    # One write in progress and one queued fill the writer
+    writer.submit(df, "out", "a.parquet")
+    writer.submit(df, "out", "b.parquet")
+    blocked = threading.Thread(
+        target=writer.submit, args=(df, "out", "c.parquet")
+    )
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join()
+    writer.close()
+
+
+def test_concurrent_first_submits_start_one_thread(root_dir, monkeypatch):
+    started = []
+
+    class SlowThread(threading.Thread):
+        def __init__(self, *args, **kwargs):
+            started.append(self)
+            # Widens the window between the check and the start
+            time.sleep(0.05)
+            super().__init__(*args, **kwargs)
+
+    writer = ArtifactWriter("full")
+    monkeypatch.setattr(
+        artifact_utils, "threading", SimpleNamespace(Thread=SlowThread)
+    )
+    df = pd.DataFrame({"a": [1]})
+    submitters = [
+        threading.Thread(
+            target=writer.submit, args=(df, "out", f"{i}.parquet")
+        )
+        for i in range(4)
+    ]
+    for submitter in submitters:
+        submitter.start()
+    for submitter in submitters:
+        submitter.join()
+
+    # Checked before closing, which would wait on a second thread forever
+    assert len(started) == 1
+    writer.close()
+    assert len(os.listdir(root_dir / "out")) == 4
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match="Unknown artifact mode"):
+        ArtifactWriter("everything")
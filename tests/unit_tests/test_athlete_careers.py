@@ -0,0 +1,122 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from unittest.mock import patch
+from src.etl.transform.athlete_careers import (
+    athlete_leaderboard,
+    create_athlete_careers,
+)
+from src.utils.file_utils import ParquetSource
+
+
+@pytest.fixture
+def data():
+    # Two athletes called Ann, one of whom changed NOC
+    return pd.DataFrame({
+        "id": pd.Series([7, 3, 7, 3, 3, 9], dtype="int32"),
+        "name": ["Ann", "Ann", "Ann", "Ann", "Ann", "Bo"],
+        "sex": pd.Series(["F", "F", "F", "F", "F", "M"], dtype="category"),
+        "noc": pd.Series(
+            ["GBR", "USA", "GBR", "CAN", "CAN", "FRA"], dtype="category"
+        ),
+        "country": pd.Series(
+            ["UK", "USA", "UK", "Canada", "Canada", "France"],
+            dtype="category",
+        ),
+        "games": pd.Series(
+            ["1998 Winter", "1996 Summer", "1998 Winter", "2000 Summer",
+             "2004 Summer", "1996 Summer"],
+            dtype="category",
+        ),
+        "year": pd.Series([1998, 1996, 1998, 2000, 2004, 1996],
+                          dtype="int16"),
+        "season": pd.Series(
+            ["Winter", "Summer", "Winter", "Summer", "Summer", "Summer"],
+            dtype="category",
+        ),
+        "medal": pd.Series(
+            ["Gold", "Gold", "Silver", "No Medal", "Gold", "No Medal"],
+            dtype="category",
+        ),
+    })
+
+
+@patch("src.etl.transform.athlete_careers.save_dataframe_to_parquet")
+def test_create_athlete_careers_keys_athletes_by_id(mock_save, data):
+    result = create_athlete_careers(data)
+
+    mock_save.assert_called_once()
+    assert mock_save.call_args[0][2] == "athlete_careers.parquet"
+    assert result["id"].tolist() == [3, 7, 9]
+    assert result["name"].tolist() == ["Ann", "Ann", "Bo"]
+    assert result["entries"].tolist() == [3, 2, 1]
+    assert result["games"].tolist() == [3, 1, 1]
+    assert result["first_games"].tolist() == [
+        "1996 Summer", "1998 Winter", "1996 Summer"
+    ]
+    assert result["last_games"].tolist() == [
+        "2004 Summer", "1998 Winter", "1996 Summer"
+    ]
+    assert result["first_year"].tolist() == [1996, 1998, 1996]
+    assert result["last_year"].tolist() == [2004, 1998, 1996]
+
+
+@patch("src.etl.transform.athlete_careers.save_dataframe_to_parquet")
+def test_create_athlete_careers_counts_medals(mock_save, data):
+    result = create_athlete_careers(data).set_index("id")
+
+    assert result.loc[3, ["gold", "silver", "bronze", "medals"]].tolist() \
+        == [2, 0, 0, 2]
+    assert result.loc[7, ["winter_gold", "winter_silver"]].tolist() == [1, 1]
+    assert result.loc[9, "medals"] == 0
+
+
+@patch("src.etl.transform.athlete_careers.save_dataframe_to_parquet")
+def test_primary_noc_is_most_frequent_then_earliest(mock_save, data):
+    result = create_athlete_careers(data).set_index("id")
+
+    assert result.loc[3, "noc"] == "CAN"
+    assert result.loc[3, "country"] == "Canada"
+    assert result.loc[7, "noc"] == "GBR"
+
+    data.loc[4, "noc"] = "USA"
+    tied = create_athlete_careers(data).set_index("id")
+
+    # One entry each for USA in 1996 and CAN in 2000
+    assert tied.loc[3, "noc"] == "USA"
+
+
+@patch("src.etl.transform.athlete_careers.save_dataframe_to_parquet")
+def test_create_athlete_careers_streams_row_groups(mock_save, data, tmp_path):
+    # Ann (3) has entries in three row groups and Ann (7) in two
+    streamed = create_athlete_careers(_parquet(data, tmp_path))
+
+    pd.testing.assert_frame_equal(streamed, create_athlete_careers(data))
+
+
+@patch("src.etl.transform.athlete_careers.save_dataframe_to_parquet")
+def test_athlete_leaderboard_keeps_namesakes_apart(mock_save, data):
+    careers = create_athlete_careers(data)
+
+    result = athlete_leaderboard(careers, medal="Gold")
+
+    assert list(result.columns) == [
+        "id", "name", "noc", "country", "medal_count"
+    ]
+    assert result[["id", "name", "medal_count"]].values.tolist() == [
+        [3, "Ann", 2], [7, "Ann", 1]
+    ]
+    assert athlete_leaderboard(careers, season="Winter")[
+        "medal_count"
+    ].tolist() == [2]
+
+
+def _parquet(data, tmp_path):
+    # Written in row groups of two rows, to be streamed
+    path = str(tmp_path / "transformed_data.parquet")
+    pq.write_table(
+        pa.Table.from_pandas(data, preserve_index=False), path,
+        row_group_size=2,
+    )
+    return ParquetSource(path)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from src.etl.transform.athlete_stats import (
+    build_stats_index,
+    create_athlete_stats,
+    lookup_stats,
+)
+
+
+def _data():
+    return pd.DataFrame(
+        {
+            "sex": ["M", "M", "M", "F", "F"],
+            "sport": pd.Series(["Judo"] * 5, dtype="category"),
+            "event": ["Judo men's", "Judo men's", "Judo men's",
+                      "Judo women's", "Judo women's"],
+            "medal": ["Gold", "No Medal", "Gold", "Gold", "Silver"],
+            "age": [20.0, 30.0, 40.0, 22.0, np.nan],
+            "height_cm": [180.0, 170.0, 190.0, 165.0, 160.0],
+            "weight_kg": [80.0, 70.0, 90.0, 60.0, 58.0],
+        }
+    )
+
+
+@patch("src.etl.transform.athlete_stats.save_dataframe_to_parquet")
+def test_create_athlete_stats_matches_direct_filters(mock_save):
+    data = _data()
+
+    index = build_stats_index(create_athlete_stats(data))
+
+    men = data[data["sex"] == "M"]
+    gold = men[men["medal"] == "Gold"]
+    all_stats = index[("M", "Judo", "Judo men's", "all")]
+    gold_stats = index[("M", "Judo", "Judo men's", "gold")]
+    assert all_stats["age_mean"] == men["age"].mean()
+    assert all_stats["age_std"] == pytest.approx(men["age"].std())
+    assert all_stats["height_cm_q75"] == men["height_cm"].quantile(0.75)
+    assert gold_stats["age_mean"] == gold["age"].mean()
+    assert gold_stats["weight_kg_count"] == 2
+    mock_save.assert_called_once()
+
+
+@patch("src.etl.transform.athlete_stats.save_dataframe_to_parquet")
+def test_create_athlete_stats_keeps_sexes_apart(mock_save):
+    index = build_stats_index(create_athlete_stats(_data()))
+
+    women = index[("F", "Judo", "Judo women's", "all")]
+    assert women["age_count"] == 1
+    assert women["height_cm_mean"] == 162.5
+    assert ("F", "Judo", "Judo men's", "all") not in index
+
+
+@patch("src.etl.transform.athlete_stats.save_dataframe_to_parquet")
+def test_lookup_without_sex_covers_both_sexes(mock_save):
+    data = _data()
+    data["event"] = "Judo open"
+    index = build_stats_index(create_athlete_stats(data))
+
+    any_sex = lookup_stats(index, None, "Judo", "Judo open", "all")
+    gold = lookup_stats(index, None, "Judo", "Judo open", "gold")
+
+    assert any_sex["age_count"] == 4
+    assert any_sex["age_mean"] == data["age"].mean()
+    assert gold["height_cm_mean"] == pytest.approx(
+        data.loc[data["medal"] == "Gold", "height_cm"].mean()
+    )
+    assert lookup_stats(index, "M", "Judo", "Judo open", "all") == index[
+        ("M", "Judo", "Judo open", "all")
+    ]
+    assert lookup_stats(index, None, "Judo", "Rowing", "all") == {}
@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+from src.etl.schema import OLYMPIC_DTYPES
+from tests.benchmarks.run_benchmarks import compare, parse_size
+from tests.benchmarks.synthetic_data import (
+    MISSING_HEIGHT,
+    generate_athlete_events,
+    write_athlete_events,
+)
+
+
+class TestSyntheticData:
+    def test_is_deterministic(self):
+        first = generate_athlete_events(2_000, seed=1)
+        second = generate_athlete_events(2_000, seed=1)
+
+        pd.testing.assert_frame_equal(first, second)
+        assert not first.equals(generate_athlete_events(2_000, seed=2))
+
+    def test_matches_athlete_events_shape(self):
+        data = generate_athlete_events(20_000)
+
+        assert list(data.columns) == list(OLYMPIC_DTYPES)
+        assert len(data) == 20_000
+        assert data["Height"].isna().mean() == pytest.approx(
+            MISSING_HEIGHT, abs=0.03
+        )
+        assert 0 < data.duplicated().sum() < 200
+        # Attributes drawn per athlete agree across the athlete's rows
+        assert (data.groupby("ID")["Sex"].nunique(dropna=False) == 1).all()
+
+    def test_written_csv_reads_with_schema(self, tmp_path):
+        path = tmp_path / "athlete_events.csv"
+
+        write_athlete_events(str(path), 500)
+
+        data = pd.read_csv(path, dtype=OLYMPIC_DTYPES)
+        assert len(data) == 500
+        assert data["Medal"].isna().any()
+
+
+class TestBenchmarkRunner:
+    def test_parse_size(self):
+        assert parse_size("10k") == 10_000
+        assert parse_size("10M") == 10_000_000
+        assert parse_size("2.5k") == 2_500
+        assert parse_size("1_000") == 1_000
+
+    def test_compare_flags_regressions(self):
+        baseline = [
+            {"rows": 10, "stage": "extract", "seconds": 1.0},
+            {"rows": 10, "stage": "clean", "seconds": 1.0},
+        ]
+        results = [
+            {"rows": 10, "stage": "extract", "seconds": 1.1},
+            {"rows": 10, "stage": "clean", "seconds": 2.0},
+            {"rows": 100, "stage": "clean", "seconds": 5.0},
+        ]
+
+        comparison = compare(results, baseline, threshold=1.2)
+
+        assert comparison["stage"].tolist() == ["extract", "clean"]
+        assert comparison["regression"].tolist() == [False, True]
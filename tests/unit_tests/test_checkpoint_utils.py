@@ -0,0 +1,96 @@
+import os
+import pandas as pd
+from src.utils.file_utils import ParquetSource, write_parquet_file
+from src.utils.checkpoint_utils import (
+    stage_code_version,
+    checkpoint_key,
+    checkpoint_path,
+    has_checkpoint,
+    save_checkpoint,
+    load_checkpoint,
+    prune_checkpoints,
+    touch_checkpoint,
+)
+
+SCALE = 2
+
+
+def _helper(x):
+    return x * SCALE
+
+
+def _stage(x):
+    return _helper(x) + 1
+
+
+def test_stage_code_version_is_stable():
+    assert stage_code_version(_stage) == stage_code_version(_stage)
+    assert stage_code_version(_stage) != stage_code_version(_helper)
+
+
+def test_stage_code_version_follows_callees_and_constants(monkeypatch):
+    before = stage_code_version(_stage)
+
+    monkeypatch.setitem(globals(), "SCALE", 3)
+
+    assert stage_code_version(_stage) != before
+
+
+def test_checkpoint_key_depends_on_every_part():
+    key = checkpoint_key("stage", "v1", ["a"])
+
+    assert key == checkpoint_key("stage", "v1", ["a"])
+    assert key != checkpoint_key("other", "v1", ["a"])
+    assert key != checkpoint_key("stage", "v2", ["a"])
+    assert key != checkpoint_key("stage", "v1", ["b"])
+
+
+def test_save_and_load_checkpoint(tmp_path):
+    df = pd.DataFrame(
+        {"sport": pd.Series(["Judo"], dtype="category"), "age": [20.0]}
+    )
+
+    assert not has_checkpoint(str(tmp_path), "abc", ["cleaned"])
+
+    save_checkpoint(str(tmp_path), "abc", {"cleaned": df})
+
+    assert has_checkpoint(str(tmp_path), "abc", ["cleaned"])
+    result = load_checkpoint(str(tmp_path), "abc", ["cleaned"])
+    pd.testing.assert_frame_equal(result["cleaned"], df)
+
+
+def test_save_checkpoint_copies_parquet_sources(tmp_path):
+    df = pd.DataFrame({"age": [20.0, 31.0]})
+    path = str(tmp_path / "transformed.parquet")
+    write_parquet_file(df, path)
+
+    checkpoint_dir = str(tmp_path / "checkpoints")
+
+    save_checkpoint(
+        checkpoint_dir, "abc", {"transformed": ParquetSource(path)}
+    )
+
+    result = load_checkpoint(checkpoint_dir, "abc", ["transformed"])
+    # Left on disk, as the output was
+    assert isinstance(result["transformed"], ParquetSource)
+    assert result["transformed"].path.startswith(checkpoint_dir)
+    pd.testing.assert_frame_equal(result["transformed"].read(), df)
+
+
+def test_prune_keeps_most_recently_used_checkpoints(tmp_path):
+    df = pd.DataFrame({"age": [20.0]})
+    for when, key in enumerate(["a" * 16, "b" * 16, "c" * 16]):
+        save_checkpoint(str(tmp_path), key, {"cleaned": df, "other": df})
+        os.utime(checkpoint_path(str(tmp_path), key, "cleaned"),
+                 (when, when))
+    # Used again since, so kept over the newer "b" checkpoint
+    touch_checkpoint(str(tmp_path), "a" * 16, ["cleaned"])
+
+    removed = prune_checkpoints(str(tmp_path), ["cleaned"], keep=2)
+
+    assert removed == 1
+    assert has_checkpoint(str(tmp_path), "a" * 16, ["cleaned"])
+    assert not has_checkpoint(str(tmp_path), "b" * 16, ["cleaned"])
+    assert has_checkpoint(str(tmp_path), "c" * 16, ["cleaned"])
+    # Other outputs are left alone
+    assert has_checkpoint(str(tmp_path), "b" * 16, ["other"])
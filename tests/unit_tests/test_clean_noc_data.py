@@ -6,7 +6,7 @@ from src.etl.transform.clean_noc_data import (
 
 
 class TestCleanNocData:
-    @patch("src.etl.transform.clean_noc_data.save_dataframe_to_csv")
+    @patch("src.etl.transform.clean_noc_data.save_intermediate_artifact")
     def test_clean_noc_data(self, mock_save):
         df = pd.DataFrame(
             {
@@ -18,7 +18,7 @@ class TestCleanNocData:
         assert result["region"][0] == "Refugee Olympic Team"
         assert mock_save.called
        
-    @patch("src.etl.transform.clean_noc_data.save_dataframe_to_csv")
+    @patch("src.etl.transform.clean_noc_data.save_intermediate_artifact")
     def test_clean_noc_data_calls_save_function(self, mock_save):
         df = pd.DataFrame(
             {
@@ -32,4 +32,4 @@ class TestCleanNocData:
         mock_save.assert_called_once()
         args, kwargs = mock_save.call_args
         assert args[1] == "data/processed"
-        assert args[2] == "cleaned_noc_data.csv"
+        assert args[2] == "cleaned_noc_data.parquet"
@@ -1,11 +1,20 @@
+import os
 import pandas as pd
+import pytest
 from unittest.mock import patch
 from src.etl.transform.clean_olympic_data import (
     clean_olympic_data,
+    clean_olympic_data_chunks,
+    clean_olympic_data_parallel,
+    partition_frame,
     standardise_column_names,
     standardise_object_columns,
     drop_duplicates,
-    fill_missing_values   
+    fill_missing_values,
+    impute_missing_values,
+    key_statistics,
+    combine_key_statistics,
+    roll_up_statistics,
 )
 
 
@@ -35,6 +44,53 @@ class TestStandardiseObjectColumns:
         assert result["noc"][0] == "GBR"
         assert result["event"][0] == "Men's 100m"
 
+    def test_standardise_object_columns_keeps_dtypes(self):
+        df = pd.DataFrame(
+            {
+                "name": pd.Series(["john SMITH"], dtype="string[pyarrow]"),
+                "noc": pd.Series(["gbr"], dtype="category"),
+                "event": pd.Series(["men's 100m"], dtype="category"),
+            }
+        )
+        result = standardise_object_columns(df)
+        assert result["name"].dtype == "string[pyarrow]"
+        assert result["noc"].dtype == "category"
+        assert result["event"].dtype == "category"
+        assert result["noc"][0] == "GBR"
+
+    def test_standardise_object_columns_matches_row_wise(self):
+        values = ["gbr", "GBR", None, "usa", "o'neil smith", None, "gbr"]
+        for dtype in ["object", "category", "string[pyarrow]"]:
+            df = pd.DataFrame(
+                {
+                    "name": pd.Series(values, dtype=dtype),
+                    "noc": pd.Series(values, dtype=dtype),
+                    "event": pd.Series(values, dtype=dtype),
+                }
+            )
+            expected = df.copy()
+            for col in ["name", "noc", "event"]:
+                expected[col] = expected[col].str.title()
+            expected["event"] = expected["event"].str.capitalize()
+            expected["noc"] = expected["noc"].str.upper()
+            if dtype == "category":
+                expected = expected.astype("category")
+
+            result = standardise_object_columns(df)
+            pd.testing.assert_frame_equal(result, expected)
+
+    def test_standardise_object_columns_merges_case_variants(self):
+        df = pd.DataFrame(
+            {
+                "name": ["a", "b", "c"],
+                "noc": pd.Series(["gbr", "GBR", "Gbr"], dtype="category"),
+                "event": ["x", "y", "z"],
+            }
+        )
+        result = standardise_object_columns(df)
+        assert list(result["noc"].cat.categories) == ["GBR"]
+        assert (result["noc"] == "GBR").all()
+
 
 class TestDropDuplicates:
     def test_drop_duplicates(self):
@@ -70,9 +126,135 @@ class TestFillMissingValues:
         )
         assert result.equals(correct_result)
 
+    def test_fill_missing_values_categorical_medal(self):
+        df = pd.DataFrame(
+            {
+                "age": [20.0],
+                "height_cm": [180.0],
+                "weight_kg": [70.0],
+                "sport": pd.Series(["Judo"], dtype="category"),
+                "medal": pd.Series([None], dtype="category"),
+            }
+        )
+        result = fill_missing_values(df)
+        assert result["medal"].dtype == "category"
+        assert result["medal"][0] == "No Medal"
+
+
+class TestImputeMissingValues:
+    def test_falls_back_through_levels(self):
+        df = pd.DataFrame(
+            {
+                "event": ["100m", "100m", "100m", "Shot", "Shot", "Epee"],
+                "sex": ["M", "M", "F", "M", "M", "F"],
+                "sport": ["Athletics"] * 5 + ["Fencing"],
+                "age": [20.0, None, None, 30.0, None, None],
+            }
+        )
+
+        result, report = impute_missing_values(
+            df, columns=["age"]
+        )
+
+        # 100m men -> event+sex mean, 100m women -> sport+sex has no
+        # observed women, so sport mean, Shot men -> event+sex,
+        # fencing has no ages at all -> global mean
+        assert result["age"].tolist() == [20.0, 20.0, 25.0, 30.0, 30.0, 25.0]
+        assert report == {
+            "event+sex": {"age": 2},
+            "sport+sex": {"age": 0},
+            "sport": {"age": 1},
+            "global": {"age": 1},
+        }
+
+    def test_coarser_levels_average_observed_values_only(self):
+        df = pd.DataFrame(
+            {
+                "event": ["100m"] * 4 + ["200m", "Shot"],
+                "sex": ["M"] * 5 + ["F"],
+                "sport": ["Athletics"] * 6,
+                "age": [20.0, None, None, None, 40.0, None],
+            }
+        )
+
+        result, report = impute_missing_values(df, columns=["age"])
+
+        # Averaging the three ages filled for the 100m into the sport
+        # mean would give (4 * 20 + 40) / 5 = 24 for the women's Shot
+        assert result["age"].tolist() == [20.0, 20.0, 20.0, 20.0, 40.0, 30.0]
+        assert report["event+sex"] == {"age": 3}
+        assert report["sport"] == {"age": 1}
+
+    def test_uses_precomputed_statistics(self):
+        df = pd.DataFrame({"sport": ["Judo", "Judo"], "age": [None, 20.0]})
+        statistics = {
+            ("sport",): pd.DataFrame(
+                {"age_sum": [90.0], "age_count": [3]},
+                index=pd.Index(["Judo"], name="sport"),
+            )
+        }
+
+        result, _ = impute_missing_values(
+            df, levels=[("sport",)], statistics=statistics, columns=["age"]
+        )
+
+        assert result["age"].tolist() == [30.0, 20.0]
+
+    def test_keeps_narrow_dtype(self):
+        df = pd.DataFrame(
+            {
+                "sport": ["Judo", "Judo"],
+                "age": pd.Series([None, 20.0], dtype="float32"),
+            }
+        )
+
+        result, _ = impute_missing_values(df, columns=["age"])
+
+        assert result["age"].dtype == "float32"
+        assert result["age"][0] == 20.0
+
+
+def _group_statistics(data, keys, columns):
+    # Oracle: the observed values of each column summed and counted per
+    # group, straight from a groupby
+    stats = data.groupby(list(keys), observed=True)[columns].agg(
+        ["sum", "count"]
+    )
+    stats.columns = [f"{col}_{stat}" for col, stat in stats.columns]
+    return stats
+
+
+class TestKeyStatistics:
+    def test_combined_partitions_match_whole(self):
+        df = pd.DataFrame(
+            {
+                "sport": ["Judo", "Rowing", "Judo", "Rowing"],
+                "sex": ["M", "F", "F", "F"],
+                "age": [20.0, None, 30.0, 40.0],
+            }
+        )
+        keys = ["sport", "sex"]
+
+        combined = combine_key_statistics(
+            [
+                key_statistics(df.iloc[:2], keys, ["age"]),
+                key_statistics(df.iloc[2:], keys, ["age"]),
+            ],
+            keys,
+        )
+        levels = roll_up_statistics(combined, [("sport", "sex"), ("sport",)])
+
+        for level, result in levels.items():
+            expected = _group_statistics(df, level, ["age"])
+            pd.testing.assert_frame_equal(
+                result.loc[expected.index], expected, check_dtype=False
+            )
+        assert levels[("sport",)].loc["Judo", "age_sum"] == 50.0
+        assert levels[("sport",)].loc["Rowing", "age_count"] == 1
+
 
 class TestCleanData:
-    @patch("src.etl.transform.clean_olympic_data.save_dataframe_to_csv")
+    @patch("src.etl.transform.clean_olympic_data.save_intermediate_artifact")
     def test_clean_data_full_pipeline(self, mock_save):
         df = pd.DataFrame(
             {
@@ -100,7 +282,7 @@ class TestCleanData:
         assert result["noc"][0] == "USA"
         assert mock_save.called
 
-    @patch("src.etl.transform.clean_olympic_data.save_dataframe_to_csv")
+    @patch("src.etl.transform.clean_olympic_data.save_intermediate_artifact")
     def test_clean_customers_calls_save_function(self, mock_save):
         df = pd.DataFrame(
             {
@@ -121,5 +303,101 @@ class TestCleanData:
         mock_save.assert_called_once()
         args, kwargs = mock_save.call_args
         assert args[1] == "data/processed"
-        assert args[2] == "cleaned_data.csv"
+        assert args[2] == "cleaned_data.parquet"
+
+
+class TestCleanOlympicDataChunks:
+    @patch("src.etl.transform.clean_olympic_data.save_intermediate_artifact")
+    def test_matches_in_memory_cleaning(self, mock_save, tmp_path):
+        df = pd.DataFrame(
+            {
+                "ID": [1, 2, 1, 3, 4, 2],
+                "Name": ["john smith", "ann lee", "john smith",
+                         "JOHN SMITH", "bo ek", "ann lee"],
+                "Age": [25.0, None, 25.0, 30.0, None, None],
+                "NOC": ["usa", "gbr", "usa", "usa", "swe", "gbr"],
+                "Height": [180.0, 170.0, 180.0, None, 190.0, 170.0],
+                "Weight": [80.0, None, 80.0, 75.0, 85.0, None],
+                "Sport": ["Rowing", "Rowing", "Rowing", "Judo", "Judo",
+                          "Rowing"],
+                "Medal": ["Gold", None, "Gold", None, "Bronze", None],
+                "Event": ["rowing men's eights"] * 6,
+            }
+        )
+        chunks = [df.iloc[0:2], df.iloc[2:4], df.iloc[4:6]]
+
+        with patch(
+            "src.etl.transform.clean_olympic_data.ROOT_DIR", str(tmp_path)
+        ):
+            result = clean_olympic_data_chunks(iter(chunks))
+        expected = clean_olympic_data(df.copy())
+
+        # Written a chunk at a time to a working file, without the spill
+        # file. The artifact is left to the artifact writer.
+        assert [len(chunk) for chunk in result.iter_frames()] == [2, 1, 1]
+        assert os.listdir(tmp_path) == ["data"]
+        assert os.listdir(tmp_path / "data" / "interim") == [
+            "cleaned_data.parquet"
+        ]
+        # Text is read back as Arrow strings rather than objects
+        pd.testing.assert_frame_equal(
+            result.read(), expected, check_dtype=False
+        )
+        assert mock_save.call_args_list[0].args == (
+            result, "data/processed", "cleaned_data.parquet"
+        )
+
+
+class TestCleanOlympicDataParallel:
+    RAW = pd.DataFrame(
+        {
+            "ID": [1, 2, 1, 3, 4, 2, 5, 6],
+            "Name": ["john smith", "ann lee", "john smith", "JOHN SMITH",
+                     "bo ek", "ann lee", "li na", "eva ek"],
+            "Age": [25.0, None, 25.0, 30.0, None, None, 22.0, None],
+            "NOC": ["usa", "gbr", "usa", "usa", "swe", "gbr", "chn", "swe"],
+            "Sex": ["M", "F", "M", "M", "M", "F", "F", "F"],
+            "Games": ["2000 Summer", "2004 Summer", "2000 Summer",
+                      "2004 Summer", "2000 Summer", "2004 Summer",
+                      "2008 Summer", "2008 Summer"],
+            "Height": [180.0, 170.0, 180.0, None, 190.0, 170.0, None, None],
+            "Weight": [80.0, None, 80.0, 75.0, 85.0, None, 60.0, None],
+            "Sport": ["Rowing", "Rowing", "Rowing", "Judo", "Judo",
+                      "Rowing", "Judo", "Sailing"],
+            "Medal": ["Gold", None, "Gold", None, "Bronze", None, None,
+                      None],
+            "Event": ["rowing men's eights", "rowing women's eights",
+                      "rowing men's eights", "judo men's lightweight",
+                      "judo men's lightweight", "rowing women's eights",
+                      "judo women's lightweight", "sailing women's 470"],
+        }
+    )
+
+    @patch("src.etl.transform.clean_olympic_data.save_intermediate_artifact")
+    def test_matches_serial_cleaning(self, mock_save):
+        expected = clean_olympic_data(self.RAW.copy())
+
+        for key in ("Sport", "Games"):
+            for workers in (1, 2):
+                result = clean_olympic_data_parallel(
+                    self.RAW.copy(), workers=workers, partition_key=key
+                )
+                pd.testing.assert_frame_equal(result, expected)
+        # No sailor's age was recorded, so it is the mean of the observed
+        # ages, not of those filled in by event
+        sailing = expected.loc[expected["sport"] == "Sailing", "age"]
+        assert sailing.tolist() == [pytest.approx((25.0 + 30.0 + 22.0) / 3)]
+
+    def test_partition_frame_keeps_groups_whole(self):
+        partitions = partition_frame(self.RAW, "Sport", 2)
+
+        assert len(partitions) == 2
+        assert sum(len(part) for part in partitions) == len(self.RAW)
+        sports = [set(part["Sport"]) for part in partitions]
+        assert not sports[0] & sports[1]
+        # The largest group (Rowing, 4 rows) gets a partition of its own
+        assert sorted(len(part) for part in partitions) == [4, 4]
 
+    def test_partition_frame_unknown_key_raises(self):
+        with pytest.raises(ValueError, match="Unknown partition key"):
+            partition_frame(self.RAW, "Country", 2)
@@ -0,0 +1,104 @@
+import os
+import threading
+import pandas as pd
+import pytest
+from src.streamlit.data_access import DatasetCache
+from src.utils.file_utils import write_parquet_file
+
+DATASET = "data/processed/transformed_data.parquet"
+
+
+@pytest.fixture
+def root_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.streamlit.data_access.ROOT_DIR", str(tmp_path))
+    monkeypatch.setattr("src.utils.file_utils.ROOT_DIR", str(tmp_path))
+    write_parquet_file(
+        pd.DataFrame({"sport": ["Judo", "Rowing"], "age": [20.0, 30.0]}),
+        str(tmp_path / DATASET),
+    )
+    return tmp_path
+
+
+def _touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_second_read_is_a_hit_on_the_same_frame(root_dir):
+    cache = DatasetCache()
+
+    first = cache.get(DATASET)
+    second = cache.get(DATASET)
+
+    assert second is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_projections_are_cached_separately(root_dir):
+    cache = DatasetCache()
+
+    ages = cache.get(DATASET, columns=["age"])
+    cache.get(DATASET)
+
+    assert list(ages.columns) == ["age"]
+    assert cache.get(DATASET, columns=["age"]) is ages
+    assert cache.stats()["entries"] == 2
+
+
+def test_reloads_when_file_changes(root_dir):
+    cache = DatasetCache()
+    cache.get(DATASET)
+    write_parquet_file(
+        pd.DataFrame({"sport": ["Judo"], "age": [25.0]}),
+        str(root_dir / DATASET),
+    )
+    _touch(root_dir / DATASET)
+
+    result = cache.get(DATASET)
+
+    assert result["age"].tolist() == [25.0]
+    assert cache.stats()["misses"] == 2
+
+
+def test_reloads_when_manifest_changes(root_dir):
+    cache = DatasetCache()
+    manifest = root_dir / "data" / "processed" / "manifest.json"
+    manifest.write_text('{"fingerprint": "a"}')
+    cache.get(DATASET)
+
+    manifest.write_text('{"fingerprint": "bb"}')
+    cache.get(DATASET)
+
+    assert cache.stats()["misses"] == 2
+
+
+def test_concurrent_sessions_load_once(root_dir):
+    cache = DatasetCache()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get(DATASET)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats()["misses"] == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_build_runs_once_per_load(root_dir):
+    cache = DatasetCache()
+    calls = []
+
+    def build(df):
+        calls.append(len(df))
+        return dict(zip(df["sport"], df["age"]))
+
+    first = cache.get(DATASET, build=build)
+    second = cache.get(DATASET, build=build)
+
+    assert first == {"Judo": 20.0, "Rowing": 30.0}
+    assert second is first
+    assert calls == [2]
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from src.etl.transform import deduplicate
+from src.etl.transform.deduplicate import (
+    RowDeduplicator,
+    drop_duplicate_rows,
+)
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "ID": [1, 2, 1, 3, 2, 4, 1, 3],
+            "Name": ["a", "b", "a", "c", "b", "d", "a", "c"],
+            "Age": [20.0, None, 20.0, 30.0, None, 40.0, 21.0, 30.0],
+            "Medal": pd.Series(
+                ["Gold", None, "Gold", None, None, "Silver", "Gold", None],
+                dtype="category",
+            ),
+        }
+    )
+
+
+def _weak_hashes(data, hash_key=None):
+    # Every row gets one of two first hashes, so most rows collide
+    hashes = pd.util.hash_pandas_object(
+        data, index=False, **({"hash_key": hash_key} if hash_key else {})
+    ).to_numpy()
+    return hashes if hash_key else hashes % np.uint64(2)
+
+
+def test_drop_duplicate_rows_matches_pandas(data):
+    result, report = drop_duplicate_rows(data)
+
+    pd.testing.assert_frame_equal(result, data.drop_duplicates())
+    assert (report.rows, report.duplicates, report.collisions) == (8, 3, 0)
+    assert report.keys == {1: 1, 2: 1, 3: 1}
+    assert "Removed 3 duplicate rows of 8" in report.summary()
+
+
+def test_hash_collisions_are_verified(data):
+    with patch.object(deduplicate, "_row_hashes", _weak_hashes):
+        result, report = drop_duplicate_rows(data)
+
+    pd.testing.assert_frame_equal(result, data.drop_duplicates())
+    assert report.duplicates == 3
+    assert report.collisions == 3
+
+
+@pytest.mark.parametrize("weak", [False, True])
+def test_chunks_match_dropping_duplicates_at_once(data, weak):
+    hashes = _weak_hashes if weak else deduplicate._row_hashes
+    deduplicator = RowDeduplicator()
+    with patch.object(deduplicate, "_row_hashes", hashes):
+        chunks = [
+            deduplicator.drop_duplicates(data.iloc[start:start + 3])
+            for start in range(0, len(data), 3)
+        ]
+
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks), data.drop_duplicates()
+    )
+    assert deduplicator.report.duplicates == 3
+    assert deduplicator.report.keys == {1: 1, 2: 1, 3: 1}
@@ -1,10 +1,13 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from unittest.mock import patch
 from pandas.testing import assert_frame_equal
 from src.etl.transform.enrich_data import create_country_columns
+from src.utils.file_utils import ParquetSource
 
 
-@patch("src.etl.transform.enrich_data.save_dataframe_to_csv")
+@patch("src.etl.transform.enrich_data.save_dataframe_to_parquet")
 def test_create_country_columns_maps_country_correctly(mock_save):
     olympic_data = pd.DataFrame({
         "noc": ["USA", "GBR", "FRA"]
@@ -25,3 +28,43 @@ def test_create_country_columns_maps_country_correctly(mock_save):
     assert_frame_equal(result, expected)
 
     mock_save.assert_called_once()
+
+
+@patch("src.etl.transform.enrich_data.save_dataframe_to_parquet")
+def test_create_country_columns_keeps_categorical_dtype(mock_save):
+    olympic_data = pd.DataFrame({
+        "noc": pd.Series(["FRG", "GER"], dtype="category")
+    })
+
+    noc_data = pd.DataFrame({
+        "NOC": ["FRG", "GER"],
+        "region": ["Germany", "Germany"]
+    })
+
+    result = create_country_columns(olympic_data, noc_data)
+
+    assert result["country"].dtype == "category"
+    assert result["country"].tolist() == ["Germany", "Germany"]
+
+
+def test_create_country_columns_streams_parquet_source(tmp_path):
+    source = tmp_path / "cleaned_data.parquet"
+    pq.write_table(
+        pa.table({"noc": ["USA", "GBR", "FRA"]}), source, row_group_size=2
+    )
+    noc_data = pd.DataFrame({
+        "NOC": ["USA", "GBR", "FRA"],
+        "region": ["United States", "Great Britain", "France"]
+    })
+
+    with patch("src.etl.transform.enrich_data.ROOT_DIR", str(tmp_path)):
+        result = create_country_columns(ParquetSource(str(source)), noc_data)
+
+    assert isinstance(result, ParquetSource)
+    assert result.path == str(
+        tmp_path / "data" / "processed" / "transformed_data.parquet"
+    )
+    assert len(list(result.iter_frames())) == 2
+    assert result.read()["country"].tolist() == [
+        "United States", "Great Britain", "France"
+    ]
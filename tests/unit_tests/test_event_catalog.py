@@ -0,0 +1,71 @@
+import pandas as pd
+from unittest.mock import patch
+from src.etl.transform.event_catalog import (
+    build_event_lookup,
+    create_event_catalog,
+)
+
+
+def _data():
+    return pd.DataFrame(
+        {
+            "sport": ["Swimming", "Swimming", "Judo", "Judo", "Sailing",
+                      "Wrestling", "Swimming"],
+            "event": [
+                "Swimming women's 4 x 100 metres freestyle relay",
+                "Swimming men's 100 metres",
+                "Judo men's half-lightweight",
+                "Judo women's +78 kilograms",
+                "Sailing mixed two person heelboat",
+                "Wrestling men's featherweight, greco-roman",
+                "Swimming men's 100 metres",
+            ],
+        }
+    )
+
+
+@patch("src.etl.transform.event_catalog.save_dataframe_to_parquet")
+def test_create_event_catalog_parses_attributes(mock_save):
+    catalog = create_event_catalog(_data()).set_index("event")
+
+    assert len(catalog) == 6
+    relay = catalog.loc["Swimming women's 4 x 100 metres freestyle relay"]
+    assert relay["sex_category"] == "women"
+    assert relay["distance"] == "4 x 100 metres"
+    assert relay["discipline"] == "freestyle relay"
+    judo = catalog.loc["Judo men's half-lightweight"]
+    assert judo["weight_class"] == "half-lightweight"
+    assert pd.isna(judo["distance"])
+    assert catalog.loc["Judo women's +78 kilograms", "weight_class"] == (
+        "+78 kilograms"
+    )
+    wrestling = catalog.loc["Wrestling men's featherweight, greco-roman"]
+    assert wrestling["weight_class"] == "featherweight"
+    assert wrestling["discipline"] == "greco-roman"
+    assert catalog.loc["Sailing mixed two person heelboat",
+                       "sex_category"] == "mixed"
+    mock_save.assert_called_once()
+
+
+@patch("src.etl.transform.event_catalog.save_dataframe_to_parquet")
+def test_create_event_catalog_does_not_confuse_men_and_women(mock_save):
+    # "women's" contains "men's", which substring matching got wrong
+    catalog = create_event_catalog(_data())
+
+    women = catalog[catalog["sex_category"] == "women"]["event"]
+    assert all("women's" in event for event in women)
+    men = catalog[catalog["sex_category"] == "men"]["event"]
+    assert not any("women's" in event for event in men)
+
+
+@patch("src.etl.transform.event_catalog.save_dataframe_to_parquet")
+def test_build_event_lookup_lists_mixed_events_for_both(mock_save):
+    lookup = build_event_lookup(create_event_catalog(_data()))
+
+    assert lookup["Swimming"]["men"] == ["Swimming men's 100 metres"]
+    assert lookup["Sailing"]["men"] == lookup["Sailing"]["women"] == [
+        "Sailing mixed two person heelboat"
+    ]
+    assert lookup["Judo"]["all"] == [
+        "Judo men's half-lightweight", "Judo women's +78 kilograms"
+    ]
@@ -65,7 +65,7 @@ def test_log_extract_success_data(
 def test_log_data_error(mocker, mock_logger):
     # Mock pd.read_csv to raise an exception
     mocker.patch(
-        "src.etl.extract.extract.pd.read_csv",
+        "src.etl.extract.extract_noc_data.pd.read_csv",
         side_effect=Exception(f"Failed to load CSV file: {FILE_PATH}"),
     )
 
@@ -76,7 +76,9 @@ def test_log_data_error(mocker, mock_logger):
         extract_noc_data()
 
     # Verify that the error was logged
-    mock_logger.error.assert_called_once_with(
+    mock_logger.error.assert_called_once()
+    message, *args = mock_logger.error.call_args.args
+    assert message % tuple(args) == (
         f"Error loading {FILE_PATH}: Failed to load CSV file: {FILE_PATH}"
     )
 
@@ -1,10 +1,15 @@
 import pandas as pd
 import pytest
+from src.etl.schema import OLYMPIC_DTYPES
 from src.etl.extract.extract_olympic_data import (
     extract_olympic_data,
+    extract_olympic_data_chunks,
+    get_chunk_size,
     TYPE,
     FILE_PATH,
     EXPECTED_PERFORMANCE,
+    MIN_CHUNK_SIZE,
+    MAX_CHUNK_SIZE,
 )
 
 
@@ -65,7 +70,7 @@ def test_log_extract_success_data(
 def test_log_data_error(mocker, mock_logger):
     # Mock pd.read_csv to raise an exception
     mocker.patch(
-        "src.etl.extract.extract.pd.read_csv",
+        "src.etl.extract.extract_olympic_data.pd.read_csv",
         side_effect=Exception(f"Failed to load CSV file: {FILE_PATH}"),
     )
 
@@ -76,6 +81,55 @@ def test_log_data_error(mocker, mock_logger):
         extract_olympic_data()
 
     # Verify that the error was logged
-    mock_logger.error.assert_called_once_with(
+    mock_logger.error.assert_called_once()
+    message, *args = mock_logger.error.call_args.args
+    assert message % tuple(args) == (
         f"Error loading {FILE_PATH}: Failed to load CSV file: {FILE_PATH}"
     )
+
+
+def test_extract_olympic_data_chunks_yields_bounded_chunks(
+    mocker, tmp_path, mock_log_extract_success, mock_logger
+):
+    csv_path = tmp_path / "athlete_events.csv"
+    pd.DataFrame(
+        {"ID": range(10), "Name": [f"Athlete {i}" for i in range(10)]}
+    ).to_csv(csv_path, index=False)
+    mocker.patch(
+        "src.etl.extract.extract_olympic_data.FILE_PATH", str(csv_path)
+    )
+
+    chunks = list(extract_olympic_data_chunks(chunk_size=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert pd.concat(chunks)["ID"].tolist() == list(range(10))
+    args = mock_log_extract_success.call_args[0]
+    assert args[2] == (10, 2)
+
+
+def test_get_chunk_size_uses_available_memory(mocker, tmp_path):
+    csv_path = tmp_path / "athlete_events.csv"
+    pd.DataFrame({"ID": range(10)}).to_csv(csv_path, index=False)
+    mocker.patch(
+        "src.etl.extract.extract_olympic_data.FILE_PATH", str(csv_path)
+    )
+    mock_memory = mocker.patch(
+        "src.etl.extract.extract_olympic_data.psutil.virtual_memory"
+    )
+
+    mock_memory.return_value.available = 0
+    assert get_chunk_size() == MIN_CHUNK_SIZE
+
+    mock_memory.return_value.available = 10 ** 15
+    assert get_chunk_size() == MAX_CHUNK_SIZE
+
+
+def test_extract_olympic_data_reads_with_schema(mocker):
+    mock_read_csv = mocker.patch(
+        "src.etl.extract.extract_olympic_data.pd.read_csv",
+        return_value=pd.DataFrame({"ID": [1]}),
+    )
+
+    extract_olympic_data()
+
+    mock_read_csv.assert_called_once_with(FILE_PATH, dtype=OLYMPIC_DTYPES)
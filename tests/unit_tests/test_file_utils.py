@@ -2,8 +2,18 @@ import pytest
 import os
 import tempfile
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from unittest.mock import patch
-from src.utils.file_utils import find_project_root, save_dataframe_to_csv
+from src.utils.file_utils import (
+    ParquetSource,
+    find_project_root,
+    iter_frames,
+    read_frame,
+    save_dataframe_to_csv,
+    save_dataframe_to_parquet,
+    load_dataframe_from_parquet,
+)
 
 
 # Classes create suites inside a test file
@@ -101,9 +111,9 @@ class TestSaveDataframeToCSV:
                 expected_file = os.path.join(expected_dir, "test.csv")
                 assert os.path.exists(expected_file)
 
-    @patch("builtins.print")
-    def test_save_dataframe_prints_confirmation(self, mock_print):
-        """Test that save_dataframe_to_csv prints confirmation message."""
+    @patch("src.utils.file_utils.logger")
+    def test_save_dataframe_logs_confirmation(self, mock_logger):
+        """Test that save_dataframe_to_csv logs a confirmation message."""
         df = pd.DataFrame({"test": [1]})
 
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -111,6 +121,89 @@ class TestSaveDataframeToCSV:
                 save_dataframe_to_csv(df, "test_dir", "test.csv")
 
                 expected_path = os.path.join(temp_dir, "test_dir", "test.csv")
-                mock_print.assert_called_once_with(
-                    f"Data saved to {expected_path}"
+                mock_logger.info.assert_called_once_with(
+                    "Data saved to %s", expected_path
                 )
+
+
+class TestParquetRoundTrip:
+    def test_save_and_load_preserves_dtypes(self):
+        """Test that Parquet output keeps categorical and numeric dtypes."""
+        df = pd.DataFrame(
+            {
+                "season": pd.Series(["Summer", "Winter"], dtype="category"),
+                "name": pd.Series(["Ann", "Bo"], dtype="string[pyarrow]"),
+                "age": pd.Series([20.5, 31.0], dtype="float32"),
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("src.utils.file_utils.ROOT_DIR", temp_dir):
+                save_dataframe_to_parquet(df, "test_output", "test.parquet")
+                result = load_dataframe_from_parquet(
+                    "test_output/test.parquet"
+                )
+
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_load_projects_requested_columns(self):
+        """Test that only the requested columns are read back."""
+        df = pd.DataFrame({"a": [1], "b": [2], "c": [3]})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("src.utils.file_utils.ROOT_DIR", temp_dir):
+                save_dataframe_to_parquet(df, "out", "test.parquet")
+                result = load_dataframe_from_parquet(
+                    "out/test.parquet", columns=["c", "a"]
+                )
+
+        assert list(result.columns) == ["c", "a"]
+
+    def test_save_leaves_no_temporary_file(self):
+        """Test that the atomic write renames its temporary file away."""
+        df = pd.DataFrame({"a": [1]})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("src.utils.file_utils.ROOT_DIR", temp_dir):
+                save_dataframe_to_parquet(df, "out", "test.parquet")
+            files = os.listdir(os.path.join(temp_dir, "out"))
+
+        assert files == ["test.parquet"]
+
+
+class TestParquetSource:
+    def _source(self, tmp_path, df, row_group_size=2):
+        path = str(tmp_path / "data.parquet")
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False), path,
+            row_group_size=row_group_size,
+        )
+        return ParquetSource(path)
+
+    def test_iter_frames_reads_one_row_group_at_a_time(self, tmp_path):
+        df = pd.DataFrame({"a": range(5), "b": list("vwxyz")})
+        source = self._source(tmp_path, df)
+
+        frames = list(iter_frames(source, ["b"]))
+
+        assert [len(frame) for frame in frames] == [2, 2, 1]
+        assert all(list(frame.columns) == ["b"] for frame in frames)
+        assert len(source) == source.num_rows == 5
+        assert source.columns == ["a", "b"]
+        pd.testing.assert_frame_equal(read_frame(source, ["a"]), df[["a"]])
+
+    def test_empty_file_yields_one_empty_frame(self, tmp_path):
+        source = self._source(tmp_path, pd.DataFrame({"a": []}))
+
+        frames = list(iter_frames(source))
+
+        assert len(frames) == 1
+        assert frames[0].empty
+        assert list(frames[0].columns) == ["a"]
+
+    def test_dataframes_pass_through(self):
+        df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+
+        assert [frame is df for frame in iter_frames(df)] == [True]
+        assert read_frame(df) is df
+        assert list(read_frame(df, ["b"]).columns) == ["b"]
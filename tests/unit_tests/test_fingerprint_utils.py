@@ -0,0 +1,81 @@
+import hashlib
+from src.utils.fingerprint_utils import (
+    hash_file,
+    hash_source_tree,
+    compute_fingerprint,
+    load_manifest,
+    save_manifest,
+    is_up_to_date,
+)
+
+
+def test_hash_file_matches_sha256(tmp_path):
+    path = tmp_path / "raw.csv"
+    path.write_bytes(b"ID,Name\n1,Ann\n")
+
+    assert hash_file(str(path)) == hashlib.sha256(
+        b"ID,Name\n1,Ann\n"
+    ).hexdigest()
+
+
+def test_hash_source_tree_changes_with_code(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+    before = hash_source_tree(str(tmp_path))
+
+    (tmp_path / "notes.txt").write_text("still ignored")
+    assert hash_source_tree(str(tmp_path)) == before
+
+    (tmp_path / "a.py").write_text("x = 2\n")
+    assert hash_source_tree(str(tmp_path)) != before
+
+
+def test_compute_fingerprint_depends_on_inputs_code_and_config(tmp_path):
+    path = tmp_path / "raw.csv"
+    path.write_text("a\n1\n")
+    base = compute_fingerprint({"raw": str(path)}, "v1", {"env": "dev"})
+
+    assert base == compute_fingerprint(
+        {"raw": str(path)}, "v1", {"env": "dev"}
+    )
+    assert base["fingerprint"] != compute_fingerprint(
+        {"raw": str(path)}, "v2", {"env": "dev"}
+    )["fingerprint"]
+    assert base["fingerprint"] != compute_fingerprint(
+        {"raw": str(path)}, "v1", {"env": "prod"}
+    )["fingerprint"]
+
+    path.write_text("a\n2\n")
+    assert base["fingerprint"] != compute_fingerprint(
+        {"raw": str(path)}, "v1", {"env": "dev"}
+    )["fingerprint"]
+
+
+def test_save_and_load_manifest(tmp_path):
+    fingerprint = {"fingerprint": "abc", "inputs": {}}
+
+    save_manifest(str(tmp_path), fingerprint, ["out.parquet"])
+
+    manifest = load_manifest(str(tmp_path))
+    assert manifest["fingerprint"] == "abc"
+    assert manifest["outputs"] == ["out.parquet"]
+
+
+def test_load_manifest_missing_returns_none(tmp_path):
+    assert load_manifest(str(tmp_path)) is None
+
+
+def test_is_up_to_date(tmp_path):
+    fingerprint = {"fingerprint": "abc"}
+    save_manifest(str(tmp_path), fingerprint, ["out.parquet"])
+
+    # Output missing
+    assert not is_up_to_date(str(tmp_path), fingerprint, ["out.parquet"])
+
+    (tmp_path / "out.parquet").write_bytes(b"data")
+    assert is_up_to_date(str(tmp_path), fingerprint, ["out.parquet"])
+
+    # Inputs changed
+    assert not is_up_to_date(
+        str(tmp_path), {"fingerprint": "def"}, ["out.parquet"]
+    )
@@ -1,3 +1,4 @@
+import json
 import logging
 import tempfile
 from pathlib import Path
@@ -9,6 +10,10 @@ from src.utils.logging_utils import (
     _create_handlers,
     setup_logger,
     log_extract_success,
+    LazyQueueHandler,
+    RateLimitFilter,
+    start_queue_logging,
+    stop_queue_logging,
 )
 
 
@@ -68,18 +73,22 @@ def test_setup_logger_skips_handlers_if_already_exist(mock_get_logger):
     mock_logger.addHandler.assert_not_called()
 
 
+def _messages(method):
+    # Messages a mocked logger method was called with, formatted
+    return [c.args[0] % c.args[1:] for c in method.call_args_list]
+
+
 def test_log_extract_success_within_expected_rate():
     mock_logger = MagicMock()
 
     log_extract_success(mock_logger, "test_data", (1000, 5), 1.0, 0.002)
 
-    assert mock_logger.info.call_count == 4
-    mock_logger.info.assert_any_call(
-        "Data extraction successful for test_data!"
-    )
-    mock_logger.info.assert_any_call("Extracted 1000 rows and 5 columns")
-    mock_logger.info.assert_any_call("Execution time: 1.0 seconds")
-    mock_logger.info.assert_any_call("Execution time per row: 0.001 seconds")
+    assert _messages(mock_logger.info) == [
+        "Data extraction successful for test_data!",
+        "Extracted 1000 rows and 5 columns",
+        "Execution time: 1.0 seconds",
+        "Execution time per row: 0.001 seconds",
+    ]
     mock_logger.warning.assert_not_called()
 
 
@@ -89,6 +98,97 @@ def test_log_extract_success_exceeds_expected_rate():
     log_extract_success(mock_logger, "slow_data", (100, 3), 5.0, 0.01)
 
     assert mock_logger.info.call_count == 3
-    mock_logger.warning.assert_called_once_with(
+    assert _messages(mock_logger.warning) == [
         "Execution time per row exceeds 0.01: 0.05 seconds"
+    ]
+
+
+def _record(msg, *args, name="test"):
+    return logging.LogRecord(name, logging.INFO, __file__, 0, msg, args, None)
+
+
+def test_rate_limit_filter_drops_repeats_and_reports_them():
+    rate_limit = RateLimitFilter(limit=2, period=60)
+
+    passed = [
+        rate_limit.filter(_record("Loaded chunk %d", i)) for i in range(5)
+    ]
+
+    assert passed == [True, True, False, False, False]
+    # Other templates have their own budget
+    assert rate_limit.filter(_record("Done"))
+    with patch("src.utils.logging_utils._log_dropped") as mock_report:
+        rate_limit.report_dropped()
+    mock_report.assert_called_once_with(
+        "test", logging.WARNING, "Loaded chunk %d", 3
     )
+
+
+def test_rate_limit_filter_limits_log_calls_with_varying_args():
+    logger = logging.getLogger("test_rate_limit_varying_args")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = logging.Handler()
+    handler.emit = MagicMock()
+    handler.addFilter(RateLimitFilter(limit=2, period=60))
+    logger.addHandler(handler)
+    try:
+        for rows in range(1, 6):
+            log_extract_success(logger, "test_data", (rows, 5), 1.0, 1.0)
+    finally:
+        logger.removeHandler(handler)
+
+    messages = [c.args[0].getMessage() for c in handler.emit.call_args_list]
+    # The same templates with different rows pass only up to the limit
+    assert messages == [
+        "Data extraction successful for test_data!",
+        "Extracted 1 rows and 5 columns",
+        "Execution time: 1.0 seconds",
+        "Execution time per row: 1.0 seconds",
+        "Data extraction successful for test_data!",
+        "Extracted 2 rows and 5 columns",
+        "Execution time: 1.0 seconds",
+        "Execution time per row: 0.5 seconds",
+    ]
+
+
+def test_lazy_queue_handler_leaves_formatting_to_listener():
+    handler = LazyQueueHandler(MagicMock())
+    record = _record("Loaded %d rows", 10)
+
+    prepared = handler.prepare(record)
+
+    assert prepared.msg == "Loaded %d rows"
+    assert prepared.args == (10,)
+
+
+def test_queue_logging_writes_json_lines_through_one_listener():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        logger = setup_logger("queue_test", "queue_test.log",
+                              base_path=temp_dir)
+        try:
+            listener = start_queue_logging(
+                json_lines=True, rate_limit=None, base_path=temp_dir
+            )
+            [handler] = logger.handlers
+            assert isinstance(handler, LazyQueueHandler)
+            assert handler.queue is listener.queue
+
+            logger.info("Loaded %d rows", 42)
+        finally:
+            stop_queue_logging()
+
+        log_path = _ensure_log_directory(temp_dir) / "etl.jsonl"
+        lines = log_path.read_text().splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert {
+            "logger": "queue_test", "level": "INFO",
+            "message": "Loaded 42 rows",
+        }.items() <= entries[-1].items()
+        # Back to the per-module file and console handlers
+        file_handler, console_handler = logger.handlers
+        assert isinstance(file_handler, logging.FileHandler)
+        assert isinstance(console_handler, logging.StreamHandler)
+        for h in logger.handlers:
+            h.close()
+            logger.removeHandler(h)
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from unittest.mock import patch
+from src.etl.transform.medal_cube import (
+    DIMENSIONS,
+    build_medal_cube,
+    create_medal_cube,
+)
+from src.utils.file_utils import ParquetSource
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        "year": pd.Series([1992, 1992, 1994, 2016, 2016, 2016],
+                          dtype="int16"),
+        "season": pd.Series(
+            ["Summer", "Summer", "Winter", "Summer", "Summer", "Summer"],
+            dtype="category",
+        ),
+        "sport": pd.Series(
+            ["Judo", "Judo", "Luge", "Judo", "Rowing", "Judo"],
+            dtype="category",
+        ),
+        "sex": pd.Series(["F", "F", "M", "M", "F", "F"], dtype="category"),
+        "country": pd.Series(
+            ["UK", "UK", "USA", "USA", "UK", "France"], dtype="category"
+        ),
+        "medal": pd.Series(
+            ["Gold", "Gold", "Silver", "Bronze", "No Medal", "Gold"],
+            dtype="category",
+        ),
+    })
+
+
+@pytest.fixture
+def cube(data):
+    with patch("src.etl.transform.medal_cube.save_dataframe_to_parquet"):
+        return build_medal_cube(create_medal_cube(data))
+
+
+@patch("src.etl.transform.medal_cube.save_dataframe_to_parquet")
+def test_create_medal_cube_keeps_non_empty_cells(mock_save, data):
+    result = create_medal_cube(data)
+
+    mock_save.assert_called_once()
+    assert mock_save.call_args[0][2] == "medal_cube.parquet"
+    assert list(result.columns) == DIMENSIONS + ["medal_count"]
+    assert len(result) == 4
+    assert result["medal_count"].sum() == 5
+    assert "No Medal" not in set(result["medal"])
+
+
+@patch("src.etl.transform.medal_cube.save_dataframe_to_parquet")
+def test_create_medal_cube_streams_row_groups(mock_save, data, tmp_path):
+    streamed = create_medal_cube(_parquet(data, tmp_path))
+
+    pd.testing.assert_frame_equal(streamed, create_medal_cube(data))
+
+
+class TestMedalCube:
+    def test_axes_are_sorted_labels(self, cube):
+        assert cube.labels("year") == [1992, 1994, 2016]
+        assert cube.labels("medal") == ["Bronze", "Gold", "Silver"]
+
+    def test_roll_up_matches_groupby_on_full_data(self, cube, data):
+        result = cube.roll_up(
+            "country", year=(1992, 2016), season="Summer", sex=["F", "M"]
+        )
+
+        medals = data[
+            (data["medal"] != "No Medal") & (data["season"] == "Summer")
+        ]
+        expected = medals.groupby("country", observed=True).size()
+        assert dict(zip(result["country"], result["medal_count"])) == (
+            expected.to_dict()
+        )
+        assert result["country"].tolist() == ["UK", "France", "USA"]
+
+    def test_roll_up_along_several_axes(self, cube):
+        result = cube.roll_up(["year", "medal"], sport="Judo")
+
+        assert result.values.tolist() == [
+            [1992, "Gold", 2], [2016, "Bronze", 1], [2016, "Gold", 1]
+        ]
+
+    def test_empty_selection_keeps_whole_axis(self, cube):
+        assert cube.total(sport=[], sex=None) == 5
+        assert cube.total(year=(1993, 2000)) == 1
+        assert cube.total(sport="Fencing") == 0
+        assert cube.roll_up("country", sport="Fencing").empty
+
+    def test_mask_is_vectorised_over_cells(self, cube):
+        keep = cube.mask(sex="F")
+
+        assert keep.dtype == np.bool_
+        assert keep.sum() == 2
+
+    def test_unknown_axis_raises(self, cube):
+        with pytest.raises(ValueError, match="Unknown axis"):
+            cube.total(team="UK")
+
+
+def _parquet(data, tmp_path):
+    # Written in row groups of two rows, to be streamed
+    path = str(tmp_path / "transformed_data.parquet")
+    pq.write_table(
+        pa.Table.from_pandas(data, preserve_index=False), path,
+        row_group_size=2,
+    )
+    return ParquetSource(path)
@@ -0,0 +1,100 @@
+import json
+import pandas as pd
+import pytest
+from src.utils.file_utils import ParquetSource, write_parquet_file
+from src.utils.metrics_utils import (
+    MetricsRecorder,
+    StageMetrics,
+    count_rows,
+    instrument,
+    metrics_table,
+    save_metrics_summary,
+    stage_metrics,
+)
+
+
+class TestStageMetrics:
+    def test_context_manager_records_metrics(self):
+        recorder = MetricsRecorder()
+
+        with stage_metrics("extract", recorder=recorder) as metrics:
+            data = pd.DataFrame({"x": range(1_000)})
+            metrics.rows_out = len(data)
+
+        [recorded] = recorder.records()
+        assert recorded is metrics
+        assert recorded.stage == "extract"
+        assert recorded.rows_out == 1_000
+        assert recorded.wall_seconds > 0
+        assert recorded.cpu_seconds >= 0
+        assert recorded.peak_rss_mb > 0
+        assert recorded.rows_per_second == pytest.approx(
+            1_000 / recorded.wall_seconds
+        )
+        assert not recorded.failed
+
+    def test_failed_stage_is_recorded(self):
+        recorder = MetricsRecorder()
+
+        with pytest.raises(ValueError):
+            with stage_metrics("broken", recorder=recorder):
+                raise ValueError("boom")
+
+        assert recorder.records()[0].failed
+
+    def test_decorator_counts_rows_in_and_out(self):
+        recorder = MetricsRecorder()
+
+        @instrument(recorder=recorder)
+        def drop_first(df):
+            return df.iloc[1:]
+
+        result = drop_first(pd.DataFrame({"x": [1, 2, 3]}))
+
+        assert len(result) == 2
+        [recorded] = recorder.records()
+        assert recorded.stage == "drop_first"
+        assert (recorded.rows_in, recorded.rows_out) == (3, 2)
+
+    def test_count_rows(self):
+        df = pd.DataFrame({"x": [1, 2]})
+
+        assert count_rows(df) == 2
+        assert count_rows((df, df)) == 4
+        assert count_rows(iter([df])) is None
+
+    def test_count_rows_of_parquet_source(self, tmp_path):
+        path = str(tmp_path / "data.parquet")
+        write_parquet_file(pd.DataFrame({"x": [1, 2, 3]}), path)
+
+        assert count_rows(ParquetSource(path)) == 3
+
+
+class TestReporting:
+    RECORDS = [
+        StageMetrics("extract", started="2024-01-01T00:00:00.000",
+                     wall_seconds=2.0, rows_out=100),
+        StageMetrics("clean", started="2024-01-01T00:00:02.000",
+                     wall_seconds=1.0, rows_in=100, rows_out=90),
+    ]
+
+    def test_table_lists_stages_in_start_order(self):
+        table = metrics_table(self.RECORDS[::-1])
+
+        lines = table.splitlines()
+        assert "wall_s" in lines[0]
+        assert lines[1].split()[0] == "extract"
+        assert lines[2].split()[0] == "clean"
+
+    def test_summary_is_written_as_json(self, tmp_path):
+        path = save_metrics_summary(
+            str(tmp_path), {"wall_seconds": 3.0}, self.RECORDS
+        )
+
+        with open(path) as file:
+            summary = json.load(file)
+        assert summary["wall_seconds"] == 3.0
+        assert [s["stage"] for s in summary["stages"]] == [
+            "extract", "clean"
+        ]
+        assert summary["stages"][1]["rows_per_second"] == 100.0
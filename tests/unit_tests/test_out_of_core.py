@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from src.etl.schema import ARROW_STRING
+from src.etl.transform import out_of_core
+from src.etl.transform.clean_olympic_data import (
+    clean_olympic_data,
+    drop_duplicates,
+    standardise_column_names,
+    standardise_object_columns,
+)
+from src.etl.transform.enrich_data import add_country_column
+from src.utils.file_utils import iter_frames
+
+
+@pytest.fixture
+def raw_data():
+    return pd.DataFrame(
+        {
+            "ID": [1, 2, 1, 3, 4, 2, 5, 6, 7],
+            "Name": ["john smith", "ann lee", "john smith", "JOHN SMITH",
+                     "bo ek", "ann lee", "li na", "jo ma", "al bo"],
+            "Sex": ["M", "F", "M", "M", "F", "F", "F", "M", "M"],
+            "Age": [25.0, None, 25.0, 30.0, None, None, 21.0, None, None],
+            "NOC": ["usa", "gbr", "usa", "usa", "swe", "gbr", "sgp", "swe",
+                    "usa"],
+            "Height": [180.5, 170.0, 180.5, None, 190.0, 170.0, None, 181.0,
+                       None],
+            "Weight": [80.0, None, 80.0, 75.0, 85.0, None, 60.0, None, 90.0],
+            "Sport": ["Rowing", "Rowing", "Rowing", "Judo", "Judo",
+                      "Rowing", "Judo", None, "Judo"],
+            "Medal": ["Gold", None, "Gold", None, "Bronze", None, None,
+                      "Silver", None],
+            "Event": ["rowing men's eights", "rowing women's eights",
+                      "rowing men's eights", "judo men's open",
+                      "judo women's open", "rowing women's eights",
+                      "judo women's open", "judo men's open",
+                      "judo men's lightweight"],
+        }
+    ).astype(
+        {"Name": ARROW_STRING, "Sex": "category", "Sport": "category",
+         "Event": "category", "NOC": "category", "Medal": "category",
+         "Age": "float32", "Height": "float32", "Weight": "float32"}
+    )
+
+
+@pytest.fixture
+def noc_data():
+    return pd.DataFrame(
+        {"NOC": ["USA", "GBR", "SWE"], "region": ["USA", "UK", "Sweden"]}
+    )
+
+
+def _chunks(data, size):
+    return lambda chunk_size: (
+        data.iloc[start:start + size] for start in range(0, len(data), size)
+    )
+
+
+def _plain(data):
+    return data.astype(
+        {col: object for col in data.select_dtypes("category")}
+    ).reset_index(drop=True)
+
+
+@patch("src.etl.transform.clean_olympic_data.save_intermediate_artifact")
+def test_matches_in_memory_transform(mock_save, raw_data, noc_data,
+                                     tmp_path):
+    expected = add_country_column(clean_olympic_data(raw_data.copy()),
+                                  noc_data)
+
+    with patch.object(out_of_core, "ROOT_DIR", str(tmp_path)):
+        result = out_of_core.transform_out_of_core(
+            noc_data, chunk_size=2, read_chunks=_chunks(raw_data, 2)
+        )
+
+    assert result.path == str(
+        tmp_path / "data" / "processed" / "transformed_data.parquet"
+    )
+    assert len(result) == len(expected) == 7
+    pd.testing.assert_frame_equal(_plain(result.read()), _plain(expected))
+    # Streamed a row group per chunk of raw rows
+    chunks = list(iter_frames(result))
+    assert [len(chunk) for chunk in chunks] == [2, 1, 1, 2, 1]
+
+
+def test_first_level_statistics_match_whole_data(raw_data):
+    statistics = out_of_core.gather_statistics(_chunks(raw_data, 3)(3))
+    levels = statistics.imputation_statistics()
+
+    whole = standardise_object_columns(
+        standardise_column_names(drop_duplicates(raw_data))
+    )
+    columns = ["age", "height_cm", "weight_kg"]
+    expected = whole.groupby(["event", "sex"], observed=True)[columns].agg(
+        ["sum", "count"]
+    )
+    expected.columns = [f"{col}_{stat}" for col, stat in expected.columns]
+    result = levels[("event", "sex")].loc[expected.index, expected.columns]
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+    assert statistics.rows == 9
+    assert statistics.rows_kept == 7
+
+
+def test_raises_if_raw_data_changes_between_passes(raw_data, noc_data,
+                                                   tmp_path):
+    statistics = out_of_core.gather_statistics(_chunks(raw_data, 3)(3))
+    path = str(tmp_path / "transformed_data.parquet")
+
+    with pytest.raises(ValueError, match="raw data changed"):
+        out_of_core.write_transformed_chunks(
+            _chunks(raw_data.iloc[:7], 3)(3), statistics, noc_data, path
+        )
+    assert not (tmp_path / "transformed_data.parquet").exists()
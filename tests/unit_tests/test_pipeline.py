@@ -0,0 +1,300 @@
+import os
+import threading
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from src.etl import pipeline
+from src.etl.pipeline import (
+    Stage,
+    StageTiming,
+    build_stages,
+    critical_path,
+    run_pipeline,
+    topological_order,
+)
+from src.utils.checkpoint_utils import CHECKPOINTS_KEPT
+
+
+def _make_stages(calls):
+    def source():
+        calls.append("source")
+        return pd.DataFrame({"x": [1, 2, 3]})
+
+    def double(df):
+        calls.append("double")
+        return df.assign(x=df["x"] * 2)
+
+    def total(df):
+        calls.append("total")
+        return pd.DataFrame({"total": [df["x"].sum()]})
+
+    return [
+        Stage("source", source, outputs=("raw",)),
+        Stage("double", double, inputs=("raw",), outputs=("doubled",)),
+        Stage("total", total, inputs=("doubled",), outputs=("result",)),
+    ]
+
+
+class TestRunPipeline:
+    def test_runs_every_stage_without_checkpoints(self):
+        calls = []
+
+        result = run_pipeline(_make_stages(calls))
+
+        assert calls == ["source", "double", "total"]
+        assert result["result"]["total"][0] == 12
+
+    def test_resumes_from_checkpoints(self, tmp_path):
+        calls = []
+        run_pipeline(_make_stages(calls), checkpoint_dir=str(tmp_path))
+        calls.clear()
+
+        result = run_pipeline(
+            _make_stages(calls), checkpoint_dir=str(tmp_path)
+        )
+
+        assert calls == []
+        assert result == {}
+
+    def test_runs_single_stage_against_cached_upstream(self, tmp_path):
+        calls = []
+        run_pipeline(_make_stages(calls), checkpoint_dir=str(tmp_path))
+        calls.clear()
+
+        result = run_pipeline(
+            _make_stages(calls),
+            start="double",
+            stop="double",
+            checkpoint_dir=str(tmp_path),
+        )
+
+        assert calls == ["double"]
+        assert result["doubled"]["x"].tolist() == [2, 4, 6]
+
+    def test_runs_missing_upstream_before_range(self, tmp_path):
+        calls = []
+
+        run_pipeline(
+            _make_stages(calls),
+            start="total",
+            checkpoint_dir=str(tmp_path),
+        )
+
+        assert calls == ["source", "double", "total"]
+
+    def test_force_ignores_checkpoints(self, tmp_path):
+        calls = []
+        run_pipeline(_make_stages(calls), checkpoint_dir=str(tmp_path))
+        calls.clear()
+
+        run_pipeline(
+            _make_stages(calls), checkpoint_dir=str(tmp_path), force=True
+        )
+
+        assert calls == ["source", "double", "total"]
+
+    def test_rewrites_artifacts_left_by_other_inputs(
+            self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pipeline, "ROOT_DIR", str(tmp_path))
+        raw = tmp_path / "raw.csv"
+        artifact = tmp_path / "data.csv"
+
+        def extract():
+            return pd.read_csv(raw)
+
+        def save(df):
+            df.to_csv(artifact, index=False)
+            return df
+
+        stages = [
+            Stage("extract", extract, outputs=("raw",),
+                  sources=(str(raw),)),
+            Stage("save", save, inputs=("raw",), outputs=("saved",),
+                  artifacts=("data.csv",)),
+        ]
+        for rows in ([1, 2], [3], [1, 2]):
+            pd.DataFrame({"x": rows}).to_csv(raw, index=False)
+            run_pipeline(stages, checkpoint_dir=str(tmp_path / "ckpt"))
+
+        # The checkpoints of the first inputs are still valid, but the
+        # artifact was since written from the second
+        assert pd.read_csv(artifact)["x"].tolist() == [1, 2]
+
+    def test_keeps_only_recent_checkpoints(self, tmp_path):
+        raw = tmp_path / "raw.csv"
+        checkpoint_dir = tmp_path / "ckpt"
+        stages = [
+            Stage("extract", lambda: pd.read_csv(raw), outputs=("raw",),
+                  sources=(str(raw),)),
+        ]
+        for rows in ([1], [2], [3], [4]):
+            pd.DataFrame({"x": rows}).to_csv(raw, index=False)
+            run_pipeline(stages, checkpoint_dir=str(checkpoint_dir))
+
+        assert len(os.listdir(checkpoint_dir)) == CHECKPOINTS_KEPT
+
+    def test_unknown_stage_raises(self):
+        with pytest.raises(ValueError, match="Unknown stage 'missing'"):
+            run_pipeline(_make_stages([]), start="missing")
+
+    def test_multiple_outputs_are_split(self):
+        stages = [
+            Stage("pair", MagicMock(return_value=(1, 2)),
+                  outputs=("a", "b")),
+            Stage("add", lambda a, b: a + b, inputs=("a", "b"),
+                  outputs=("sum",)),
+        ]
+
+        assert run_pipeline(stages) == {"sum": 3}
+
+
+class TestScheduler:
+    def test_independent_stages_run_concurrently(self):
+        # Both stages must be running at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        stages = [
+            Stage("a", lambda: barrier.wait() >= 0, outputs=("a",)),
+            Stage("b", lambda: barrier.wait() >= 0, outputs=("b",)),
+            Stage("both", lambda a, b: a and b, inputs=("a", "b"),
+                  outputs=("both",)),
+        ]
+
+        assert run_pipeline(stages, workers=2) == {"both": True}
+
+    def test_records_timings_and_critical_path(self):
+        stages = [
+            Stage("slow", MagicMock(return_value=1), outputs=("slow",)),
+            Stage("fast", MagicMock(return_value=2), outputs=("fast",)),
+            Stage("add", lambda a, b: a + b, inputs=("slow", "fast"),
+                  outputs=("sum",)),
+        ]
+        timings = {}
+
+        run_pipeline(stages, workers=2, timings=timings)
+
+        assert set(timings) == {"slow", "fast", "add"}
+        assert timings["add"].start >= max(
+            timings["slow"].end, timings["fast"].end
+        )
+        path = [timing.name for timing in critical_path(stages, timings)]
+        assert path[-1] == "add" and len(path) == 2
+
+    def test_critical_path_follows_last_finished_input(self):
+        stages = [
+            Stage("a", MagicMock(), outputs=("a",)),
+            Stage("b", MagicMock(), outputs=("b",)),
+            Stage("c", MagicMock(), inputs=("a", "b"), outputs=("c",)),
+        ]
+        timings = {
+            "a": StageTiming("a", 0.0, 1.0),
+            "b": StageTiming("b", 0.0, 3.0),
+            "c": StageTiming("c", 3.0, 4.0),
+        }
+
+        path = critical_path(stages, timings)
+
+        assert [timing.name for timing in path] == ["b", "c"]
+
+    def test_stage_order_does_not_matter(self):
+        calls = []
+        stages = _make_stages(calls)[::-1]
+
+        assert [s.name for s in topological_order(stages)] == [
+            "source", "double", "total"
+        ]
+        result = run_pipeline(stages, stop="total")
+        assert result["result"]["total"][0] == 12
+
+    def test_cycle_raises(self):
+        stages = [
+            Stage("a", MagicMock(), inputs=("b",), outputs=("a",)),
+            Stage("b", MagicMock(), inputs=("a",), outputs=("b",)),
+        ]
+
+        with pytest.raises(ValueError, match="cycle"):
+            run_pipeline(stages)
+
+    def test_failed_stage_stops_downstream(self):
+        downstream = MagicMock()
+        stages = [
+            Stage("fail", MagicMock(side_effect=RuntimeError("boom")),
+                  outputs=("x",)),
+            Stage("next", downstream, inputs=("x",), outputs=("y",)),
+        ]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_pipeline(stages, workers=2)
+        downstream.assert_not_called()
+
+
+class TestBuildStages:
+    def test_stages_read_only_upstream_outputs(self):
+        for options in (
+            {}, {"stream": True}, {"out_of_core": True},
+            {"star_schema": True, "load": True, "database_url": "sqlite://"},
+        ):
+            produced = set()
+            for stage in build_stages(**options):
+                assert set(stage.inputs) <= produced
+                produced.update(stage.outputs)
+
+    def test_stream_mode_does_not_checkpoint_chunk_iterator(self):
+        stages = {stage.name: stage for stage in build_stages(stream=True)}
+
+        assert not stages["extract_olympic_data"].checkpoint
+        assert stages["extract_noc_data"].checkpoint
+
+    def test_load_stage_is_appended_only_when_requested(self):
+        assert "load_data" not in [stage.name for stage in build_stages()]
+
+        stages = build_stages(load=True, database_url="sqlite://")
+
+        assert stages[-1].name == "load_data"
+        assert stages[-1].inputs == ("transformed_data",)
+
+    def test_star_schema_stages_are_added_only_when_requested(self):
+        assert "create_star_schema" not in [
+            stage.name for stage in build_stages()
+        ]
+
+        stages = {
+            stage.name: stage
+            for stage in build_stages(
+                star_schema=True, load=True, database_url="sqlite://"
+            )
+        }
+
+        star = stages["create_star_schema"]
+        assert star.inputs == ("transformed_data", "cleaned_noc_data")
+        assert star.outputs[0] == "fact_results"
+        assert "data/processed/star/fact_results.parquet" in star.artifacts
+        assert stages["load_star_schema"].inputs == (
+            ("load_report",) + star.outputs
+        )
+
+    def test_parallel_mode_cleans_in_one_stage(self):
+        stages = build_stages(clean_workers=2, partition_key="Games")
+        clean = [
+            stage for stage in stages if stage.inputs == ("raw_olympic_data",)
+        ]
+
+        assert [stage.name for stage in clean] == ["clean_olympic_data"]
+        assert clean[0].func.keywords == {
+            "workers": 2, "partition_key": "Games"
+        }
+        with pytest.raises(ValueError):
+            build_stages(stream=True, clean_workers=2)
+
+    def test_out_of_core_mode_transforms_in_one_stage(self):
+        stages = build_stages(out_of_core=True, chunk_size=500)
+        names = [stage.name for stage in stages]
+
+        assert "extract_olympic_data" not in names
+        [transform] = [
+            stage for stage in stages if "transformed_data" in stage.outputs
+        ]
+        assert transform.name == "transform_olympic_data"
+        assert transform.inputs == ("cleaned_noc_data",)
+        assert transform.func.keywords == {"chunk_size": 500}
+        with pytest.raises(ValueError):
+            build_stages(out_of_core=True, stream=True)
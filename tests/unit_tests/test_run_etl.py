@@ -0,0 +1,111 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import patch
+from scripts.run_etl import main_etl, parse_args
+from src.etl import runner
+from src.utils.file_utils import ROOT_DIR
+from src.utils.fingerprint_utils import is_up_to_date, save_manifest
+
+# Import of scripts.run_etl plus argument parsing, in milliseconds.
+# Importing pandas alone takes several times this.
+STARTUP_BUDGET_MS = float(os.environ.get("ETL_STARTUP_BUDGET_MS", 250))
+HEAVY_MODULES = [
+    "pandas", "numpy", "pyarrow", "sqlalchemy", "src.etl.pipeline"
+]
+
+# Run in a fresh interpreter so modules imported by other tests don't
+# hide the cost
+_STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from scripts.run_etl import parse_args
+try:
+    parse_args(sys.argv[1:])
+except SystemExit:
+    pass
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"ms": elapsed, "heavy": heavy}}))
+"""
+
+
+def _startup(*argv):
+    result = subprocess.run(
+        [sys.executable, "-c",
+         _STARTUP_SCRIPT.format(heavy=HEAVY_MODULES), *argv],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        ["--stream", "--chunk-size", "1000", "--workers", "2"],
+        ["--workers", "0"],
+    ],
+)
+def test_help_and_validation_stay_within_startup_budget(argv):
+    startup = _startup(*argv)
+
+    assert startup["heavy"] == []
+    assert startup["ms"] < STARTUP_BUDGET_MS
+
+
+def test_parse_args_rejects_invalid_combinations():
+    with pytest.raises(SystemExit):
+        parse_args(["--log-json"])
+    with pytest.raises(SystemExit):
+        parse_args(["--stream", "--clean-workers", "2"])
+
+
+def test_parse_args_resolves_implied_options():
+    args = parse_args(["--stage", "transform", "--target-db-url", "sqlite://"])
+
+    assert args.from_stage == args.to_stage == "transform"
+    assert args.load
+
+
+@patch("src.etl.runner.run_etl")
+def test_main_etl_hands_parsed_options_to_runner(mock_run_etl):
+    main_etl(["--force", "--workers", "2"])
+
+    [args] = mock_run_etl.call_args.args
+    assert args.force
+    assert args.workers == 2
+
+
+def test_changing_utils_code_invalidates_manifest(tmp_path, monkeypatch):
+    code_dirs = []
+    for package in ("etl", "utils"):
+        path = tmp_path / "src" / package
+        path.mkdir(parents=True)
+        (path / "module.py").write_text("VALUE = 1\n")
+        code_dirs.append(str(path))
+    raw = tmp_path / "raw.csv"
+    raw.write_text("a\n1\n")
+    monkeypatch.setattr(runner, "ETL_CODE_DIRS", code_dirs)
+    monkeypatch.setattr(
+        runner.extract_olympic_data, "FILE_PATH", str(raw)
+    )
+    monkeypatch.setattr(runner.extract_noc_data, "FILE_PATH", str(raw))
+    output_dir = tmp_path / "processed"
+    save_manifest(str(output_dir), runner.pipeline_fingerprint(), [])
+    assert is_up_to_date(str(output_dir), runner.pipeline_fingerprint(), [])
+
+    (tmp_path / "src" / "utils" / "module.py").write_text("VALUE = 2\n")
+
+    assert not is_up_to_date(
+        str(output_dir), runner.pipeline_fingerprint(), []
+    )
+
+
+def test_fingerprint_covers_etl_and_utils_code():
+    assert runner.ETL_CODE_DIRS == [
+        os.path.join(ROOT_DIR, "src", "etl"),
+        os.path.join(ROOT_DIR, "src", "utils"),
+    ]
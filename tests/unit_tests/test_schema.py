@@ -0,0 +1,47 @@
+import pandas as pd
+from src.etl.schema import concat_frames, is_categorical, sum_by_keys
+
+
+class TestConcatFrames:
+    def test_concat_frames_keeps_categorical_dtype(self):
+        first = pd.DataFrame(
+            {"sport": pd.Series(["Judo", "Rowing"], dtype="category")}
+        )
+        second = pd.DataFrame(
+            {"sport": pd.Series(["Curling", "Judo"], dtype="category")}
+        )
+
+        result = concat_frames([first, second])
+
+        assert is_categorical(result["sport"])
+        assert result["sport"].tolist() == [
+            "Judo", "Rowing", "Curling", "Judo"
+        ]
+        assert list(result.index) == [0, 1, 2, 3]
+
+    def test_concat_frames_leaves_other_columns_alone(self):
+        first = pd.DataFrame({"age": [20.0], "name": ["Ann"]})
+        second = pd.DataFrame({"age": [25.0], "name": ["Bo"]})
+
+        result = concat_frames([first, second])
+
+        assert result["age"].dtype == "float64"
+        assert result["name"].tolist() == ["Ann", "Bo"]
+
+
+class TestSumByKeys:
+    def test_adds_up_parts_with_different_categories(self):
+        first = pd.DataFrame({
+            "sport": pd.Series(["Judo", "Rowing"], dtype="category"),
+            "medal_count": [2, 1],
+        })
+        second = pd.DataFrame({
+            "sport": pd.Series(["Curling", "Judo", None], dtype="category"),
+            "medal_count": [4, 3, 5],
+        })
+
+        result = sum_by_keys([first, second], ["sport"])
+
+        assert result["sport"].tolist()[:3] == ["Judo", "Rowing", "Curling"]
+        assert result["sport"].isna().tolist() == [False] * 3 + [True]
+        assert result["medal_count"].tolist() == [5, 1, 4, 5]
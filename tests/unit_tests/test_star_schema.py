@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from pandas.testing import assert_frame_equal
+from src.etl.schema import ARROW_STRING
+from src.etl.transform.star_schema import (
+    STAR_TABLES,
+    WIDE_COLUMNS,
+    build_star_schema,
+    build_wide_view,
+    create_star_schema,
+)
+
+
+@pytest.fixture
+def noc_data():
+    return pd.DataFrame({
+        "NOC": ["USA", "GBR", "FRA"],
+        "region": ["USA", "UK", "France"],
+    })
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        "id": pd.Series([1, 1, 2, 3, 4], dtype="int32"),
+        "name": pd.Series(
+            ["Ann", "Ann", "Bo", "Cy", None], dtype=ARROW_STRING
+        ),
+        "sex": pd.Series(["F", "F", "M", "M", "F"], dtype="category"),
+        "age": pd.Series([21, 25, 30, None, 19], dtype="float32"),
+        "height_cm": pd.Series([170, 171, 180, 175, 160], dtype="float32"),
+        "weight_kg": pd.Series([60, 61, 80, 70, None], dtype="float32"),
+        "team": pd.Series(
+            ["USA", "USA", "UK", "Singapore", "UK"], dtype="category"
+        ),
+        "noc": pd.Series(["USA", "USA", "GBR", "SGP", "GBR"],
+                         dtype="category"),
+        "games": pd.Series(
+            ["1956 Summer", "1960 Summer", "1956 Summer", "1956 Summer",
+             "1994 Winter"],
+            dtype="category",
+        ),
+        "year": pd.Series([1956, 1960, 1956, 1956, 1994], dtype="int16"),
+        "season": pd.Series(
+            ["Summer", "Summer", "Summer", "Summer", "Winter"],
+            dtype="category",
+        ),
+        "city": pd.Series(
+            ["Melbourne", "Roma", "Stockholm", "Melbourne", None],
+            dtype="category",
+        ),
+        "sport": pd.Series(
+            ["Judo", "Judo", "Rowing", "Judo", "Curling"], dtype="category"
+        ),
+        "event": pd.Series(
+            ["Judo A", "Judo A", "Rowing B", "Judo A", "Curling C"],
+            dtype="category",
+        ),
+        "medal": pd.Series(
+            ["Gold", "No Medal", "Bronze", "Silver", "No Medal"],
+            dtype="category",
+        ),
+        "country": pd.Series(
+            ["USA", "USA", "UK", "Singapore", "UK"], dtype="category"
+        ),
+    })
+
+
+class TestBuildStarSchema:
+    def test_wide_view_round_trips(self, data, noc_data):
+        tables = build_star_schema(data, noc_data)
+
+        result = build_wide_view(tables)
+
+        assert list(result.columns) == WIDE_COLUMNS
+        assert_frame_equal(
+            result.astype(object), data.astype(object),
+            check_dtype=False,
+        )
+
+    def test_fact_table_holds_small_integer_keys(self, data, noc_data):
+        fact = build_star_schema(data, noc_data)["fact_results"]
+
+        assert len(fact) == len(data)
+        assert fact["athlete_key"].tolist() == [1, 1, 2, 3, 4]
+        assert fact["medal_code"].tolist() == [1, 0, 3, 2, 0]
+        assert fact["medal_code"].dtype == np.int8
+        for key in ("athlete_key", "games_key", "country_key"):
+            assert fact[key].dtype == np.int16
+        assert (
+            fact.memory_usage(deep=True).sum()
+            < data.memory_usage(deep=True).sum()
+        )
+
+    def test_games_held_in_two_cities_get_two_keys(self, data, noc_data):
+        games = build_star_schema(data, noc_data)["dim_games"]
+
+        assert games["games_key"].tolist() == [1, 2, 3, 4]
+        assert games.loc[games["games"] == "1956 Summer", "city"].tolist() \
+            == ["Melbourne", "Stockholm"]
+
+    def test_country_dimension_lists_every_noc(self, data, noc_data):
+        countries = build_star_schema(data, noc_data)["dim_country"]
+
+        assert countries["noc"].tolist() == ["FRA", "GBR", "SGP", "USA"]
+        assert countries["country"].tolist() == [
+            "France", "UK", "Singapore", "USA"
+        ]
+
+    def test_missing_values_get_key_zero(self, data, noc_data):
+        data["event"] = data["event"].cat.add_categories([]).where(
+            data["id"] != 2
+        )
+
+        tables = build_star_schema(data, noc_data)
+
+        assert tables["fact_results"]["event_key"].tolist() == [2, 2, 0, 2, 1]
+        assert build_wide_view(tables)["event"].isna().tolist() == [
+            False, False, True, False, False
+        ]
+
+
+@patch("src.etl.transform.star_schema.save_dataframe_to_parquet")
+def test_create_star_schema_saves_every_table(mock_save, data, noc_data):
+    tables = create_star_schema(data, noc_data)
+
+    assert len(tables) == len(STAR_TABLES)
+    assert [call.args[2] for call in mock_save.call_args_list] == [
+        f"{name}.parquet" for name in STAR_TABLES
+    ]